@@ -5,6 +5,7 @@ This module provides a comprehensive implementation of B-Trees, including:
 - BTreeNode: Individual node structure for B-Trees
 - BTree: Complete B-Tree implementation with all operations
 - BTreeAnalyzer: Performance analysis and benchmarking tools
+- NumericBTree: Struct-of-arrays B-Tree specialised for integer keys
 - DatabaseIndex: Real-world application using B-Trees
 
 B-Trees are fundamental data structures designed for systems that read and write
@@ -17,8 +18,11 @@ Version: 1.0
 
 from .btree_node import BTreeNode
 from .btree import BTree
+from .numeric_btree import NumericBTree, NumericBTreeNode
 from .analyzer import BTreeAnalyzer, BTreeStats, b_tree_height_analysis
-from .database_index import DatabaseIndex, IndexEntry, MultiValueIndex, TimestampedIndex
+from .database_index import (
+    DatabaseIndex, FrozenDatabaseIndex, IndexEntry, MultiValueIndex, TimestampedIndex
+)
 
 __version__ = "1.0"
 __author__ = "Advanced Python Data Structures Book"
@@ -26,10 +30,13 @@ __author__ = "Advanced Python Data Structures Book"
 __all__ = [
     'BTreeNode',
     'BTree', 
+    'NumericBTree',
+    'NumericBTreeNode',
     'BTreeAnalyzer',
     'BTreeStats',
     'b_tree_height_analysis',
     'DatabaseIndex',
+    'FrozenDatabaseIndex',
     'IndexEntry',
     'MultiValueIndex',
     'TimestampedIndex'
@@ -7,7 +7,8 @@ efficient external storage with guaranteed O(log n) performance.
 """
 
 import sys
-from typing import TypeVar, Generic, Optional, List, Iterator, Callable
+from bisect import bisect_left, bisect_right
+from typing import TypeVar, Generic, Optional, List, Iterator, Callable, Any, Tuple
 from .btree_node import BTreeNode
 
 T = TypeVar('T')
@@ -26,9 +27,14 @@ class BTree(Generic[T]):
     Args:
         min_degree: Minimum degree of the B-Tree (t ≥ 2)
         key_comparator: Optional custom comparator for keys
+        key: Optional function extracting the sort key from stored items;
+            in-node searches then compare extracted keys in C via bisect.
+            If a key_comparator is also given it must order items the same
+            way as their extracted keys.
     """
     
-    def __init__(self, min_degree: int = 3, key_comparator: Optional[Callable[[T, T], int]] = None) -> None:
+    def __init__(self, min_degree: int = 3, key_comparator: Optional[Callable[[T, T], int]] = None,
+                 key: Optional[Callable[[T], Any]] = None) -> None:
         if min_degree < 2:
             raise ValueError("Minimum degree must be at least 2")
         
@@ -42,8 +48,42 @@ class BTree(Generic[T]):
         # Use custom comparator or default to < operator
         if key_comparator:
             self._compare = key_comparator
+        elif key is not None:
+            def _compare_keys(x: T, y: T) -> int:
+                kx, ky = key(x), key(y)
+                return -1 if kx < ky else (1 if kx > ky else 0)
+            self._compare = _compare_keys
         else:
             self._compare = lambda x, y: -1 if x < y else (1 if x > y else 0)
+        
+        # With the natural ordering (or a key function that defines it) node
+        # positions can be found with bisect instead of a Python-level scan
+        self._use_bisect = key_comparator is None or key is not None
+        self._key = key
+    
+    def _lower_bound(self, node: BTreeNode[T], key: T) -> int:
+        """Return the index of the first key in ``node`` not less than ``key``."""
+        if self._use_bisect:
+            if self._key is None:
+                return bisect_left(node.keys, key, 0, node.num_keys)
+            return bisect_left(node.keys, self._key(key), 0, node.num_keys, key=self._key)
+        
+        i = 0
+        while i < node.num_keys and self._compare(key, node.keys[i]) > 0:
+            i += 1
+        return i
+    
+    def _upper_bound(self, node: BTreeNode[T], key: T) -> int:
+        """Return the index of the first key in ``node`` greater than ``key``."""
+        if self._use_bisect:
+            if self._key is None:
+                return bisect_right(node.keys, key, 0, node.num_keys)
+            return bisect_right(node.keys, self._key(key), 0, node.num_keys, key=self._key)
+        
+        i = node.num_keys
+        while i > 0 and self._compare(key, node.keys[i - 1]) < 0:
+            i -= 1
+        return i
     
     def __len__(self) -> int:
         """Return the number of keys in the B-Tree."""
@@ -89,11 +129,8 @@ class BTree(Generic[T]):
     
     def _search_recursive(self, node: BTreeNode[T], key: T) -> Optional[T]:
         """Recursively search for a key in a subtree."""
-        i = 0
-        
         # Find the first key greater than or equal to the search key
-        while i < node.num_keys and self._compare(key, node.keys[i]) > 0:
-            i += 1
+        i = self._lower_bound(node, key)
         
         # If we found the key, return it
         if i < node.num_keys and self._compare(key, node.keys[i]) == 0:
@@ -133,25 +170,130 @@ class BTree(Generic[T]):
             self._insert_non_full(self.root, key)
             self.size += 1
     
+    def upsert(self, key: T, update: Callable[[Optional[T]], T]) -> T:
+        """
+        Insert or update a key with a single root-to-leaf descent.
+        
+        ``update`` receives the stored key that compares equal to ``key``
+        (or None if there is none) and returns the item to store. The
+        returned item must compare equal to ``key``, so updating in place
+        never changes the tree's ordering. Full nodes are split on the way
+        down, exactly as in insert.
+        
+        Args:
+            key: The key to look up
+            update: Function producing the item to store
+            
+        Returns:
+            The stored item
+        """
+        if self.root is None:
+            item = update(None)
+            self.insert(item)
+            return item
+        
+        if self.root.num_keys == self.max_keys:
+            old_root = self.root
+            self.root = self._create_node(is_leaf=False)
+            self.root.children[0] = old_root
+            self._split_child(self.root, 0, old_root)
+            self.height += 1
+        
+        node = self.root
+        while True:
+            i = self._lower_bound(node, key)
+            if i < node.num_keys and self._compare(key, node.keys[i]) == 0:
+                node.keys[i] = update(node.keys[i])
+                return node.keys[i]
+            
+            if node.is_leaf:
+                item = update(None)
+                for j in range(node.num_keys, i, -1):
+                    node.keys[j] = node.keys[j - 1]
+                node.keys[i] = item
+                node.num_keys += 1
+                self.size += 1
+                return item
+            
+            child = node.children[i]
+            if child.num_keys == self.max_keys:
+                # Re-examine this node: the promoted key may be the match
+                self._split_child(node, i, child)
+                continue
+            node = child
+    
+    def bulk_load(self, sorted_keys: List[T]) -> None:
+        """
+        Build the B-Tree bottom-up from keys that are already sorted.
+        
+        This avoids a root-to-leaf descent and the node splits of one
+        insert per key, producing a tree of minimal height in O(n).
+        
+        Args:
+            sorted_keys: Keys in ascending order
+            
+        Raises:
+            ValueError: If the tree is not empty
+        """
+        if self.root is not None:
+            raise ValueError("bulk_load requires an empty B-Tree")
+        
+        n = len(sorted_keys)
+        if n == 0:
+            return
+        
+        # Smallest height whose full tree can hold every key
+        height = 1
+        while (2 * self.min_degree) ** height - 1 < n:
+            height += 1
+        
+        self.root = self._build_subtree(sorted_keys, 0, n, height, is_root=True)
+        self.size = n
+        self.height = height
+    
+    def _build_subtree(self, keys: List[T], lo: int, hi: int, height: int,
+                       is_root: bool = False) -> BTreeNode[T]:
+        """Build a subtree of exactly ``height`` levels holding keys[lo:hi]."""
+        count = hi - lo
+        if height == 1:
+            node = self._create_node(is_leaf=True)
+            node.keys[:count] = keys[lo:hi]
+            node.num_keys = count
+            return node
+        
+        # Use as few children as will fit, but keep non-root nodes at least
+        # half full; the remaining keys are spread evenly across children
+        child_capacity = (2 * self.min_degree) ** (height - 1)
+        num_children = max(2 if is_root else self.min_degree,
+                           -(-(count + 1) // child_capacity))
+        remaining = count - (num_children - 1)
+        base, extra = divmod(remaining, num_children)
+        
+        node = self._create_node(is_leaf=False)
+        start = lo
+        for i in range(num_children):
+            end = start + base + (1 if i < extra else 0)
+            node.children[i] = self._build_subtree(keys, start, end, height - 1)
+            if i < num_children - 1:
+                node.keys[i] = keys[end]
+                start = end + 1
+        node.num_keys = num_children - 1
+        return node
+    
     def _insert_non_full(self, node: BTreeNode[T], key: T) -> None:
         """Insert a key into a non-full node."""
-        i = node.num_keys - 1
+        # Equal keys are inserted after existing ones
+        i = self._upper_bound(node, key)
         
         if node.is_leaf:
-            # Find the position to insert the key
-            while i >= 0 and self._compare(key, node.keys[i]) < 0:
-                node.keys[i + 1] = node.keys[i]
-                i -= 1
+            # Shift larger keys right to make room
+            for j in range(node.num_keys, i, -1):
+                node.keys[j] = node.keys[j - 1]
             
             # Insert the key
-            node.keys[i + 1] = key
+            node.keys[i] = key
             node.num_keys += 1
         else:
-            # Find the child to insert into
-            while i >= 0 and self._compare(key, node.keys[i]) < 0:
-                i -= 1
-            i += 1
-            
             # If the child is full, split it
             if node.children[i].num_keys == self.max_keys:
                 self._split_child(node, i, node.children[i])
@@ -228,11 +370,8 @@ class BTree(Generic[T]):
     
     def _delete_recursive(self, node: BTreeNode[T], key: T) -> bool:
         """Recursively delete a key from a subtree."""
-        i = 0
-        
         # Find the key or the child to search in
-        while i < node.num_keys and self._compare(key, node.keys[i]) > 0:
-            i += 1
+        i = self._lower_bound(node, key)
         
         if node.is_leaf:
             # Key is in this leaf node
@@ -274,26 +413,12 @@ class BTree(Generic[T]):
     
     def _delete_from_child(self, node: BTreeNode[T], key: T, child_index: int) -> bool:
         """Delete a key from a child node."""
-        child = node.children[child_index]
-        
-        if child.num_keys == self.min_keys:
-            # Ensure the child has enough keys
-            self._ensure_child_has_keys(node, child_index)
-            
-            # Update child index if it changed
-            if child_index > 0 and child_index < node.num_keys:
-                if self._compare(key, node.keys[child_index - 1]) <= 0:
-                    child = node.children[child_index - 1]
-                elif self._compare(key, node.keys[child_index]) > 0:
-                    child = node.children[child_index + 1]
-            elif child_index == 0:
-                if self._compare(key, node.keys[0]) > 0:
-                    child = node.children[1]
-            else:
-                if self._compare(key, node.keys[child_index - 1]) <= 0:
-                    child = node.children[child_index - 1]
+        if node.children[child_index].num_keys == self.min_keys:
+            # Ensure the child has enough keys; a merge with the left
+            # sibling moves the subtree one slot to the left
+            child_index = self._ensure_child_has_keys(node, child_index)
         
-        return self._delete_recursive(child, key)
+        return self._delete_recursive(node.children[child_index], key)
     
     def _get_predecessor(self, node: BTreeNode[T]) -> T:
         """Get the predecessor of a key (rightmost key in left subtree)."""
@@ -307,8 +432,13 @@ class BTree(Generic[T]):
             node = node.children[0]
         return node.keys[0]
     
-    def _ensure_child_has_keys(self, parent: BTreeNode[T], child_index: int) -> None:
-        """Ensure a child has enough keys by borrowing from siblings or merging."""
+    def _ensure_child_has_keys(self, parent: BTreeNode[T], child_index: int) -> int:
+        """
+        Ensure a child has enough keys by borrowing from siblings or merging.
+        
+        Returns:
+            The index of the child that now covers the original child's keys
+        """
         child = parent.children[child_index]
         left_sibling = parent.children[child_index - 1] if child_index > 0 else None
         right_sibling = parent.children[child_index + 1] if child_index < parent.num_keys else None
@@ -322,9 +452,12 @@ class BTree(Generic[T]):
         # Merge with left sibling
         elif left_sibling:
             self._merge_children(parent, child_index - 1)
+            return child_index - 1
         # Merge with right sibling
         elif right_sibling:
             self._merge_children(parent, child_index)
+        
+        return child_index
     
     def _borrow_from_left_sibling(self, parent: BTreeNode[T], child_index: int, 
                                  left_sibling: BTreeNode[T], child: BTreeNode[T]) -> None:
@@ -382,23 +515,25 @@ class BTree(Generic[T]):
         left_child.num_keys += 1
         
         # Move all keys and children from right child to left child
+        offset = left_child.num_keys
         for i in range(right_child.num_keys):
-            left_child.keys[left_child.num_keys] = right_child.keys[i]
-            left_child.children[left_child.num_keys + 1] = right_child.children[i]
-            left_child.num_keys += 1
+            left_child.keys[offset + i] = right_child.keys[i]
+        if not left_child.is_leaf:
+            for i in range(right_child.num_keys + 1):
+                left_child.children[offset + i] = right_child.children[i]
+        left_child.num_keys += right_child.num_keys
         
-        # Move the keys from parent to left child
+        # Close the gap left by the separator key in the parent
         for i in range(key_index, parent.num_keys - 1):
             parent.keys[i] = parent.keys[i + 1]
         
-        # Move the children from parent to left child
+        # Close the gap left by the right child in the parent
         for i in range(key_index + 1, parent.num_keys):
             parent.children[i] = parent.children[i + 1]
         
+        # Clear the now unused last child slot
+        parent.children[parent.num_keys] = None
         parent.num_keys -= 1
-        
-        # Remove the right child
-        parent.children[key_index + 1] = None
     
     def range_query(self, start_key: T, end_key: T) -> List[T]:
         """
@@ -421,17 +556,14 @@ class BTree(Generic[T]):
         Recursively find keys in the range [start_key, end_key].
         Returns True if should continue searching (haven't exceeded end_key).
         """
-        i = 0
-        
         # Find the first key >= start_key
-        while i < node.num_keys and self._compare(start_key, node.keys[i]) > 0:
-            i += 1
+        i = self._lower_bound(node, start_key)
         
         if node.is_leaf:
             while i < node.num_keys and self._compare(node.keys[i], end_key) <= 0:
                 result.append(node.keys[i])
                 i += 1
-            return i < node.num_keys  # Continue if more keys to check
+            return i == node.num_keys  # Continue unless a key passed end_key
         else:
             # Search in children with early termination
             while i < node.num_keys:
@@ -448,6 +580,98 @@ class BTree(Generic[T]):
             
             return self._range_query_recursive(node.children[i], start_key, end_key, result)
     
+    def range_query_keys(self, start_key: Any, end_key: Any,
+                         key_fn: Optional[Callable[[T], Any]] = None) -> List[T]:
+        """
+        Find all stored items whose key lies in [start_key, end_key].
+        
+        Unlike range_query, the bounds are raw keys rather than stored
+        items, so callers need not build sentinel items just to query.
+        
+        Args:
+            start_key: Start of the key range (inclusive)
+            end_key: End of the key range (inclusive)
+            key_fn: Extracts an item's key (defaults to the tree's key
+                function, or the item itself)
+            
+        Returns:
+            List of stored items in the range
+        """
+        if key_fn is None:
+            key_fn = self._key
+        result: List[T] = []
+        if self.root is not None:
+            self._range_query_keys_recursive(self.root, start_key, end_key, key_fn, result)
+        return result
+    
+    def range_query_keys_iter(self, start_key: Any, end_key: Any,
+                              key_fn: Optional[Callable[[T], Any]] = None) -> Iterator[T]:
+        """
+        Lazily yield stored items whose key lies in [start_key, end_key].
+        
+        Walks the tree with an explicit stack, so no result list is built
+        and a caller that stops early never visits the rest of the range.
+        
+        Args:
+            start_key: Start of the key range (inclusive)
+            end_key: End of the key range (inclusive)
+            key_fn: Extracts an item's key (defaults to the tree's key
+                function, or the item itself)
+            
+        Yields:
+            Stored items in key order
+        """
+        if key_fn is None:
+            key_fn = self._key
+        
+        # Each frame is (node, i): emit node.keys[i] next, after the
+        # subtree at children[i] when node is internal
+        stack: List[Tuple[BTreeNode[T], int]] = []
+        node = self.root
+        while node is not None:
+            i = bisect_left(node.keys, start_key, 0, node.num_keys, key=key_fn)
+            stack.append((node, i))
+            node = None if node.is_leaf else node.children[i]
+        
+        while stack:
+            node, i = stack.pop()
+            if node.is_leaf:
+                for j in range(i, node.num_keys):
+                    item = node.keys[j]
+                    if end_key < (item if key_fn is None else key_fn(item)):
+                        return
+                    yield item
+                continue
+            
+            if i < node.num_keys:
+                item = node.keys[i]
+                if end_key < (item if key_fn is None else key_fn(item)):
+                    return
+                yield item
+                stack.append((node, i + 1))
+                child = node.children[i + 1]
+                while child is not None:
+                    stack.append((child, 0))
+                    child = None if child.is_leaf else child.children[0]
+    
+    def _range_query_keys_recursive(self, node: BTreeNode[T], start_key: Any, end_key: Any,
+                                    key_fn: Optional[Callable[[T], Any]], result: List[T]) -> bool:
+        """Collect items in range; returns False once a key passes end_key."""
+        i = bisect_left(node.keys, start_key, 0, node.num_keys, key=key_fn)
+        stop = bisect_right(node.keys, end_key, i, node.num_keys, key=key_fn)
+        
+        if node.is_leaf:
+            result.extend(node.keys[i:stop])
+            return stop == node.num_keys
+        
+        for j in range(i, stop):
+            if not self._range_query_keys_recursive(node.children[j], start_key, end_key, key_fn, result):
+                return False
+            result.append(node.keys[j])
+        
+        more = self._range_query_keys_recursive(node.children[stop], start_key, end_key, key_fn, result)
+        return more and stop == node.num_keys
+    
     def inorder_traversal(self) -> Iterator[T]:
         """Perform an inorder traversal of the B-Tree."""
         if self.root is not None:
@@ -464,6 +688,22 @@ class BTree(Generic[T]):
                 yield node.keys[i]
             yield from self._inorder_recursive(node.children[node.num_keys])
     
+    def inorder_traversal_reverse(self) -> Iterator[T]:
+        """Perform a reverse inorder traversal (largest key first)."""
+        if self.root is not None:
+            yield from self._reverse_inorder_recursive(self.root)
+    
+    def _reverse_inorder_recursive(self, node: BTreeNode[T]) -> Iterator[T]:
+        """Recursively perform reverse inorder traversal."""
+        if node.is_leaf:
+            for i in range(node.num_keys - 1, -1, -1):
+                yield node.keys[i]
+        else:
+            yield from self._reverse_inorder_recursive(node.children[node.num_keys])
+            for i in range(node.num_keys - 1, -1, -1):
+                yield node.keys[i]
+                yield from self._reverse_inorder_recursive(node.children[i])
+    
     def get_height(self) -> int:
         """Get the height of the B-Tree."""
         return self.height
@@ -5,24 +5,53 @@ This module demonstrates how B-Trees are used in real database systems
 to provide efficient key-based lookups and range queries.
 """
 
-from typing import TypeVar, Generic, Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import TypeVar, Generic, Optional, List, Dict, Any, Tuple, Iterable, Iterator, Sequence, Callable
+import heapq
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter, itemgetter
 from .btree import BTree
+from .numeric_btree import NumericBTree
 
 K = TypeVar('K')
 V = TypeVar('V')
 
-@dataclass
 class IndexEntry(Generic[K, V]):
-    """An entry in a database index."""
-    key: K
-    value: V
-    timestamp: float
+    """An entry in a database index, ordered and compared by key only."""
+    __slots__ = ('key', 'value', 'timestamp')
+    
+    def __init__(self, key: K, value: V, timestamp: float) -> None:
+        self.key = key
+        self.value = value
+        self.timestamp = timestamp
     
     def __lt__(self, other: 'IndexEntry[K, V]') -> bool:
         """Compare entries by key."""
         return self.key < other.key
+    
+    def __eq__(self, other: object) -> bool:
+        """Entries are equal when their keys are equal."""
+        if not isinstance(other, IndexEntry):
+            return NotImplemented
+        return self.key == other.key
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+    
+    def __repr__(self) -> str:
+        return f"IndexEntry(key={self.key!r}, value={self.value!r}, timestamp={self.timestamp!r})"
+
+
+_pair_key = itemgetter(0)
+
+
+def _compare_entries(a: IndexEntry, b: IndexEntry) -> int:
+    """Three-way comparison of index entries by key."""
+    key_a, key_b = a.key, b.key
+    return -1 if key_a < key_b else (1 if key_a > key_b else 0)
+
 
 class DatabaseIndex(Generic[K, V]):
     """
@@ -33,31 +62,189 @@ class DatabaseIndex(Generic[K, V]):
     
     Args:
         min_degree: Minimum degree of the underlying B-Tree
+        record_timestamps: Stamp entries with the wall-clock time when the
+            caller does not supply a timestamp (off by default, since plain
+            lookups never read it)
+        numeric_keys: Store 64-bit integer keys in a NumericBTree, whose
+            nodes keep keys, values and timestamps in parallel arrays
+            instead of one IndexEntry object per entry
+        key_type: Optional type every key must have; inserts of any other
+            type raise TypeError before the tree is touched, keeping the
+            index homogeneous so raw key comparisons are always valid
     """
     
-    def __init__(self, min_degree: int = 3) -> None:
-        self.btree = BTree[IndexEntry[K, V]](min_degree=min_degree)
-        self.size = 0
+    # Bound once so hot insert paths skip the module and attribute lookups
+    _now = staticmethod(time.time)
+    
+    def __init__(self, min_degree: int = 3, record_timestamps: bool = False,
+                 numeric_keys: bool = False, key_type: Optional[type] = None) -> None:
+        self.numeric_keys = numeric_keys
+        self.key_type = key_type
+        if numeric_keys:
+            self.btree = NumericBTree(min_degree=min_degree)
+        else:
+            # Bisect on raw keys inside nodes; the direct comparator avoids
+            # two key-function calls per remaining three-way comparison
+            self.btree = BTree[IndexEntry[K, V]](
+                min_degree=min_degree, key_comparator=_compare_entries, key=attrgetter('key')
+            )
+        self.record_timestamps = record_timestamps
+        # Mutation counter used to invalidate the cached statistics
+        self._gen = 0
+        self._stats_cache: Tuple[Optional[Dict[str, Any]], int] = (None, -1)
+    
+    @staticmethod
+    def _probe(key: K) -> IndexEntry[K, V]:
+        """Build a lookup entry that compares equal to any entry with ``key``."""
+        return IndexEntry(key=key, value=None, timestamp=0.0)
+    
+    def _check_key(self, key: K) -> None:
+        """Reject keys that do not match the declared key_type."""
+        if not isinstance(key, self.key_type):
+            raise TypeError(
+                f"Key {key!r} is not of type {self.key_type.__name__}"
+            )
     
     def __len__(self) -> int:
         """Return the number of entries in the index."""
-        return self.size
+        return len(self.btree)
     
     def is_empty(self) -> bool:
         """Check if the index is empty."""
-        return self.size == 0
+        return len(self.btree) == 0
     
-    def insert(self, key: K, value: V) -> None:
+    def insert(self, key: K, value: V, timestamp: Optional[float] = None) -> None:
         """
         Insert a key-value pair into the index.
         
         Args:
             key: The key to insert
             value: The value associated with the key
+            timestamp: Entry timestamp (defaults to the current time when
+                record_timestamps is enabled, otherwise 0.0)
+        """
+        if self.key_type is not None:
+            self._check_key(key)
+        if timestamp is None:
+            timestamp = self._now() if self.record_timestamps else 0.0
+        if self.numeric_keys:
+            self.btree.insert(key, value, timestamp)
+        else:
+            self.btree.insert(IndexEntry(key=key, value=value, timestamp=timestamp))
+        self._gen += 1
+    
+    def upsert(self, key: K, value_fn: Callable[[Optional[V]], V]) -> V:
+        """
+        Insert or update the value for a key in a single tree descent.
+        
+        Args:
+            key: The key to insert or update
+            value_fn: Receives the current value (None if the key is
+                missing) and returns the value to store
+            
+        Returns:
+            The stored value
+        """
+        if self.key_type is not None:
+            self._check_key(key)
+        timestamp = self._now() if self.record_timestamps else 0.0
+        self._gen += 1
+        
+        if self.numeric_keys:
+            return self.btree.upsert(key, value_fn, timestamp)
+        
+        def update(entry: Optional[IndexEntry[K, V]]) -> IndexEntry[K, V]:
+            if entry is None:
+                return IndexEntry(key=key, value=value_fn(None), timestamp=timestamp)
+            entry.value = value_fn(entry.value)
+            return entry
+        
+        return self.btree.upsert(self._probe(key), update).value
+    
+    def bulk_insert(self, items: Iterable[Tuple[K, V]]) -> None:
         """
-        entry = IndexEntry(key=key, value=value, timestamp=time.time())
-        self.btree.insert(entry)
-        self.size += 1
+        Insert many key-value pairs at once.
+        
+        When the index is empty the pairs are sorted by key and the B-Tree
+        is built bottom-up in a single pass; otherwise they are inserted
+        one at a time.
+        
+        Args:
+            items: Iterable of (key, value) pairs
+        """
+        if not self.is_empty():
+            for key, value in items:
+                self.insert(key, value)
+            return
+        
+        items = list(items)
+        if self.key_type is not None:
+            for key, _ in items:
+                self._check_key(key)
+        
+        self._load_sorted(sorted(items, key=_pair_key))
+    
+    def parallel_bulk_insert(self, items: Iterable[Tuple[K, V]],
+                             n_shards: Optional[int] = None) -> None:
+        """
+        Bulk insert with the sorting work spread across worker threads.
+        
+        Pairs are partitioned by ``hash(key) % n_shards``, each shard is
+        sorted in its own thread, and the sorted shards are merged straight
+        into a bottom-up build. Equal keys always land in the same shard,
+        so shards never overlap. On a free-threaded interpreter the shard
+        sorts run in parallel; with the GIL the result is identical to
+        bulk_insert.
+        
+        Args:
+            items: Iterable of (key, value) pairs
+            n_shards: Number of shards and worker threads (defaults to the
+                CPU count)
+        """
+        if not self.is_empty():
+            self.bulk_insert(items)
+            return
+        
+        n_shards = n_shards or os.cpu_count() or 1
+        shards: List[List[Tuple[K, V]]] = [[] for _ in range(n_shards)]
+        for pair in items:
+            shards[hash(pair[0]) % n_shards].append(pair)
+        if self.key_type is not None:
+            for shard in shards:
+                for key, _ in shard:
+                    self._check_key(key)
+        
+        with ThreadPoolExecutor(max_workers=n_shards) as executor:
+            sorted_shards = list(executor.map(lambda shard: sorted(shard, key=_pair_key), shards))
+        self._load_sorted(list(heapq.merge(*sorted_shards, key=_pair_key)))
+    
+    def _load_sorted(self, pairs: List[Tuple[K, V]]) -> None:
+        """Build the (empty) B-Tree from (key, value) pairs sorted by key."""
+        timestamp = self._now() if self.record_timestamps else 0.0
+        if self.numeric_keys:
+            self.btree.bulk_load([key for key, _ in pairs], [value for _, value in pairs],
+                                 [timestamp] * len(pairs))
+        else:
+            self.btree.bulk_load([IndexEntry(key, value, timestamp) for key, value in pairs])
+        self._gen += 1
+    
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[K, V]], min_degree: int = 3,
+                   numeric_keys: bool = False) -> 'DatabaseIndex[K, V]':
+        """
+        Build an index from (key, value) pairs using a bottom-up bulk load.
+        
+        Args:
+            items: Iterable of (key, value) pairs
+            min_degree: Minimum degree of the underlying B-Tree
+            numeric_keys: Use the array-backed tree for integer keys
+            
+        Returns:
+            A new DatabaseIndex containing the pairs
+        """
+        index = cls(min_degree=min_degree, numeric_keys=numeric_keys)
+        index.bulk_insert(items)
+        return index
     
     def get(self, key: K) -> Optional[V]:
         """
@@ -69,11 +256,10 @@ class DatabaseIndex(Generic[K, V]):
         Returns:
             The value associated with the key, or None if not found
         """
-        # Find the entry with the same key
-        for entry in self.btree.inorder_traversal():
-            if entry.key == key:
-                return entry.value
-        return None
+        if self.numeric_keys:
+            return self.btree.get(key)
+        entry = self.btree.search(self._probe(key))
+        return entry.value if entry is not None else None
     
     def delete(self, key: K) -> bool:
         """
@@ -85,12 +271,10 @@ class DatabaseIndex(Generic[K, V]):
         Returns:
             True if the key was deleted, False if it wasn't found
         """
-        # Find and delete the entry with the given key
-        for entry in self.btree.inorder_traversal():
-            if entry.key == key:
-                self.btree.delete(entry)
-                self.size -= 1
-                return True
+        probe = key if self.numeric_keys else self._probe(key)
+        if self.btree.delete(probe):
+            self._gen += 1
+            return True
         return False
     
     def range_query(self, start_key: K, end_key: K) -> List[Tuple[K, V]]:
@@ -104,24 +288,93 @@ class DatabaseIndex(Generic[K, V]):
         Returns:
             List of (key, value) tuples in the range
         """
-        start_entry = IndexEntry(key=start_key, value=None, timestamp=0)
-        end_entry = IndexEntry(key=end_key, value=None, timestamp=0)
+        if self.numeric_keys:
+            return self.btree.range_query(start_key, end_key)
         
-        entries = self.btree.range_query(start_entry, end_entry)
+        entries = self.btree.range_query_keys(start_key, end_key)
         return [(entry.key, entry.value) for entry in entries]
     
+    def range_query_iter(self, start_key: K, end_key: K) -> Iterator[Tuple[K, V]]:
+        """
+        Lazily yield key-value pairs in the range [start_key, end_key].
+        
+        Unlike range_query, no list of results is materialized, so large
+        ranges stream in constant extra memory and early exits are cheap.
+        
+        Args:
+            start_key: Start of the range (inclusive)
+            end_key: End of the range (inclusive)
+            
+        Yields:
+            (key, value) tuples in key order
+        """
+        if self.numeric_keys:
+            return self.btree.range_query_iter(start_key, end_key)
+        return ((entry.key, entry.value)
+                for entry in self.btree.range_query_keys_iter(start_key, end_key))
+    
+    def range_query_arrays(self, start_key: K, end_key: K) -> Tuple[Sequence[K], List[V]]:
+        """
+        Find all entries in the range [start_key, end_key] as parallel columns.
+        
+        This avoids building one (key, value) tuple per result, which suits
+        callers that aggregate or post-process whole columns. With
+        numeric_keys the keys come back packed in an ``array('q')``.
+        
+        Args:
+            start_key: Start of the range (inclusive)
+            end_key: End of the range (inclusive)
+            
+        Returns:
+            (keys, values) in key order
+        """
+        if self.numeric_keys:
+            return self.btree.range_query_arrays(start_key, end_key)
+        
+        entries = self.btree.range_query_keys(start_key, end_key)
+        return [entry.key for entry in entries], [entry.value for entry in entries]
+    
+    def _pairs(self) -> Iterator[Tuple[K, V]]:
+        """Yield (key, value) pairs in key order from either tree type."""
+        if self.numeric_keys:
+            return self.btree.items()
+        return ((entry.key, entry.value) for entry in self.btree.inorder_traversal())
+    
+    def _pairs_reverse(self) -> Iterator[Tuple[K, V]]:
+        """Yield (key, value) pairs in descending key order."""
+        if self.numeric_keys:
+            return self.btree.items_reverse()
+        return ((entry.key, entry.value) for entry in self.btree.inorder_traversal_reverse())
+    
     def get_all(self) -> List[Tuple[K, V]]:
         """Get all key-value pairs in the index."""
-        return [(entry.key, entry.value) for entry in self.btree.inorder_traversal()]
+        return list(self._pairs())
+    
+    def freeze(self) -> 'FrozenDatabaseIndex[K, V]':
+        """
+        Take a read-only snapshot of the index in a cache-oblivious layout.
+        
+        Returns:
+            A FrozenDatabaseIndex holding the current key-value pairs
+        """
+        return FrozenDatabaseIndex(self.get_all())
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about the index."""
+        """
+        Get statistics about the index.
+        
+        The tree analysis is cached until the next insert, delete or clear.
+        """
+        stats, gen = self._stats_cache
+        if gen == self._gen:
+            return dict(stats)
+        
         from .analyzer import BTreeAnalyzer
         
         btree_stats = BTreeAnalyzer.analyze_btree(self.btree)
         
-        return {
-            'size': self.size,
+        stats = {
+            'size': len(self.btree),
             'height': btree_stats.height,
             'min_degree': btree_stats.min_degree,
             'memory_usage': btree_stats.memory_usage,
@@ -129,29 +382,226 @@ class DatabaseIndex(Generic[K, V]):
             'storage_efficiency': btree_stats.storage_efficiency,
             'theoretical_height': btree_stats.theoretical_height
         }
+        self._stats_cache = (stats, self._gen)
+        return dict(stats)
     
     def clear(self) -> None:
         """Remove all entries from the index."""
         self.btree.clear()
-        self.size = 0
+        self._gen += 1
     
     def __contains__(self, key: K) -> bool:
         """Check if a key exists in the index."""
-        return self.get(key) is not None
+        if self.numeric_keys:
+            return key in self.btree
+        return self.btree.search(self._probe(key)) is not None
+    
+    def _edge_items(self, head: int, tail: int) -> Tuple[List[Tuple[K, V]], Optional[List[Tuple[K, V]]]]:
+        """
+        Fetch the items at both ends of the index without walking all of it.
+        
+        Returns:
+            (all items, None) if there are at most head + tail items,
+            otherwise (first ``head`` items, last ``tail`` items)
+        """
+        first = list(islice(self._pairs(), head + tail + 1))
+        if len(first) <= head + tail:
+            return first, None
+        
+        last = list(islice(self._pairs_reverse(), tail))
+        last.reverse()
+        return first[:head], last
     
     def __repr__(self) -> str:
         if self.is_empty():
             return "DatabaseIndex()"
         
-        items = self.get_all()
-        if len(items) <= 5:
-            return f"DatabaseIndex({dict(items)})"
+        first, last = self._edge_items(3, 2)
+        if last is None:
+            return f"DatabaseIndex({dict(first)})"
         else:
-            return f"DatabaseIndex({dict(items[:3])}...{dict(items[-2:])})"
+            return f"DatabaseIndex({dict(first)}...{dict(last)})"
     
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Tuple[K, V]]:
         """Iterate over all key-value pairs in the index."""
-        return iter(self.get_all())
+        return self._pairs()
+    
+    def keys(self) -> Iterator[K]:
+        """Lazily iterate over the keys in order."""
+        for key, _ in self._pairs():
+            yield key
+    
+    def values(self) -> Iterator[V]:
+        """Lazily iterate over the values in key order."""
+        for _, value in self._pairs():
+            yield value
+    
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Lazily iterate over the key-value pairs in key order."""
+        return iter(self)
+
+class FrozenDatabaseIndex(Generic[K, V]):
+    """
+    A static, read-only index stored in van Emde Boas (vEB) order.
+    
+    The sorted keys form an implicit perfect binary search tree that is laid
+    out recursively: the top half of the tree is stored first, followed by
+    each bottom subtree. A root-to-leaf search therefore touches
+    O(log_B n) memory blocks for every block size B at once, without
+    knowing B. Keys and values live in parallel lists so searches only
+    touch the key list.
+    
+    Args:
+        items: (key, value) pairs sorted by key
+    """
+    
+    def __init__(self, items: List[Tuple[K, V]]) -> None:
+        n = len(items)
+        height = n.bit_length()
+        self._size = n
+        self._height = height
+        
+        # Slot order: BFS numbers of the perfect tree in vEB order
+        order: List[int] = []
+        self._layout(1, height, order)
+        
+        # Per-depth constants for computing child positions: the top tree
+        # size, bottom tree size and top tree root depth of the recursive
+        # split in which that depth starts a bottom tree
+        self._top_size = [0] * height
+        self._bottom_size = [0] * height
+        self._top_depth = [0] * height
+        self._split_depths(0, height)
+        
+        # Padding slots beyond n repeat the last pair so that searches need
+        # no sentinel checks
+        self.keys: List[K] = [None] * len(order)
+        self.values: List[V] = [None] * len(order)
+        self._rank_to_pos = [0] * len(order)
+        for pos, bfs in enumerate(order):
+            rank = self._rank(bfs, bfs.bit_length() - 1)
+            key, value = items[min(rank, n - 1)]
+            self.keys[pos] = key
+            self.values[pos] = value
+            self._rank_to_pos[rank] = pos
+    
+    def _layout(self, root: int, height: int, order: List[int]) -> None:
+        """Append the BFS numbers of a subtree to ``order`` in vEB order."""
+        if height == 0:
+            return
+        if height == 1:
+            order.append(root)
+            return
+        top_height = height // 2
+        bottom_height = height - top_height
+        self._layout(root, top_height, order)
+        first_bottom_root = root << top_height
+        for j in range(1 << top_height):
+            self._layout(first_bottom_root + j, bottom_height, order)
+    
+    def _split_depths(self, start: int, height: int) -> None:
+        """Record the vEB split constants for depths in [start, start + height)."""
+        if height <= 1:
+            return
+        top_height = height // 2
+        boundary = start + top_height
+        self._top_size[boundary] = (1 << top_height) - 1
+        self._bottom_size[boundary] = (1 << (height - top_height)) - 1
+        self._top_depth[boundary] = start
+        self._split_depths(start, top_height)
+        self._split_depths(boundary, height - top_height)
+    
+    def _rank(self, bfs: int, depth: int) -> int:
+        """Return the in-order rank of the node with BFS number ``bfs``."""
+        return ((2 * (bfs - (1 << depth)) + 1) << (self._height - 1 - depth)) - 1
+    
+    def __len__(self) -> int:
+        """Return the number of entries in the index."""
+        return self._size
+    
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get the value associated with a key.
+        
+        Args:
+            key: The key to look up
+            
+        Returns:
+            The value associated with the key, or None if not found
+        """
+        keys = self.keys
+        positions = [0] * (self._height + 1)
+        bfs = 1
+        for depth in range(self._height):
+            if depth:
+                top = self._top_size[depth]
+                positions[depth] = (positions[self._top_depth[depth]] + top
+                                    + (bfs & top) * self._bottom_size[depth])
+            node_key = keys[positions[depth]]
+            if node_key == key:
+                return self.values[positions[depth]]
+            bfs = 2 * bfs + (1 if node_key < key else 0)
+        return None
+    
+    def _lower_bound(self, key: K) -> int:
+        """Return the rank of the first key that is not less than ``key``."""
+        keys = self.keys
+        positions = [0] * (self._height + 1)
+        bfs = 1
+        best = self._size
+        for depth in range(self._height):
+            if depth:
+                top = self._top_size[depth]
+                positions[depth] = (positions[self._top_depth[depth]] + top
+                                    + (bfs & top) * self._bottom_size[depth])
+            if keys[positions[depth]] < key:
+                bfs = 2 * bfs + 1
+            else:
+                best = min(best, self._rank(bfs, depth))
+                bfs = 2 * bfs
+        return best
+    
+    def range_query(self, start_key: K, end_key: K) -> List[Tuple[K, V]]:
+        """
+        Find all key-value pairs in the range [start_key, end_key].
+        
+        Args:
+            start_key: Start of the range (inclusive)
+            end_key: End of the range (inclusive)
+            
+        Returns:
+            List of (key, value) tuples in the range
+        """
+        result = []
+        rank = self._lower_bound(start_key)
+        while rank < self._size:
+            pos = self._rank_to_pos[rank]
+            if end_key < self.keys[pos]:
+                break
+            result.append((self.keys[pos], self.values[pos]))
+            rank += 1
+        return result
+    
+    def get_all(self) -> List[Tuple[K, V]]:
+        """Get all key-value pairs in key order."""
+        return [(self.keys[pos], self.values[pos])
+                for pos in self._rank_to_pos[:self._size]]
+    
+    def __contains__(self, key: K) -> bool:
+        """Check if a key exists in the index."""
+        rank = self._lower_bound(key)
+        return rank < self._size and self.keys[self._rank_to_pos[rank]] == key
+    
+    def __iter__(self) -> Iterator[Tuple[K, V]]:
+        """Iterate over all key-value pairs in key order."""
+        for pos in self._rank_to_pos[:self._size]:
+            yield (self.keys[pos], self.values[pos])
+    
+    def __repr__(self) -> str:
+        return f"FrozenDatabaseIndex(size={self._size}, height={self._height})"
+
+_MISSING = object()
+
 
 class MultiValueIndex(Generic[K, V]):
     """
@@ -159,17 +609,35 @@ class MultiValueIndex(Generic[K, V]):
     
     This is useful for cases where a key can have multiple associated values,
     such as in a many-to-many relationship.
+    
+    Args:
+        min_degree: Minimum degree of the underlying B-Tree
+        value_container: ``list`` (default) keeps every inserted value,
+            duplicates included, with O(k) deletes of a specific value.
+            ``dict`` stores each key's values as an insertion-ordered set:
+            values must be hashable, re-inserting a present value is a
+            no-op, and deleting a specific value is O(1).
     """
     
-    def __init__(self, min_degree: int = 3) -> None:
+    def __init__(self, min_degree: int = 3, value_container: type = list) -> None:
+        if value_container not in (list, dict):
+            raise ValueError("value_container must be list or dict")
+        
         self.index = DatabaseIndex[K, List[V]](min_degree=min_degree)
+        self._ordered_set = value_container is dict
+        self._total = 0
     
     def __len__(self) -> int:
         """Return the total number of values across all keys."""
-        total = 0
-        for key, values in self.index.get_all():
-            total += len(values)
-        return total
+        return self._total
+    
+    def _count_values(self) -> int:
+        """Count values with one pass over the tree, without the cached total."""
+        return sum(len(entry.value) for entry in self.index.btree.inorder_traversal())
+    
+    def _as_list(self, values: Any) -> List[V]:
+        """Present a stored value container as a list."""
+        return list(values) if self._ordered_set else values
     
     def insert(self, key: K, value: V) -> None:
         """
@@ -179,12 +647,25 @@ class MultiValueIndex(Generic[K, V]):
             key: The key
             value: The value to associate with the key
         """
-        existing_values = self.index.get(key)
-        if existing_values is None:
-            existing_values = []
+        added = True
+        
+        def add(existing_values: Any) -> Any:
+            nonlocal added
+            if existing_values is None:
+                return {value: None} if self._ordered_set else [value]
+            if self._ordered_set:
+                if value in existing_values:
+                    added = False
+                else:
+                    existing_values[value] = None
+            else:
+                existing_values.append(value)
+            return existing_values
         
-        existing_values.append(value)
-        self.index.insert(key, existing_values)
+        # One descent finds the key's container (or its insertion point)
+        self.index.upsert(key, add)
+        if added:
+            self._total += 1
     
     def get(self, key: K) -> List[V]:
         """
@@ -197,7 +678,7 @@ class MultiValueIndex(Generic[K, V]):
             List of values associated with the key, or empty list if not found
         """
         values = self.index.get(key)
-        return values if values is not None else []
+        return self._as_list(values) if values is not None else []
     
     def delete(self, key: K, value: Optional[V] = None) -> bool:
         """
@@ -210,26 +691,31 @@ class MultiValueIndex(Generic[K, V]):
         Returns:
             True if something was deleted, False otherwise
         """
+        existing_values = self.index.get(key)
+        if existing_values is None:
+            return False
+        
         if value is None:
             # Delete entire key
-            return self.index.delete(key)
-        else:
-            # Delete specific value
-            existing_values = self.index.get(key)
-            if existing_values is None:
+            self.index.delete(key)
+            self._total -= len(existing_values)
+            return True
+        
+        # Delete specific value
+        if self._ordered_set:
+            if existing_values.pop(value, _MISSING) is _MISSING:
                 return False
-            
+        else:
             try:
                 existing_values.remove(value)
-                if not existing_values:
-                    # If no values left, delete the key entirely
-                    self.index.delete(key)
-                else:
-                    # Update with remaining values
-                    self.index.insert(key, existing_values)
-                return True
             except ValueError:
                 return False
+        
+        if not existing_values:
+            # If no values left, delete the key entirely
+            self.index.delete(key)
+        self._total -= 1
+        return True
     
     def range_query(self, start_key: K, end_key: K) -> List[Tuple[K, List[V]]]:
         """
@@ -242,25 +728,55 @@ class MultiValueIndex(Generic[K, V]):
         Returns:
             List of (key, values) tuples in the range
         """
-        return self.index.range_query(start_key, end_key)
+        results = self.index.range_query(start_key, end_key)
+        if self._ordered_set:
+            return [(key, list(values)) for key, values in results]
+        return results
     
     def get_all(self) -> List[Tuple[K, List[V]]]:
         """Get all key-value pairs in the index."""
-        return self.index.get_all()
+        return list(self)
     
     def __contains__(self, key: K) -> bool:
         """Check if a key exists in the index."""
         return key in self.index
     
+    def __iter__(self) -> Iterator[Tuple[K, List[V]]]:
+        """Iterate over all key-value pairs in the index."""
+        if not self._ordered_set:
+            return iter(self.index)
+        return ((key, list(values)) for key, values in self.index)
+    
     def __repr__(self) -> str:
         if self.index.is_empty():
             return "MultiValueIndex()"
         
-        items = self.get_all()
-        if len(items) <= 3:
-            return f"MultiValueIndex({dict(items)})"
+        first, last = self.index._edge_items(2, 1)
+        first = {key: self._as_list(values) for key, values in first}
+        if last is None:
+            return f"MultiValueIndex({first})"
         else:
-            return f"MultiValueIndex({dict(items[:2])}...{dict(items[-1:])})"
+            last = {key: self._as_list(values) for key, values in last}
+            return f"MultiValueIndex({first}...{last})"
+
+# Sentinel keys that sort before/after every real key at the same timestamp
+_LOWEST = object()
+_HIGHEST = object()
+
+
+def _compare_timestamp_keys(a: Tuple[float, Any, Any], b: Tuple[float, Any, Any]) -> int:
+    """Order (timestamp, key, value) records by timestamp, then by key."""
+    if a[0] != b[0]:
+        return -1 if a[0] < b[0] else 1
+    key_a, key_b = a[1], b[1]
+    if key_a is key_b:
+        return 0
+    if key_a is _LOWEST or key_b is _HIGHEST:
+        return -1
+    if key_a is _HIGHEST or key_b is _LOWEST:
+        return 1
+    return -1 if key_a < key_b else (1 if key_a > key_b else 0)
+
 
 class TimestampedIndex(Generic[K, V]):
     """
@@ -270,8 +786,14 @@ class TimestampedIndex(Generic[K, V]):
     and for implementing features like data expiration or versioning.
     """
     
+    _now = staticmethod(time.time)
+    
     def __init__(self, min_degree: int = 3) -> None:
         self.index = DatabaseIndex[K, Tuple[V, float]](min_degree=min_degree)
+        # Secondary index ordered by timestamp for temporal range queries
+        self._ts_index = BTree[Tuple[float, K, V]](
+            min_degree=min_degree, key_comparator=_compare_timestamp_keys
+        )
     
     def __len__(self) -> int:
         """Return the number of entries in the index."""
@@ -287,9 +809,10 @@ class TimestampedIndex(Generic[K, V]):
             timestamp: The timestamp (defaults to current time)
         """
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = self._now()
         
-        self.index.insert(key, (value, timestamp))
+        self.index.insert(key, (value, timestamp), timestamp)
+        self._ts_index.insert((timestamp, key, value))
     
     def get(self, key: K) -> Optional[Tuple[V, float]]:
         """
@@ -339,7 +862,13 @@ class TimestampedIndex(Generic[K, V]):
         Returns:
             True if the key was deleted, False if it wasn't found
         """
-        return self.index.delete(key)
+        result = self.index.get(key)
+        if result is None:
+            return False
+        
+        self.index.delete(key)
+        self._ts_index.delete((result[1], key, None))
+        return True
     
     def range_query(self, start_key: K, end_key: K) -> List[Tuple[K, Tuple[V, float]]]:
         """
@@ -366,15 +895,15 @@ class TimestampedIndex(Generic[K, V]):
             timestamp: The minimum timestamp
             
         Returns:
-            List of entries with timestamps after the given time
+            List of entries with timestamps after the given time, in key
+            order like get_all
         """
-        # This is a simplified implementation - in practice, you might want
-        # a separate index on timestamps for efficient range queries
-        result = []
-        for key, (value, ts) in self.index.get_all():
-            if ts > timestamp:
-                result.append((key, (value, ts)))
-        return result
+        records = self._ts_index.range_query(
+            (timestamp, _HIGHEST, None), (float('inf'), _HIGHEST, None)
+        )
+        # The timestamp index yields records in time order; sort the matches
+        # back into key order, which is what a scan of the main index returns
+        return sorted(((key, (value, ts)) for ts, key, value in records), key=itemgetter(0))
     
     def get_entries_before(self, timestamp: float) -> List[Tuple[K, Tuple[V, float]]]:
         """
@@ -384,27 +913,33 @@ class TimestampedIndex(Generic[K, V]):
             timestamp: The maximum timestamp
             
         Returns:
-            List of entries with timestamps before the given time
+            List of entries with timestamps before the given time, in key
+            order like get_all
         """
-        result = []
-        for key, (value, ts) in self.index.get_all():
-            if ts < timestamp:
-                result.append((key, (value, ts)))
-        return result
+        records = self._ts_index.range_query(
+            (float('-inf'), _LOWEST, None), (timestamp, _LOWEST, None)
+        )
+        # The timestamp index yields records in time order; sort the matches
+        # back into key order, which is what a scan of the main index returns
+        return sorted(((key, (value, ts)) for ts, key, value in records), key=itemgetter(0))
     
     def __contains__(self, key: K) -> bool:
         """Check if a key exists in the index."""
         return key in self.index
     
+    def __iter__(self) -> Iterator[Tuple[K, Tuple[V, float]]]:
+        """Iterate over all key-value pairs in the index."""
+        return iter(self.index)
+    
     def __repr__(self) -> str:
         if self.index.is_empty():
             return "TimestampedIndex()"
         
-        items = self.get_all()
-        if len(items) <= 3:
-            return f"TimestampedIndex({dict(items)})"
+        first, last = self.index._edge_items(2, 1)
+        if last is None:
+            return f"TimestampedIndex({dict(first)})"
         else:
-            return f"TimestampedIndex({dict(items[:2])}...{dict(items[-1:])})" 
+            return f"TimestampedIndex({dict(first)}...{dict(last)})" 
 
 
 
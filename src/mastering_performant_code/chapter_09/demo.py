@@ -170,6 +170,12 @@ def demo_database_index():
     for key, value in results:
         print(f"  {key} -> {value}")
     
+    # Columnar range query: parallel key/value sequences, no per-row tuples
+    keys, values = index.range_query_arrays("user:", "user:z")
+    print(f"\nColumnar range query ['user:', 'user:z']:")
+    print(f"  keys:   {list(keys)}")
+    print(f"  values: {values}")
+    
     # Get statistics
     stats = index.get_stats()
     print(f"\nIndex statistics:")
@@ -0,0 +1,564 @@
+"""
+Struct-of-Arrays B-Tree for Integer Keys
+
+This module provides a B-Tree specialised for 64-bit integer keys. Instead of
+storing one wrapper object per entry, every node keeps three parallel arrays:
+packed keys in an ``array('q')``, a list of values and packed timestamps in an
+``array('d')``. In-node searches run ``bisect`` over the packed key array, so
+comparisons never leave C or touch per-entry Python objects.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+
+class NumericBTreeNode:
+    """
+    A B-Tree node holding its entries as parallel arrays.
+
+    Args:
+        is_leaf: Whether this node is a leaf
+    """
+    __slots__ = ('keys', 'values', 'timestamps', 'children')
+
+    def __init__(self, is_leaf: bool) -> None:
+        self.keys = array('q')
+        self.values: List[Any] = []
+        self.timestamps = array('d')
+        self.children: Optional[List['NumericBTreeNode']] = None if is_leaf else []
+
+    @property
+    def is_leaf(self) -> bool:
+        """Check if this node is a leaf."""
+        return self.children is None
+
+    @property
+    def num_keys(self) -> int:
+        """Number of keys stored in this node."""
+        return len(self.keys)
+
+    def get_memory_size(self) -> int:
+        """Calculate memory usage of this node's own storage."""
+        size = (sys.getsizeof(self) + sys.getsizeof(self.keys)
+                + sys.getsizeof(self.values) + sys.getsizeof(self.timestamps))
+        if self.children is not None:
+            size += sys.getsizeof(self.children)
+        return size
+
+    def __repr__(self) -> str:
+        return f"NumericBTreeNode(keys={list(self.keys)}, is_leaf={self.is_leaf})"
+
+
+class NumericBTree:
+    """
+    A B-Tree mapping 64-bit integer keys to values.
+
+    Duplicate keys are allowed; lookups return one of the matching values.
+
+    Args:
+        min_degree: Minimum degree of the B-Tree (t ≥ 2)
+    """
+
+    def __init__(self, min_degree: int = 3) -> None:
+        if min_degree < 2:
+            raise ValueError("Minimum degree must be at least 2")
+
+        self.min_degree = min_degree
+        self.max_keys = 2 * min_degree - 1
+        self.min_keys = min_degree - 1
+        self.root: Optional[NumericBTreeNode] = None
+        self.size = 0
+        self.height = 0
+
+    def __len__(self) -> int:
+        """Return the number of keys in the B-Tree."""
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        """Check if a key exists in the B-Tree."""
+        return self._find(key) is not None
+
+    def is_empty(self) -> bool:
+        """Check if the B-Tree is empty."""
+        return self.root is None
+
+    def clear(self) -> None:
+        """Remove all keys from the B-Tree."""
+        self.root = None
+        self.size = 0
+        self.height = 0
+
+    def get_height(self) -> int:
+        """Get the height of the B-Tree."""
+        return self.height
+
+    def _find(self, key: int) -> Optional[Tuple[NumericBTreeNode, int]]:
+        """Return the node and slot holding ``key``, or None."""
+        node = self.root
+        while node is not None:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return node, i
+            node = None if node.children is None else node.children[i]
+        return None
+
+    def get(self, key: int, default: Any = None) -> Any:
+        """
+        Get the value stored under a key.
+
+        Args:
+            key: The key to look up
+            default: Value returned when the key is missing
+
+        Returns:
+            The stored value, or ``default`` if not found
+        """
+        found = self._find(key)
+        if found is None:
+            return default
+        node, i = found
+        return node.values[i]
+
+    def get_timestamp(self, key: int) -> Optional[float]:
+        """Get the timestamp stored with a key, or None if not found."""
+        found = self._find(key)
+        if found is None:
+            return None
+        node, i = found
+        return node.timestamps[i]
+
+    def insert(self, key: int, value: Any, timestamp: float = 0.0) -> None:
+        """
+        Insert a key-value pair into the B-Tree.
+
+        Args:
+            key: The key to insert (must fit in a signed 64-bit integer)
+            value: The value associated with the key
+            timestamp: Timestamp stored alongside the entry
+        """
+        if self.root is None:
+            self.root = NumericBTreeNode(is_leaf=True)
+            self.height = 1
+        elif len(self.root.keys) == self.max_keys:
+            old_root = self.root
+            self.root = NumericBTreeNode(is_leaf=False)
+            self.root.children.append(old_root)
+            self._split_child(self.root, 0)
+            self.height += 1
+
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            if len(node.children[i].keys) == self.max_keys:
+                self._split_child(node, i)
+                if key >= node.keys[i]:
+                    i += 1
+            node = node.children[i]
+
+        i = bisect_right(node.keys, key)
+        node.keys.insert(i, key)
+        node.values.insert(i, value)
+        node.timestamps.insert(i, timestamp)
+        self.size += 1
+
+    def upsert(self, key: int, update: Callable[[Any], Any], timestamp: float = 0.0) -> Any:
+        """
+        Insert or update a key's value with a single root-to-leaf descent.
+
+        Args:
+            key: The key to look up
+            update: Receives the current value (None if the key is missing)
+                and returns the value to store
+            timestamp: Timestamp stored if a new entry is created
+
+        Returns:
+            The stored value
+        """
+        if self.root is None:
+            value = update(None)
+            self.insert(key, value, timestamp)
+            return value
+
+        if len(self.root.keys) == self.max_keys:
+            old_root = self.root
+            self.root = NumericBTreeNode(is_leaf=False)
+            self.root.children.append(old_root)
+            self._split_child(self.root, 0)
+            self.height += 1
+
+        node = self.root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                node.values[i] = update(node.values[i])
+                return node.values[i]
+
+            if node.children is None:
+                value = update(None)
+                keys.insert(i, key)
+                node.values.insert(i, value)
+                node.timestamps.insert(i, timestamp)
+                self.size += 1
+                return value
+
+            if len(node.children[i].keys) == self.max_keys:
+                # Re-examine this node: the promoted key may be the match
+                self._split_child(node, i)
+                continue
+            node = node.children[i]
+
+    def _split_child(self, parent: NumericBTreeNode, index: int) -> None:
+        """Split the full child at ``index``, promoting its middle entry."""
+        child = parent.children[index]
+        mid = self.min_keys
+        right = NumericBTreeNode(is_leaf=child.is_leaf)
+
+        right.keys = child.keys[mid + 1:]
+        right.values = child.values[mid + 1:]
+        right.timestamps = child.timestamps[mid + 1:]
+        if child.children is not None:
+            right.children = child.children[mid + 1:]
+            del child.children[mid + 1:]
+
+        parent.keys.insert(index, child.keys[mid])
+        parent.values.insert(index, child.values[mid])
+        parent.timestamps.insert(index, child.timestamps[mid])
+        parent.children.insert(index + 1, right)
+
+        del child.keys[mid:]
+        del child.values[mid:]
+        del child.timestamps[mid:]
+
+    def delete(self, key: int) -> bool:
+        """
+        Delete one entry with the given key.
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            True if the key was deleted, False if it wasn't found
+        """
+        if self.root is None:
+            return False
+
+        deleted = self._delete(self.root, key)
+        if deleted:
+            self.size -= 1
+
+        if not self.root.keys:
+            if self.root.children is None:
+                self.root = None
+                self.height = 0
+            else:
+                self.root = self.root.children[0]
+                self.height -= 1
+
+        return deleted
+
+    def _delete(self, node: NumericBTreeNode, key: int) -> bool:
+        """Delete ``key`` from a subtree whose root has more than min_keys keys."""
+        i = bisect_left(node.keys, key)
+        found = i < len(node.keys) and node.keys[i] == key
+
+        if node.children is None:
+            if not found:
+                return False
+            del node.keys[i]
+            del node.values[i]
+            del node.timestamps[i]
+            return True
+
+        if found:
+            left, right = node.children[i], node.children[i + 1]
+            if len(left.keys) > self.min_keys:
+                entry = self._pop_last(left)
+            elif len(right.keys) > self.min_keys:
+                entry = self._pop_first(right)
+            else:
+                self._merge_children(node, i)
+                return self._delete(left, key)
+            node.keys[i], node.values[i], node.timestamps[i] = entry
+            return True
+
+        if len(node.children[i].keys) == self.min_keys:
+            i = self._fill_child(node, i)
+        return self._delete(node.children[i], key)
+
+    def _pop_last(self, node: NumericBTreeNode) -> Tuple[int, Any, float]:
+        """Remove and return the largest entry of a subtree."""
+        while node.children is not None:
+            i = len(node.keys)
+            if len(node.children[i].keys) == self.min_keys:
+                i = self._fill_child(node, i)
+            node = node.children[i]
+        return node.keys.pop(), node.values.pop(), node.timestamps.pop()
+
+    def _pop_first(self, node: NumericBTreeNode) -> Tuple[int, Any, float]:
+        """Remove and return the smallest entry of a subtree."""
+        while node.children is not None:
+            if len(node.children[0].keys) == self.min_keys:
+                self._fill_child(node, 0)
+            node = node.children[0]
+        return node.keys.pop(0), node.values.pop(0), node.timestamps.pop(0)
+
+    def _fill_child(self, parent: NumericBTreeNode, index: int) -> int:
+        """
+        Give a minimal child an extra key by borrowing or merging.
+
+        Returns:
+            The index of the child that now covers the original child's keys
+        """
+        children = parent.children
+        if index > 0 and len(children[index - 1].keys) > self.min_keys:
+            self._borrow_from_left(parent, index)
+        elif index < len(parent.keys) and len(children[index + 1].keys) > self.min_keys:
+            self._borrow_from_right(parent, index)
+        elif index > 0:
+            self._merge_children(parent, index - 1)
+            return index - 1
+        else:
+            self._merge_children(parent, index)
+        return index
+
+    def _borrow_from_left(self, parent: NumericBTreeNode, index: int) -> None:
+        """Rotate the last entry of the left sibling through the parent."""
+        child, left = parent.children[index], parent.children[index - 1]
+        child.keys.insert(0, parent.keys[index - 1])
+        child.values.insert(0, parent.values[index - 1])
+        child.timestamps.insert(0, parent.timestamps[index - 1])
+        parent.keys[index - 1] = left.keys.pop()
+        parent.values[index - 1] = left.values.pop()
+        parent.timestamps[index - 1] = left.timestamps.pop()
+        if left.children is not None:
+            child.children.insert(0, left.children.pop())
+
+    def _borrow_from_right(self, parent: NumericBTreeNode, index: int) -> None:
+        """Rotate the first entry of the right sibling through the parent."""
+        child, right = parent.children[index], parent.children[index + 1]
+        child.keys.append(parent.keys[index])
+        child.values.append(parent.values[index])
+        child.timestamps.append(parent.timestamps[index])
+        parent.keys[index] = right.keys.pop(0)
+        parent.values[index] = right.values.pop(0)
+        parent.timestamps[index] = right.timestamps.pop(0)
+        if right.children is not None:
+            child.children.append(right.children.pop(0))
+
+    def _merge_children(self, parent: NumericBTreeNode, index: int) -> None:
+        """Merge child ``index + 1`` and the separator into child ``index``."""
+        left, right = parent.children[index], parent.children.pop(index + 1)
+        left.keys.append(parent.keys.pop(index))
+        left.values.append(parent.values.pop(index))
+        left.timestamps.append(parent.timestamps.pop(index))
+        left.keys.extend(right.keys)
+        left.values.extend(right.values)
+        left.timestamps.extend(right.timestamps)
+        if left.children is not None:
+            left.children.extend(right.children)
+
+    def bulk_load(self, keys: List[int], values: List[Any], timestamps: List[float]) -> None:
+        """
+        Build the B-Tree bottom-up from entries already sorted by key.
+
+        Raises:
+            ValueError: If the tree is not empty
+        """
+        if self.root is not None:
+            raise ValueError("bulk_load requires an empty B-Tree")
+
+        n = len(keys)
+        if n == 0:
+            return
+
+        height = 1
+        while (2 * self.min_degree) ** height - 1 < n:
+            height += 1
+
+        self.root = self._build_subtree(keys, values, timestamps, 0, n, height, is_root=True)
+        self.size = n
+        self.height = height
+
+    def _build_subtree(self, keys: List[int], values: List[Any], timestamps: List[float],
+                       lo: int, hi: int, height: int, is_root: bool = False) -> NumericBTreeNode:
+        """Build a subtree of exactly ``height`` levels holding entries lo..hi."""
+        if height == 1:
+            node = NumericBTreeNode(is_leaf=True)
+            node.keys = array('q', keys[lo:hi])
+            node.values = values[lo:hi]
+            node.timestamps = array('d', timestamps[lo:hi])
+            return node
+
+        count = hi - lo
+        child_capacity = (2 * self.min_degree) ** (height - 1)
+        num_children = max(2 if is_root else self.min_degree,
+                           -(-(count + 1) // child_capacity))
+        base, extra = divmod(count - (num_children - 1), num_children)
+
+        node = NumericBTreeNode(is_leaf=False)
+        start = lo
+        for i in range(num_children):
+            end = start + base + (1 if i < extra else 0)
+            node.children.append(
+                self._build_subtree(keys, values, timestamps, start, end, height - 1))
+            if i < num_children - 1:
+                node.keys.append(keys[end])
+                node.values.append(values[end])
+                node.timestamps.append(timestamps[end])
+                start = end + 1
+        return node
+
+    def range_query(self, start_key: int, end_key: int) -> List[Tuple[int, Any]]:
+        """
+        Find all entries with keys in the range [start_key, end_key].
+
+        Returns:
+            List of (key, value) tuples in key order
+        """
+        result: List[Tuple[int, Any]] = []
+        if self.root is not None:
+            self._range_query_recursive(self.root, start_key, end_key, result)
+        return result
+
+    def range_query_iter(self, start_key: int, end_key: int) -> Iterator[Tuple[int, Any]]:
+        """
+        Lazily yield entries with keys in the range [start_key, end_key].
+
+        Yields:
+            (key, value) tuples in key order
+        """
+        stack: List[Tuple[NumericBTreeNode, int]] = []
+        node = self.root
+        while node is not None:
+            i = bisect_left(node.keys, start_key)
+            stack.append((node, i))
+            node = None if node.children is None else node.children[i]
+
+        while stack:
+            node, i = stack.pop()
+            keys, values = node.keys, node.values
+            if node.children is None:
+                for j in range(i, len(keys)):
+                    if keys[j] > end_key:
+                        return
+                    yield keys[j], values[j]
+                continue
+
+            if i < len(keys):
+                if keys[i] > end_key:
+                    return
+                yield keys[i], values[i]
+                stack.append((node, i + 1))
+                child = node.children[i + 1]
+                while child is not None:
+                    stack.append((child, 0))
+                    child = None if child.children is None else child.children[0]
+
+    def _range_query_recursive(self, node: NumericBTreeNode, start_key: int, end_key: int,
+                               result: List[Tuple[int, Any]]) -> bool:
+        """Collect entries in range; returns False once a key passes end_key."""
+        keys, values = node.keys, node.values
+        i = bisect_left(keys, start_key)
+        stop = bisect_right(keys, end_key)
+
+        if node.children is None:
+            result.extend(zip(keys[i:stop], values[i:stop]))
+            return stop == len(keys)
+
+        for j in range(i, stop):
+            if not self._range_query_recursive(node.children[j], start_key, end_key, result):
+                return False
+            result.append((keys[j], values[j]))
+        if stop < len(keys):
+            self._range_query_recursive(node.children[stop], start_key, end_key, result)
+            return False
+        return self._range_query_recursive(node.children[stop], start_key, end_key, result)
+
+    def range_query_arrays(self, start_key: int, end_key: int) -> Tuple[array, List[Any]]:
+        """
+        Find all entries with keys in [start_key, end_key] as two columns.
+
+        Keys are copied slice-by-slice from the packed node arrays into a
+        single ``array('q')``, so no per-entry tuple is created.
+
+        Returns:
+            (keys, values) where keys is an ``array('q')``
+        """
+        keys = array('q')
+        values: List[Any] = []
+        if self.root is not None:
+            self._range_arrays_recursive(self.root, start_key, end_key, keys, values)
+        return keys, values
+
+    def _range_arrays_recursive(self, node: NumericBTreeNode, start_key: int, end_key: int,
+                                keys: array, values: List[Any]) -> bool:
+        """Append in-range entries to the columns; False once past end_key."""
+        i = bisect_left(node.keys, start_key)
+        stop = bisect_right(node.keys, end_key)
+
+        if node.children is None:
+            keys.extend(node.keys[i:stop])
+            values.extend(node.values[i:stop])
+            return stop == len(node.keys)
+
+        for j in range(i, stop):
+            if not self._range_arrays_recursive(node.children[j], start_key, end_key, keys, values):
+                return False
+            keys.append(node.keys[j])
+            values.append(node.values[j])
+        more = self._range_arrays_recursive(node.children[stop], start_key, end_key, keys, values)
+        return more and stop == len(node.keys)
+
+    def items(self) -> Iterator[Tuple[int, Any]]:
+        """Iterate over (key, value) pairs in key order."""
+        if self.root is not None:
+            yield from self._items_recursive(self.root)
+
+    def _items_recursive(self, node: NumericBTreeNode) -> Iterator[Tuple[int, Any]]:
+        """Recursively yield (key, value) pairs of a subtree in order."""
+        if node.children is None:
+            yield from zip(node.keys, node.values)
+            return
+        for i in range(len(node.keys)):
+            yield from self._items_recursive(node.children[i])
+            yield node.keys[i], node.values[i]
+        yield from self._items_recursive(node.children[-1])
+
+    def items_reverse(self) -> Iterator[Tuple[int, Any]]:
+        """Iterate over (key, value) pairs in descending key order."""
+        if self.root is not None:
+            yield from self._items_reverse_recursive(self.root)
+
+    def _items_reverse_recursive(self, node: NumericBTreeNode) -> Iterator[Tuple[int, Any]]:
+        """Recursively yield (key, value) pairs of a subtree in reverse order."""
+        if node.children is None:
+            yield from zip(reversed(node.keys), reversed(node.values))
+            return
+        yield from self._items_reverse_recursive(node.children[-1])
+        for i in range(len(node.keys) - 1, -1, -1):
+            yield node.keys[i], node.values[i]
+            yield from self._items_reverse_recursive(node.children[i])
+
+    def get_memory_usage(self) -> int:
+        """Calculate total memory usage of the B-Tree."""
+        total_size = sys.getsizeof(self)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            total_size += node.get_memory_size()
+            if node.children is not None:
+                stack.extend(node.children)
+        return total_size
+
+    def __iter__(self) -> Iterator[int]:
+        for key, _ in self.items():
+            yield key
+
+    def __repr__(self) -> str:
+        if self.root is None:
+            return "NumericBTree()"
+        return f"NumericBTree({list(self)})"
@@ -7,7 +7,7 @@ and Unicode-aware variants.
 """
 
 from .trie import Trie, TrieNode
-from .compressed_trie import CompressedTrie, CompressedTrieNode
+from .compressed_trie import CompressedTrie, CompressedTrieNode, FrozenCompressedTrie
 from .unicode_trie import UnicodeTrie
 from .autocomplete import AutocompleteSystem
 from .spell_checker import SpellChecker
@@ -19,6 +19,7 @@ __all__ = [
     'TrieNode',
     'CompressedTrie',
     'CompressedTrieNode',
+    'FrozenCompressedTrie',
     'UnicodeTrie',
     'AutocompleteSystem',
     'SpellChecker',
@@ -5,32 +5,105 @@ This module provides a memory-efficient compressed trie implementation that
 reduces memory usage by merging nodes with single children.
 """
 
-from typing import TypeVar, Generic, Optional, Iterator, List, Dict, Set, Tuple
-from dataclasses import dataclass, field
+import sys
+from itertools import islice
+from operator import itemgetter
+from typing import TypeVar, Generic, Optional, Iterable, Iterator, List, Dict, Set, Tuple
+from array import array
 from collections import defaultdict
 
 T = TypeVar('T')
 
-@dataclass
+# Strings shown by CompressedTrie.__repr__ before eliding the rest
+_REPR_LIMIT = 20
+
+
+def _keep_label(label: bytes) -> bytes:
+    """Stand-in for sys.intern on bytes edge labels."""
+    return label
+
+
+def _common_prefix_len(str1: str, str2: str) -> int:
+    """
+    Return the length of the longest common prefix of two strings.
+    
+    Binary search over the prefix length: each probe checks only the
+    not-yet-confirmed span with one str.startswith call, which compares in
+    C. That is O(log n) calls in total instead of one interpreted loop
+    iteration per matching character.
+    """
+    lo, hi = 0, min(len(str1), len(str2))
+    while lo < hi:
+        # str1[:lo] == str2[:lo] is known; test whether it extends to mid
+        mid = (lo + hi + 1) // 2
+        if str1.startswith(str2[lo:mid], lo):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _add_child(parent: 'CompressedTrieNode', child: 'CompressedTrieNode') -> None:
+    """
+    Link a new child under parent, keeping the child map in sorted order.
+    
+    Appending is enough when the child's first character sorts last (the
+    common case for sorted input); otherwise the small map is rebuilt in
+    order. Depth-first traversals then visit words lexicographically with
+    no sorting at query time.
+    """
+    children = parent.children
+    first = child.first_char
+    if not children or first > next(reversed(children)):
+        children[first] = child
+    else:
+        children[first] = child
+        parent.children = dict(sorted(children.items(), key=itemgetter(0)))
+
+
 class CompressedTrieNode:
     """
     A node in the compressed trie data structure.
     
+    Nodes are created on every insert and split, so this is a plain
+    __slots__ class with a hand-written __init__: no per-instance __dict__
+    and no generated dataclass machinery on the construction path.
+    
     Attributes:
         edge_label: The edge label (can be multiple characters)
+        first_char: edge_label[0], the node's key in its parent's child
+            map (None for the root)
+        edge_len: len(edge_label), read on every traversal step; relabel
+            nodes with set_edge_label so both cached fields stay in sync
         is_end: Whether this node marks the end of a word
         value: Optional value associated with this node
-        children: Dictionary mapping edge labels to child nodes
+        children: Dictionary mapping the first character of each child's
+            edge label to the child node (sibling edges never share a
+            first character, so one lookup finds the only candidate edge),
+            kept in sorted key order
     """
-    edge_label: str = ""
-    is_end: bool = False
-    value: Optional[T] = None
-    children: Dict[str, 'CompressedTrieNode'] = field(default_factory=dict)
-    
-    def __post_init__(self):
-        """Initialize the node after creation."""
-        if self.children is None:
-            self.children = {}
+    
+    __slots__ = ('edge_label', 'first_char', 'edge_len', 'is_end', 'value', 'children')
+    
+    def __init__(self, edge_label: str = "", is_end: bool = False, value: Optional[T] = None,
+                 children: Optional[Dict[str, 'CompressedTrieNode']] = None) -> None:
+        self.edge_label = edge_label
+        self.first_char = edge_label[0] if edge_label else None
+        self.edge_len = len(edge_label)
+        self.is_end = is_end
+        self.value = value
+        self.children = children if children is not None else {}
+    
+    def set_edge_label(self, edge_label: str) -> None:
+        """Replace the edge label, keeping first_char and edge_len in sync."""
+        self.edge_label = edge_label
+        self.first_char = edge_label[0] if edge_label else None
+        self.edge_len = len(edge_label)
+    
+    def __repr__(self) -> str:
+        return (f"CompressedTrieNode(edge_label={self.edge_label!r}, is_end={self.is_end}, "
+                f"value={self.value!r}, children={len(self.children)})")
+
 
 class CompressedTrie(Generic[T]):
     """
@@ -40,14 +113,29 @@ class CompressedTrie(Generic[T]):
     - Merging nodes with single children
     - Storing multiple characters on edges
     - Eliminating unnecessary internal nodes
+    - Interning edge labels, so suffixes that recur across the trie
+      (common in word lists and URLs) share a single string object
     
     Memory savings: 70-90% compared to standard trie
     Time complexity: Same as standard trie for most operations
+    
+    Args:
+        key_type: ``str`` (default) or ``bytes``. A bytes trie stores raw
+            byte-string keys and edge labels directly, so callers that
+            already hold bytes (network input, file contents) never pay
+            for decoding, and every prefix comparison is a plain memcmp.
+            Edges are keyed by their first byte as an int.
     """
     
-    def __init__(self) -> None:
+    def __init__(self, key_type: type = str) -> None:
         """Initialize an empty compressed trie."""
-        self._root = CompressedTrieNode()
+        if key_type not in (str, bytes):
+            raise ValueError("key_type must be str or bytes")
+        self._key_type = key_type
+        self._empty = key_type()
+        # bytes objects cannot be interned
+        self._intern = sys.intern if key_type is str else _keep_label
+        self._root = CompressedTrieNode(edge_label=self._empty)
         self._size = 0
     
     def __len__(self) -> int:
@@ -86,106 +174,66 @@ class CompressedTrie(Generic[T]):
             key: The string to insert
             value: Optional value to associate with the key
         """
+        if not isinstance(key, self._key_type):
+            raise TypeError(f"CompressedTrie keys must be {self._key_type.__name__}, "
+                            f"not {type(key).__name__}")
         if not key:
             raise ValueError("Cannot insert empty string")
         
         if self._size == 0:
             # First insertion - create a direct child of root
-            self._root.children[key] = CompressedTrieNode(
-                edge_label=key, is_end=True, value=value
-            )
+            node = CompressedTrieNode(edge_label=self._intern(key), is_end=True, value=value)
+            self._root.children[node.first_char] = node
             self._size = 1
             return
         
         # Find the best insertion point
-        insertion_node, remaining_key = self._find_insertion_point(key)
+        insertion_node, remaining_key, edge_to_split = self._find_insertion_point(key)
         
         if not remaining_key:
             # Key already exists or is a prefix of existing key
             self._handle_existing_key(insertion_node, key, value)
         else:
             # Need to insert new key
-            self._insert_new_key(insertion_node, remaining_key, value)
+            self._insert_new_key(insertion_node, remaining_key, value, edge_to_split)
     
-    def _find_insertion_point(self, key: str) -> Tuple[CompressedTrieNode, str]:
+    def _find_insertion_point(self, key: str) -> Tuple[CompressedTrieNode, str, Optional[Tuple[str, CompressedTrieNode, int]]]:
         """
         Find the best node to insert the key and return remaining key to insert.
         
         This method traverses the trie to find where the key should be inserted,
         handling edge cases where the key is a prefix of existing edges or vice versa.
+        Each hop scans the candidate edge once; when the walk stops partway
+        along an edge, the common prefix length found there is returned so the
+        split does not rescan it.
         
         Args:
             key: The key to find insertion point for
             
         Returns:
-            Tuple of (node to insert at, remaining key to insert)
+            Tuple of (node to insert at, remaining key to insert, edge to
+            split as (edge_label, child_node, common_prefix_length) or None)
         """
         node = self._root
         remaining = key
         
         while remaining:
-            # Try to find a matching edge
-            matching_edge = self._find_matching_edge(node, remaining)
-            
-            if matching_edge is None:
-                # No matching edge found - insert at current node
+            child = node.children.get(remaining[0])
+            if child is None:
+                # No edge shares a first character - insert at current node
                 break
             
-            edge_label, child = matching_edge
-            
-            if remaining.startswith(edge_label):
-                # Case 1: Remaining key starts with edge label
-                # Move down the trie and continue
+            edge_label = child.edge_label
+            common_length = _common_prefix_len(remaining, edge_label)
+            if common_length == child.edge_len:
+                # Remaining key starts with edge label - move down the trie
                 node = child
-                remaining = remaining[len(edge_label):]
-            elif edge_label.startswith(remaining):
-                # Case 2: Edge label starts with remaining key
-                # The key is a prefix of an existing edge - need to split
-                return node, remaining
+                remaining = remaining[common_length:]
             else:
-                # Case 3: Partial match - need to find common prefix
-                common_prefix = self._find_common_prefix(remaining, edge_label)
-                if common_prefix:
-                    return node, remaining
-                else:
-                    # No common prefix - insert at current node
-                    break
-        
-        return node, remaining
-    
-    def _find_matching_edge(self, node: CompressedTrieNode, remaining: str) -> Optional[Tuple[str, CompressedTrieNode]]:
-        """
-        Find the best matching edge for the remaining key.
+                # The key ends inside this edge or diverges from it - split
+                return node, remaining, (edge_label, child, common_length)
         
-        Args:
-            node: Current node to search from
-            remaining: Remaining key to match
-            
-        Returns:
-            Tuple of (edge_label, child_node) if found, None otherwise
-        """
-        for edge_label, child in node.children.items():
-            if remaining.startswith(edge_label) or edge_label.startswith(remaining):
-                return edge_label, child
-        return None
-    
-    def _find_common_prefix(self, str1: str, str2: str) -> str:
-        """
-        Find the common prefix between two strings.
-        
-        Args:
-            str1: First string
-            str2: Second string
-            
-        Returns:
-            Common prefix string
-        """
-        common_length = 0
-        for c1, c2 in zip(str1, str2):
-            if c1 != c2:
-                break
-            common_length += 1
-        return str1[:common_length]
+        return node, remaining, None
     
     def _handle_existing_key(self, node: CompressedTrieNode, key: str, value: T) -> None:
         """
@@ -205,7 +253,8 @@ class CompressedTrie(Generic[T]):
             # Key already exists - update value
             node.value = value
     
-    def _insert_new_key(self, parent_node: CompressedTrieNode, remaining_key: str, value: T) -> None:
+    def _insert_new_key(self, parent_node: CompressedTrieNode, remaining_key: str, value: T,
+                        edge_to_split: Optional[Tuple[str, CompressedTrieNode, int]] = None) -> None:
         """
         Insert a new key at the given parent node.
         
@@ -216,47 +265,21 @@ class CompressedTrie(Generic[T]):
             parent_node: Parent node where insertion should occur
             remaining_key: The remaining key to insert
             value: Value to associate with the key
+            edge_to_split: Edge found by _find_insertion_point that must be
+                split, with its common prefix length, or None
         """
-        # Check if we need to split any existing edges
-        edge_to_split = self._find_edge_to_split(parent_node, remaining_key)
-        
         if edge_to_split:
             # Split the edge and insert
             self._split_edge_and_insert(parent_node, edge_to_split, remaining_key, value)
         else:
             # Simple insertion - add as new child
-            parent_node.children[remaining_key] = CompressedTrieNode(
-                edge_label=remaining_key, is_end=True, value=value
-            )
+            _add_child(parent_node, CompressedTrieNode(
+                edge_label=self._intern(remaining_key), is_end=True, value=value
+            ))
             self._size += 1
     
-    def _find_edge_to_split(self, node: CompressedTrieNode, remaining_key: str) -> Optional[Tuple[str, CompressedTrieNode]]:
-        """
-        Find an edge that needs to be split for the remaining key.
-        
-        Args:
-            node: Parent node to search
-            remaining_key: Key that might require edge splitting
-            
-        Returns:
-            Tuple of (edge_label, child_node) if splitting needed, None otherwise
-        """
-        for edge_label, child in node.children.items():
-            if edge_label.startswith(remaining_key):
-                # Edge starts with remaining key - need to split
-                return edge_label, child
-            elif remaining_key.startswith(edge_label):
-                # Remaining key starts with edge - no splitting needed
-                continue
-            else:
-                # Check for partial overlap
-                common_prefix = self._find_common_prefix(remaining_key, edge_label)
-                if common_prefix and len(common_prefix) > 0:
-                    return edge_label, child
-        return None
-    
     def _split_edge_and_insert(self, parent_node: CompressedTrieNode, 
-                              edge_info: Tuple[str, CompressedTrieNode], 
+                              edge_info: Tuple[str, CompressedTrieNode, int], 
                               remaining_key: str, value: T) -> None:
         """
         Split an edge and insert the new key.
@@ -266,62 +289,59 @@ class CompressedTrie(Generic[T]):
         
         Args:
             parent_node: Parent node containing the edge to split
-            edge_info: Tuple of (edge_label, child_node) to split
+            edge_info: Tuple of (edge_label, child_node, common_prefix_length)
+                from _find_insertion_point, so the prefix is not rescanned
             remaining_key: Key to insert
             value: Value for the new key
         """
-        edge_label, child_node = edge_info
+        edge_label, child_node, common_length = edge_info
         
-        if edge_label.startswith(remaining_key):
+        if common_length == len(remaining_key):
             # Case 1: Edge starts with remaining key
             # Split: [remaining_key][suffix] -> [remaining_key][suffix]
-            suffix = edge_label[len(remaining_key):]
+            suffix = self._intern(edge_label[common_length:])
             
             # Create new node for the key
             new_node = CompressedTrieNode(
-                edge_label=remaining_key, 
+                edge_label=self._intern(remaining_key), 
                 is_end=True, 
                 value=value
             )
             
             # Adjust existing child
-            child_node.edge_label = suffix
+            child_node.set_edge_label(suffix)
             
             # Move child under new node
-            new_node.children[suffix] = child_node
+            new_node.children[child_node.first_char] = child_node
             
-            # Replace old edge with new node
-            parent_node.children.pop(edge_label)
-            parent_node.children[remaining_key] = new_node
+            # Replace old edge with new node (same first character)
+            parent_node.children[new_node.first_char] = new_node
             
         else:
-            # Case 2: Partial overlap - find common prefix
-            common_prefix = self._find_common_prefix(remaining_key, edge_label)
-            if common_prefix:
-                # Split at common prefix
-                remaining_suffix = remaining_key[len(common_prefix):]
-                edge_suffix = edge_label[len(common_prefix):]
-                
-                # Create new node for common prefix
-                common_node = CompressedTrieNode(edge_label=common_prefix, is_end=False)
-                
-                # Adjust existing child
-                child_node.edge_label = edge_suffix
-                
-                # Create new node for remaining key
-                new_node = CompressedTrieNode(
-                    edge_label=remaining_suffix,
-                    is_end=True,
-                    value=value
-                )
-                
-                # Set up the tree structure
-                common_node.children[edge_suffix] = child_node
-                common_node.children[remaining_suffix] = new_node
-                
-                # Replace old edge with common node
-                parent_node.children.pop(edge_label)
-                parent_node.children[common_prefix] = common_node
+            # Case 2: Partial overlap - split at the common prefix
+            common_prefix = self._intern(remaining_key[:common_length])
+            remaining_suffix = self._intern(remaining_key[common_length:])
+            edge_suffix = self._intern(edge_label[common_length:])
+            
+            # Create new node for common prefix
+            common_node = CompressedTrieNode(edge_label=common_prefix, is_end=False)
+            
+            # Adjust existing child
+            child_node.set_edge_label(edge_suffix)
+            
+            # Create new node for remaining key
+            new_node = CompressedTrieNode(
+                edge_label=remaining_suffix,
+                is_end=True,
+                value=value
+            )
+            
+            # Set up the tree structure
+            common_node.children[child_node.first_char] = child_node
+            _add_child(common_node, new_node)
+            
+            # Replace old edge with common node (same first character)
+            parent_node.children[common_node.first_char] = common_node
         
         self._size += 1
     
@@ -351,50 +371,122 @@ class CompressedTrie(Generic[T]):
         if not prefix:
             return self._size > 0
         
+        # Walk by offset into the prefix rather than slicing off each
+        # matched edge, so no intermediate strings are allocated
         node = self._root
-        remaining = prefix
+        pos = 0
+        length = len(prefix)
         
-        while remaining:
-            found_match = False
-            for edge_label, child in node.children.items():
-                if remaining.startswith(edge_label):
-                    node = child
-                    remaining = remaining[len(edge_label):]
-                    found_match = True
-                    break
-                elif edge_label.startswith(remaining):
-                    # Prefix matches part of an edge
-                    return True
-            
-            if not found_match:
+        while pos < length:
+            child = node.children.get(prefix[pos])
+            if child is None:
                 return False
+            edge_label = child.edge_label
+            if not prefix.startswith(edge_label, pos):
+                # The prefix must end partway along this edge
+                return edge_label.startswith(prefix[pos:])
+            node = child
+            pos += child.edge_len
         
         return True
     
-    def get_all_with_prefix(self, prefix: str) -> List[Tuple[str, T]]:
+    def starts_with_many(self, prefixes: Iterable[str]) -> List[bool]:
+        """
+        Check many prefixes at once.
+        
+        The distinct prefixes are visited in sorted order, so consecutive
+        queries share as long a common prefix as possible. The nodes matched
+        by the previous walk are kept on a stack, and each query resumes from
+        the deepest one still inside its shared prefix instead of from the
+        root.
+        
+        Args:
+            prefixes: The prefixes to check
+            
+        Returns:
+            One result per prefix, in input order, as starts_with would give
+        """
+        prefixes = list(prefixes)
+        answers: Dict[str, bool] = {}
+        # (characters consumed, node) for each edge matched by the last walk
+        path: List[Tuple[int, CompressedTrieNode]] = [(0, self._root)]
+        previous = self._empty
+        
+        for prefix in sorted(set(prefixes)):
+            common = _common_prefix_len(previous, prefix)
+            while path[-1][0] > common:
+                path.pop()
+            pos, node = path[-1]
+            length = len(prefix)
+            found = self._size > 0
+            
+            while pos < length:
+                child = node.children.get(prefix[pos])
+                if child is None:
+                    found = False
+                    break
+                edge_label = child.edge_label
+                if not prefix.startswith(edge_label, pos):
+                    found = edge_label.startswith(prefix[pos:])
+                    break
+                node = child
+                pos += child.edge_len
+                path.append((pos, node))
+            
+            answers[prefix] = found
+            previous = prefix
+        
+        return [answers[prefix] for prefix in prefixes]
+    
+    def iter_all_with_prefix(self, prefix: str) -> Iterator[Tuple[str, T]]:
+        """
+        Lazily yield all strings that start with the given prefix.
+        
+        Args:
+            prefix: The prefix to search for
+            
+        Yields:
+            (string, value) tuples for all matching strings, in
+            lexicographic order
+        """
+        node = self._root
+        pos = 0
+        length = len(prefix)
+        
+        while pos < length:
+            child = node.children.get(prefix[pos])
+            if child is None:
+                return
+            edge_label = child.edge_label
+            if prefix.startswith(edge_label, pos):
+                # The edge label is a prefix of the remaining prefix
+                node = child
+                pos += child.edge_len
+            elif edge_label.startswith(prefix[pos:]):
+                # The prefix ends partway along this edge
+                yield from self._iter_words(child, prefix[:pos] + edge_label)
+                return
+            else:
+                return
+        
+        yield from self._iter_words(node, prefix)
+    
+    def get_all_with_prefix(self, prefix: str,
+                            max_results: Optional[int] = None) -> List[Tuple[str, T]]:
         """
         Get all strings that start with the given prefix.
         
         Args:
             prefix: The prefix to search for
+            max_results: Stop after this many strings (default: no limit)
             
         Returns:
-            List of (string, value) tuples for all matching strings
+            List of (string, value) tuples for all matching strings, in
+            lexicographic order
         """
-        results = []
-        def dfs(node, path, remaining):
-            if not remaining:
-                self._collect_all_words(node, path, results)
-                return
-            for edge_label, child in node.children.items():
-                if edge_label.startswith(remaining):
-                    # The prefix is a prefix of this edge label
-                    self._collect_all_words(child, path + edge_label, results)
-                elif remaining.startswith(edge_label):
-                    # The edge label is a prefix of the remaining prefix
-                    dfs(child, path + edge_label, remaining[len(edge_label):])
-        dfs(self._root, "", prefix)
-        return results
+        if max_results is not None and max_results <= 0:
+            return []
+        return list(islice(self.iter_all_with_prefix(prefix), max_results))
     
     def autocomplete(self, prefix: str, max_results: int = 10) -> List[str]:
         """
@@ -405,10 +497,14 @@ class CompressedTrie(Generic[T]):
             max_results: Maximum number of suggestions to return
             
         Returns:
-            List of autocomplete suggestions
+            List of autocomplete suggestions (the lexicographically
+            smallest matches)
         """
-        results = self.get_all_with_prefix(prefix)
-        return [s for s, _ in results[:max_results]]
+        if max_results <= 0:
+            return []
+        # Only the first max_results matches are ever collected
+        results = self.get_all_with_prefix(prefix, max_results)
+        return [s for s, _ in results]
     
     def delete(self, key: str) -> bool:
         """
@@ -423,42 +519,56 @@ class CompressedTrie(Generic[T]):
         if not key or self._size == 0:
             return False
         
-        # Find the node
-        node = self._find_node(key)
-        if not node or not node.is_end:
+        # Find the node along with its ancestors
+        path = self._find_path(key)
+        if path is None or not path[-1].is_end:
             return False
         
         # Mark as not end of word
+        node = path[-1]
         node.is_end = False
         node.value = None
         self._size -= 1
         
-        # Merge nodes if possible
-        self._merge_nodes()
+        # Only nodes on the deleted key's path can have become redundant,
+        # so repair them bottom-up instead of sweeping the whole trie
+        for i in range(len(path) - 1, 0, -1):
+            node, parent = path[i], path[i - 1]
+            if node.is_end:
+                break
+            if not node.children:
+                # Dead leaf: unlink it and re-check the parent
+                del parent.children[node.first_char]
+                continue
+            if len(node.children) == 1:
+                # Pass-through node: fold it into its only child
+                (child,) = node.children.values()
+                child.set_edge_label(self._intern(node.edge_label + child.edge_label))
+                parent.children[node.first_char] = child
+            break
         
         return True
     
-    def _find_best_match(self, key: str) -> Tuple[CompressedTrieNode, str]:
-        """Find the best matching node for a key."""
-        node = self._root
-        remaining = key
+    def _find_path(self, key: str) -> Optional[List[CompressedTrieNode]]:
+        """
+        Find the nodes from the root to the node ending exactly at a key.
         
-        while remaining:
-            found_match = False
-            for edge_label, child in node.children.items():
-                if remaining.startswith(edge_label):
-                    node = child
-                    remaining = remaining[len(edge_label):]
-                    found_match = True
-                    break
-                elif edge_label.startswith(remaining):
-                    # Key is a prefix of existing edge
-                    return node, ""
-            
-            if not found_match:
-                break
+        Returns:
+            List of nodes starting with the root, or None if no node ends
+            exactly at the key
+        """
+        path = [self._root]
+        pos = 0
+        length = len(key)
+        
+        while pos < length:
+            child = path[-1].children.get(key[pos])
+            if child is None or not key.startswith(child.edge_label, pos):
+                return None
+            path.append(child)
+            pos += child.edge_len
         
-        return node, remaining
+        return path
     
     def _find_node(self, key: str) -> Optional[CompressedTrieNode]:
         """Find the node corresponding to a key."""
@@ -466,124 +576,267 @@ class CompressedTrie(Generic[T]):
             return self._root
         
         node = self._root
-        remaining = key
+        pos = 0
+        length = len(key)
         
-        while remaining:
-            found_match = False
-            for edge_label, child in node.children.items():
-                if remaining.startswith(edge_label):
-                    node = child
-                    remaining = remaining[len(edge_label):]
-                    found_match = True
-                    break
-                elif edge_label.startswith(remaining):
-                    # Key is a prefix of existing edge
-                    # For exact matches, we need to find the node that ends exactly at this point
-                    # For now, return None to indicate no exact match
-                    return None
-            
-            if not found_match:
+        while pos < length:
+            child = node.children.get(key[pos])
+            if child is None:
+                return None
+            edge_label = child.edge_label
+            if not key.startswith(edge_label, pos):
+                # Either the key ends inside this edge or diverges from it;
+                # neither is an exact match
                 return None
+            node = child
+            pos += child.edge_len
         
         return node
     
-    def _split_node(self, node: CompressedTrieNode, remaining: str, value: T) -> None:
-        """Split a node to accommodate a new string."""
-        old_label = node.edge_label
-        old_is_end = node.is_end
-        old_value = node.value
-        old_children = node.children.copy()
-        
-        # Find common prefix
-        common_prefix = ""
-        for i, (c1, c2) in enumerate(zip(old_label, remaining)):
-            if c1 == c2:
-                common_prefix += c1
-            else:
-                break
+    def _iter_words(self, node: CompressedTrieNode, prefix: str) -> Iterator[Tuple[str, T]]:
+        """
+        Yield all words in the subtree rooted at node, whose path is prefix.
         
-        if not common_prefix:
-            # No common prefix, add as sibling
-            node.children[remaining] = CompressedTrieNode(
-                edge_label=remaining, is_end=True, value=value
-            )
-            return
+        Walks the subtree depth-first with an explicit stack. The current
+        path is kept as a list of edge labels that is truncated on
+        backtrack, so a string is only built for nodes that end a word,
+        and nothing past the last word a caller consumes is visited.
+        """
+        parts = [prefix]
+        stack = [(node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth:
+                # parts[0] is the prefix and parts[i] the label at depth i
+                del parts[depth:]
+                parts.append(node.edge_label)
+            
+            if node.is_end:
+                yield self._empty.join(parts), node.value
+            
+            if node.children:
+                stack.extend((child, depth + 1) for child in reversed(node.children.values()))
+    
+    def __repr__(self) -> str:
+        """String representation of the compressed trie (first 20 strings)."""
+        shown = [f"'{s}'" for s, _ in islice(self.iter_all_with_prefix(self._empty), _REPR_LIMIT + 1)]
+        if len(shown) > _REPR_LIMIT:
+            shown[_REPR_LIMIT:] = ["..."]
+        return f"CompressedTrie({', '.join(shown)})"
+    
+    def get_all_strings(self) -> List[Tuple[str, T]]:
+        """Get all strings stored in the trie."""
+        return self.get_all_with_prefix(self._empty)
+    
+    def freeze(self, alphabet: Optional[str] = None) -> 'FrozenCompressedTrie[T]':
+        """
+        Take a read-only snapshot of the trie in struct-of-arrays form.
         
-        # Create new internal node
-        new_node = CompressedTrieNode(edge_label=common_prefix)
-        node.edge_label = common_prefix
-        node.is_end = False
-        node.value = None
-        node.children.clear()
+        Args:
+            alphabet: Characters every edge may start with. When given,
+                each node's child map becomes a flat table indexed by
+                ``ord(c) - min(ord(alphabet))``, which suits tries over
+                small alphabets such as DNA, hex digits or lowercase ASCII.
         
-        # Add children
-        old_suffix = old_label[len(common_prefix):]
-        new_suffix = remaining[len(common_prefix):]
+        Returns:
+            A FrozenCompressedTrie holding the current strings and values
         
-        if old_suffix:
-            old_child = CompressedTrieNode(
-                edge_label=old_suffix, is_end=old_is_end, value=old_value
-            )
-            old_child.children = old_children
-            node.children[old_suffix] = old_child
+        Raises:
+            ValueError: If alphabet is given for a bytes trie, spans more than
+                256 code points, or misses a character the trie branches on
+        """
+        if alphabet is not None and self._key_type is not str:
+            raise ValueError("alphabet dispatch requires a str trie")
+        return FrozenCompressedTrie(self._root, self._size, alphabet)
+
+
+# Shared child map for every leaf of a FrozenCompressedTrie
+_NO_CHILDREN: Dict[str, int] = {}
+
+# Widest code point range an alphabet child table may cover
+_MAX_ALPHABET_SPAN = 256
+
+
+class FrozenCompressedTrie(Generic[T]):
+    """
+    A static, read-only compressed trie stored as parallel arrays.
+    
+    Instead of one object per node, node i is described by entry i of
+    each array: its edge label, end-of-word flag, value and a map from
+    first character to child index. Lookups walk integer indices, the
+    flags pack into one byte per node, and all leaves share a single
+    empty child map, so a snapshot is far smaller than the node graph.
+    
+    With an alphabet, each child map is instead an ``array('i')`` indexed
+    by code point offset, holding -1 for absent children. A hop is then a
+    subtraction and an array index rather than a dict hash and probe.
+    
+    Args:
+        root: Root node of the CompressedTrie to copy
+        size: Number of strings stored under the root
+        alphabet: Optional characters to build child tables over
+    """
+    
+    def __init__(self, root: CompressedTrieNode, size: int,
+                 alphabet: Optional[str] = None) -> None:
+        self._size = size
+        self._edge_labels: List[str] = []
+        self._edge_lens = array('i')
+        self._is_end = array('b')
+        self._values: List[Optional[T]] = []
+        self._children: List[Dict[str, int]] = []
+        
+        # Preorder numbering with an explicit stack; each entry records the
+        # parent's child map so the new index can be linked in
+        stack: List[Tuple[CompressedTrieNode, Optional[Dict[str, int]]]] = [(root, None)]
+        while stack:
+            node, parent_children = stack.pop()
+            index = len(self._edge_labels)
+            if parent_children is not None:
+                parent_children[node.first_char] = index
+            self._edge_labels.append(node.edge_label)
+            self._edge_lens.append(node.edge_len)
+            self._is_end.append(node.is_end)
+            self._values.append(node.value)
+            if node.children:
+                children: Dict[str, int] = {}
+                self._children.append(children)
+                stack.extend((child, children) for child in reversed(node.children.values()))
+            else:
+                self._children.append(_NO_CHILDREN)
         
-        if new_suffix:
-            node.children[new_suffix] = CompressedTrieNode(
-                edge_label=new_suffix, is_end=True, value=value
-            )
+        self._alphabet = alphabet
+        if alphabet is None:
+            self._descend = self._descend_maps
+            self._child = self._child_from_map
         else:
-            node.is_end = True
-            node.value = value
+            self._build_tables(alphabet)
+            self._descend = self._descend_tables
+            self._child = self._child_from_table
     
-    def _collect_all_words(self, node: CompressedTrieNode, prefix: str, 
-                          results: List, max_results: Optional[int] = None) -> None:
-        """Collect all words starting from a given node."""
-        if node.is_end:
-            # Always collect as (word, value) tuples for consistency
-            results.append((prefix, node.value))
-            
-            if max_results and len(results) >= max_results:
-                return
-        
-        for edge_label, child in node.children.items():
-            if max_results and len(results) >= max_results:
+    def _build_tables(self, alphabet: str) -> None:
+        """Replace every child map with a table indexed by code point offset."""
+        if not alphabet:
+            raise ValueError("alphabet must not be empty")
+        codes = [ord(c) for c in alphabet]
+        self._base = min(codes)
+        self._span = max(codes) - self._base + 1
+        if self._span > _MAX_ALPHABET_SPAN:
+            raise ValueError(f"alphabet spans {self._span} code points; "
+                             f"at most {_MAX_ALPHABET_SPAN} are supported")
+        
+        allowed = set(alphabet)
+        no_children = array('i', [-1]) * self._span
+        tables: List[array] = []
+        for children in self._children:
+            if not children:
+                tables.append(no_children)
+                continue
+            table = array('i', no_children)
+            for char, child in children.items():
+                if char not in allowed:
+                    raise ValueError(f"trie branches on {char!r}, which is not in the alphabet")
+                table[ord(char) - self._base] = child
+            tables.append(table)
+        self._children = tables
+    
+    def _descend_maps(self, key: str) -> Tuple[int, int]:
+        """Follow whole edges along key; return (node index, characters matched)."""
+        edge_labels, edge_lens, children = self._edge_labels, self._edge_lens, self._children
+        index = 0
+        pos = 0
+        length = len(key)
+        while pos < length:
+            child = children[index].get(key[pos], -1)
+            if child < 0 or not key.startswith(edge_labels[child], pos):
                 break
-            self._collect_all_words(child, prefix + edge_label, results, max_results)
-    
-    def _merge_nodes(self) -> None:
-        """Merge nodes with single children to reduce memory usage."""
-        # This is a simplified implementation that removes empty nodes
-        # In practice, you'd want to traverse the entire trie and merge nodes
-        # For now, we'll just clean up nodes that are no longer needed
-        
-        def cleanup_node(node: CompressedTrieNode) -> bool:
-            """Clean up a node and return True if it should be removed."""
-            if not node.is_end and len(node.children) == 0:
-                return True
-            
-            # Clean up children first
-            children_to_remove = []
-            for edge_label, child in node.children.items():
-                if cleanup_node(child):
-                    children_to_remove.append(edge_label)
-            
-            # Remove empty children
-            for edge_label in children_to_remove:
-                del node.children[edge_label]
-            
-            return False
+            index = child
+            pos += edge_lens[child]
+        return index, pos
+    
+    def _descend_tables(self, key: str) -> Tuple[int, int]:
+        """Table-dispatch version of _descend_maps."""
+        edge_labels, edge_lens, tables = self._edge_labels, self._edge_lens, self._children
+        base, span = self._base, self._span
+        index = 0
+        pos = 0
+        length = len(key)
+        while pos < length:
+            code = ord(key[pos]) - base
+            if not 0 <= code < span:
+                break
+            child = tables[index][code]
+            if child < 0 or not key.startswith(edge_labels[child], pos):
+                break
+            index = child
+            pos += edge_lens[child]
+        return index, pos
+    
+    def _child_from_map(self, index: int, char: str) -> int:
+        return self._children[index].get(char, -1)
+    
+    def _child_from_table(self, index: int, char: str) -> int:
+        code = ord(char) - self._base
+        return self._children[index][code] if 0 <= code < self._span else -1
+    
+    def _child_indices(self, index: int) -> List[int]:
+        """Child indices of a node in iteration order."""
+        children = self._children[index]
+        if self._alphabet is None:
+            return list(children.values())
+        return [child for child in children if child >= 0]
+    
+    def __len__(self) -> int:
+        """Return the number of strings stored in the trie."""
+        return self._size
+    
+    def _find(self, key: str) -> int:
+        """Return the index of the node ending exactly at key, or -1."""
+        index, pos = self._descend(key)
+        return index if pos == len(key) else -1
+    
+    def __contains__(self, key: str) -> bool:
+        """Check if a string is stored in the trie."""
+        index = self._find(key)
+        return index >= 0 and bool(self._is_end[index])
+    
+    def __getitem__(self, key: str) -> T:
+        """Get the value associated with a key."""
+        index = self._find(key)
+        if index < 0 or not self._is_end[index]:
+            raise KeyError(f"Key '{key}' not found in compressed trie")
+        return self._values[index]
+    
+    def search(self, key: str) -> Optional[T]:
+        """Return the value associated with a key, or None if not found."""
+        index = self._find(key)
+        return self._values[index] if index >= 0 and self._is_end[index] else None
+    
+    def starts_with(self, prefix: str) -> bool:
+        """Check if any string in the trie starts with the given prefix."""
+        if not prefix:
+            return self._size > 0
         
-        cleanup_node(self._root)
+        index, pos = self._descend(prefix)
+        if pos == len(prefix):
+            return True
+        # The prefix can still end partway along the next edge
+        child = self._child(index, prefix[pos])
+        return child >= 0 and self._edge_labels[child].startswith(prefix[pos:])
     
-    def __repr__(self) -> str:
-        """String representation of the compressed trie."""
-        strings = [f"'{s}'" for s, _ in self.get_all_strings()]
-        return f"CompressedTrie({', '.join(strings)})"
+    def __iter__(self) -> Iterator[Tuple[str, T]]:
+        """Iterate over all (string, value) pairs in depth-first order."""
+        stack = [(0, self._edge_labels[0])]
+        while stack:
+            index, path = stack.pop()
+            if self._is_end[index]:
+                yield path, self._values[index]
+            stack.extend((child, path + self._edge_labels[child])
+                         for child in reversed(self._child_indices(index)))
     
-    def get_all_strings(self) -> List[Tuple[str, T]]:
-        """Get all strings stored in the trie."""
-        return self.get_all_with_prefix("") 
-
+    def __repr__(self) -> str:
+        strings = [f"'{s}'" for s, _ in self]
+        return f"FrozenCompressedTrie({', '.join(strings)})"
 
 
 def main():
@@ -5,16 +5,20 @@ This module provides practical applications demonstrating the use of
 binary heaps and priority queues in real-world scenarios.
 """
 
+import heapq
+import math
 import time
 import random
-from typing import TypeVar, Generic, Optional, List, Callable, Any, Dict, Tuple
+from array import array
+from collections import Counter, deque
+from itertools import chain
+from typing import TypeVar, Generic, Optional, List, Callable, Any, Dict, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from .binary_heap import BinaryHeap
-from .priority_queue import PriorityQueue
 
 T = TypeVar('T')
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task with priority, duration, and metadata."""
     id: int
@@ -27,7 +31,7 @@ class Task:
     def __repr__(self) -> str:
         return f"Task({self.name}, priority={self.priority}, duration={self.duration})"
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """An event with priority, processing time, and type."""
     id: int
@@ -45,13 +49,24 @@ class TaskScheduler:
     A simple task scheduler using priority queues.
     
     This demonstrates a real-world application of priority queues
-    for scheduling tasks with different priorities.
+    for scheduling tasks with different priorities. The queue is a plain
+    list managed by heapq, holding (-priority, task_id, task) entries: the
+    negated priority puts higher priorities first and the increasing task
+    id keeps equal priorities in FIFO order, so tuple comparison never
+    reaches the task itself.
     """
     
-    def __init__(self) -> None:
-        self._queue = PriorityQueue[Task](max_heap=True)  # Use max-heap for higher priority first
+    def __init__(self, history_size: Optional[int] = None) -> None:
+        """
+        Initialize the task scheduler.
+        
+        Args:
+            history_size: If given, only the most recent history_size completed
+                tasks are kept; older ones are evicted automatically
+        """
+        self._queue: List[Tuple[int, int, Task]] = []
         self._task_id_counter = 0
-        self._completed_tasks = []
+        self._completed_tasks: deque = deque(maxlen=history_size)
         self._current_time = 0.0
     
     def add_task(self, task_name: str, priority: int, duration: float = 1.0, 
@@ -69,20 +84,20 @@ class TaskScheduler:
             deadline=deadline
         )
         
-        self._queue.put(task, priority)
+        heapq.heappush(self._queue, (-priority, task_id, task))
         return task_id
     
     def get_next_task(self) -> Optional[Task]:
         """Get the next highest priority task."""
-        if self._queue.is_empty():
+        if not self._queue:
             return None
-        return self._queue.get()
+        return heapq.heappop(self._queue)[2]
     
     def peek_next_task(self) -> Optional[Task]:
         """Peek at the next highest priority task without removing it."""
-        if self._queue.is_empty():
+        if not self._queue:
             return None
-        return self._queue.peek()
+        return self._queue[0][2]
     
     def execute_task(self, task: Task) -> None:
         """Execute a task and update the current time."""
@@ -91,27 +106,38 @@ class TaskScheduler:
     
     def run_scheduler(self, max_tasks: Optional[int] = None) -> List[Task]:
         """Run the scheduler and return completed tasks."""
-        completed = []
-        task_count = 0
-        
-        while not self._queue.is_empty() and (max_tasks is None or task_count < max_tasks):
-            task = self.get_next_task()
-            if task:
-                self.execute_task(task)
-                completed.append(task)
-                task_count += 1
+        queue = self._queue
+        if max_tasks is None:
+            # A full drain pops everything in key order, which is exactly
+            # one sort of the heap list
+            completed = [task for _, _, task in sorted(queue)]
+            queue.clear()
+        else:
+            pop = heapq.heappop
+            completed = [pop(queue)[2] for _ in range(min(max_tasks, len(queue)))]
         
+        # Add durations one at a time, exactly as executing the tasks one by
+        # one would; float sum() compensates rounding on 3.12+ and can differ
+        current_time = self._current_time
+        for task in completed:
+            current_time += task.duration
+        self._current_time = current_time
+        self._completed_tasks.extend(completed)
         return completed
     
     def __len__(self) -> int:
         return len(self._queue)
     
     def is_empty(self) -> bool:
-        return self._queue.is_empty()
+        return not self._queue
+    
+    def get_completed_tasks(self) -> Tuple[Task, ...]:
+        """Get all completed tasks as an immutable snapshot."""
+        return tuple(self._completed_tasks)
     
-    def get_completed_tasks(self) -> List[Task]:
-        """Get all completed tasks."""
-        return self._completed_tasks.copy()
+    def iter_completed(self) -> Iterator[Task]:
+        """Iterate over completed tasks without copying them."""
+        return iter(self._completed_tasks)
     
     def get_current_time(self) -> float:
         """Get the current simulation time."""
@@ -138,88 +164,137 @@ class TopKElements:
         # Use min-heap for largest K, max-heap for smallest K
         heap_type = "min" if find_largest else "max"
         self._heap = BinaryHeap[int](heap_type=heap_type)
+        # Set once K values are held, so the steady state skips len()
+        self._full = False
+        # Cached heap root once K values are held: the value to beat
+        self._threshold: Optional[int] = None
     
     def add(self, value: int) -> None:
         """Add a value to the top K finder."""
-        if len(self._heap) < self.k:
-            self._heap.push(value)
-        else:
-            if self.find_largest:
-                # For largest K: if value > min_heap_root, replace root
-                if value > self._heap.peek():
-                    self._heap.pop()
-                    self._heap.push(value)
-            else:
-                # For smallest K: if value < max_heap_root, replace root
-                if value < self._heap.peek():
-                    self._heap.pop()
-                    self._heap.push(value)
-    
-    def get_top_k(self) -> List[int]:
-        """Get the current top K elements."""
-        result = []
-        temp_heap = BinaryHeap[int](heap_type=self._heap._heap_type)
+        heap = self._heap
+        if not self._full:
+            heap.push(value)
+            if len(heap) >= self.k:
+                self._full = True
+                self._threshold = heap.peek()
+            return
+        
+        # For largest K the threshold is the smallest kept value (min-heap),
+        # for smallest K the largest (max-heap); most values of a long
+        # stream fail this single comparison and never reach the heap
+        if self.find_largest:
+            if value <= self._threshold:
+                return
+        elif value >= self._threshold:
+            return
         
-        # Extract all elements
-        while not self._heap.is_empty():
-            value = self._heap.pop()
-            result.append(value)
-            temp_heap.push(value)
+        heap.pushpop(value)
+        self._threshold = heap.peek()
+    
+    def add_batch(self, values: List[int]) -> None:
+        """
+        Add many values at once.
         
-        # Restore the heap
-        while not temp_heap.is_empty():
-            self._heap.push(temp_heap.pop())
+        A batch of at least K values (or any batch into an empty finder) is
+        merged with a single heapq.nlargest/nsmallest selection over the
+        kept values and the batch, which runs in C, and the result is
+        re-heapified bottom-up in O(K). Smaller batches go through add, so
+        a few stray values never pay for a rebuild.
+        """
+        values = list(values)
+        if len(values) < self.k and not self._heap.is_empty():
+            for value in values:
+                self.add(value)
+            return
         
-        # Sort result appropriately
+        select = heapq.nlargest if self.find_largest else heapq.nsmallest
+        kept = select(self.k, chain(self._heap.snapshot(), values))
+        self._heap.heapify_bottom_up(kept)
+        self._full = len(kept) >= self.k
+        self._threshold = self._heap.peek() if self._full else None
+    
+    def get_top_k(self) -> List[int]:
+        """Get the current top K elements."""
+        # Select from a copy of the heap array; the heap itself is untouched
+        snapshot = self._heap.snapshot()
         if self.find_largest:
-            result.sort(reverse=True)
-        else:
-            result.sort()
-        
-        return result
+            return heapq.nlargest(self.k, snapshot)
+        return heapq.nsmallest(self.k, snapshot)
     
     def clear(self) -> None:
         """Clear all elements."""
         self._heap.clear()
+        self._full = False
+        self._threshold = None
 
 class MedianFinder:
     """
     Find the median of a stream of numbers using two heaps.
     
     This demonstrates how to use heaps to efficiently find the median
-    of a data stream.
+    of a data stream. Both halves are plain lists driven by heapq, whose
+    sift routines run in C; the lower half stores negated numbers so the
+    min-heap root is its largest number.
     """
     
     def __init__(self) -> None:
         """Initialize the median finder with two heaps."""
-        # Max heap for the lower half (smaller numbers)
-        self._lower_heap = BinaryHeap[int](heap_type="max")
+        # Max heap for the lower half (smaller numbers), stored negated
+        self._lower_heap: List[int] = []
         # Min heap for the upper half (larger numbers)
-        self._upper_heap = BinaryHeap[int](heap_type="min")
+        self._upper_heap: List[int] = []
+    
+    @classmethod
+    def from_iterable(cls, nums: Iterable[int]) -> 'MedianFinder':
+        """
+        Create a median finder preloaded with the given numbers.
+        
+        The numbers are sorted once and split at the median, which is much
+        cheaper than feeding them through add_num one at a time.
+        """
+        finder = cls()
+        finder.add_batch(nums)
+        return finder
     
     def add_num(self, num: int) -> None:
         """Add a number to the data stream."""
-        # Always add to lower heap first
-        self._lower_heap.push(num)
+        lower, upper = self._lower_heap, self._upper_heap
         
-        # Balance the heaps
-        if len(self._lower_heap) > len(self._upper_heap) + 1:
-            # Move largest from lower to upper
-            value = self._lower_heap.pop()
-            self._upper_heap.push(value)
-        elif len(self._upper_heap) > len(self._lower_heap):
-            # Move smallest from upper to lower
-            value = self._upper_heap.pop()
-            self._lower_heap.push(value)
+        # Route the number to the half it belongs in; if that half would get
+        # too big, heappushpop moves its root across in the same pass. The
+        # lower half may hold at most one extra number.
+        if not lower or num <= -lower[0]:
+            if len(lower) > len(upper):
+                heapq.heappush(upper, -heapq.heappushpop(lower, -num))
+            else:
+                heapq.heappush(lower, -num)
+        elif len(upper) >= len(lower):
+            heapq.heappush(lower, -heapq.heappushpop(upper, num))
+        else:
+            heapq.heappush(upper, num)
+    
+    def add_batch(self, nums: List[int]) -> None:
+        """
+        Add many numbers to the data stream at once.
+        
+        A batch that is large compared to the numbers already held is merged
+        by sorting everything once and splitting the sorted run at the
+        median; a sorted list already satisfies the heap property, so no
+        heapify is needed. A small batch would make that rebuild cost more
+        than O(m log n) individual insertions, so it is streamed through
+        add_num instead.
+        """
+        nums = list(nums)
+        size = len(self._lower_heap) + len(self._upper_heap)
+        if len(nums) * max(size.bit_length(), 1) < size:
+            for num in nums:
+                self.add_num(num)
+            return
         
-        # Additional balancing: ensure lower heap root <= upper heap root
-        if (not self._lower_heap.is_empty() and not self._upper_heap.is_empty() and
-            self._lower_heap.peek() > self._upper_heap.peek()):
-            # Swap the roots
-            lower_val = self._lower_heap.pop()
-            upper_val = self._upper_heap.pop()
-            self._lower_heap.push(upper_val)
-            self._upper_heap.push(lower_val)
+        ordered = sorted([-num for num in self._lower_heap] + self._upper_heap + nums)
+        mid = (len(ordered) + 1) // 2
+        self._lower_heap = [-num for num in reversed(ordered[:mid])]
+        self._upper_heap = ordered[mid:]
     
     def find_median(self) -> float:
         """Find the median of the current data stream."""
@@ -227,37 +302,17 @@ class MedianFinder:
             raise ValueError("No numbers in the stream")
         
         if len(self._lower_heap) > len(self._upper_heap):
-            return float(self._lower_heap.peek())
+            return float(-self._lower_heap[0])
         elif len(self._upper_heap) > len(self._lower_heap):
-            return float(self._upper_heap.peek())
+            return float(self._upper_heap[0])
         else:
             # Both heaps have same size, return average of roots
-            return (self._lower_heap.peek() + self._upper_heap.peek()) / 2.0
+            return (-self._lower_heap[0] + self._upper_heap[0]) / 2.0
     
     def get_all_numbers(self) -> List[int]:
         """Get all numbers in sorted order."""
-        result = []
-        
-        # Extract from lower heap (max heap, so reverse order)
-        lower_nums = []
-        while not self._lower_heap.is_empty():
-            lower_nums.append(self._lower_heap.pop())
-        
-        # Extract from upper heap (min heap, so correct order)
-        upper_nums = []
-        while not self._upper_heap.is_empty():
-            upper_nums.append(self._upper_heap.pop())
-        
-        # Combine and sort
-        result = sorted(lower_nums + upper_nums)
-        
-        # Restore heaps
-        for num in lower_nums:
-            self._lower_heap.push(num)
-        for num in upper_nums:
-            self._upper_heap.push(num)
-        
-        return result
+        # Sort copies of both heap arrays; the heaps themselves are untouched
+        return sorted([-num for num in self._lower_heap] + self._upper_heap)
 
 class SlidingWindowMax:
     """
@@ -274,7 +329,7 @@ class SlidingWindowMax:
             window_size: Size of the sliding window
         """
         self.window_size = window_size
-        self._deque = []  # Store (value, index) pairs
+        self._deque = deque()  # Store (value, index) pairs
         self._current_index = 0
     
     def add_element(self, value: int) -> Optional[int]:
@@ -286,7 +341,7 @@ class SlidingWindowMax:
         """
         # Remove elements outside the current window
         while self._deque and self._deque[0][1] <= self._current_index - self.window_size:
-            self._deque.pop(0)
+            self._deque.popleft()
         
         # Remove elements smaller than current value from the back
         while self._deque and self._deque[-1][0] <= value:
@@ -310,12 +365,30 @@ class SlidingWindowMax:
             
         Returns:
             List of maximum values for each window
+        
+        Note:
+            This runs the same monotonic-deque update as add_element, inlined
+            with local bindings so a batch pays no per-element method call.
+            The window state is kept, so add_element can continue the stream.
         """
         result = []
+        append_result = result.append
+        window = self._deque
+        popleft, pop, push = window.popleft, window.pop, window.append
+        window_size = self.window_size
+        index = self._current_index
+        
         for value in values:
-            max_val = self.add_element(value)
-            if max_val is not None:
-                result.append(max_val)
+            while window and window[0][1] <= index - window_size:
+                popleft()
+            while window and window[-1][0] <= value:
+                pop()
+            push((value, index))
+            index += 1
+            if index >= window_size:
+                append_result(window[0][0])
+        
+        self._current_index = index
         return result
 
 class EventSimulator:
@@ -323,13 +396,30 @@ class EventSimulator:
     Simulate events with different priorities and processing times.
     
     This demonstrates a more complex real-world scenario using priority queues.
+    Like TaskScheduler, the queue is a heapq-managed list of
+    (-priority, event_id, event) entries.
     """
     
-    def __init__(self) -> None:
-        """Initialize the event simulator."""
-        self._event_queue = PriorityQueue[Event](max_heap=True)
+    def __init__(self, history_size: Optional[int] = None) -> None:
+        """
+        Initialize the event simulator.
+        
+        Args:
+            history_size: If given, only the most recent history_size processed
+                events are kept, and statistics cover just those events
+        """
+        self._event_queue: List[Tuple[int, int, Event]] = []
+        # Priorities of the queued events, kept up to date on every add/process
+        self._priority_counts: Counter = Counter()
         self._current_time = 0.0
-        self._processed_events = []
+        self._processed_events: deque = deque(maxlen=history_size)
+        # Parallel columns of the processed events' type and processing time,
+        # so statistics scan two compact sequences instead of Event objects
+        self._proc_types: deque = deque(maxlen=history_size)
+        if history_size is None:
+            self._proc_times = array('d')
+        else:
+            self._proc_times = deque(maxlen=history_size)
         self._event_id_counter = 0
     
     def add_event(self, event_type: str, priority: int, processing_time: float, 
@@ -347,77 +437,67 @@ class EventSimulator:
             data=data
         )
         
-        self._event_queue.put(event, priority)
+        heapq.heappush(self._event_queue, (-priority, event_id, event))
+        self._priority_counts[priority] += 1
         return event_id
     
     def process_next_event(self) -> Optional[Event]:
         """Process the next highest priority event."""
-        if self._event_queue.is_empty():
+        if not self._event_queue:
             return None
         
-        event = self._event_queue.get()
+        event = heapq.heappop(self._event_queue)[2]
+        self._uncount_priority(event.priority)
         self._current_time += event.processing_time
         self._processed_events.append(event)
+        self._proc_types.append(event.event_type)
+        self._proc_times.append(event.processing_time)
         return event
     
     def run_simulation(self, max_events: Optional[int] = None) -> List[Event]:
         """Run the event simulation."""
-        processed = []
-        event_count = 0
-        
-        while not self._event_queue.is_empty() and (max_events is None or event_count < max_events):
-            event = self.process_next_event()
-            if event:
-                processed.append(event)
-                event_count += 1
+        queue = self._event_queue
+        if max_events is None:
+            # A full drain pops everything in key order, which is exactly
+            # one sort of the heap list
+            processed = [event for _, _, event in sorted(queue)]
+            queue.clear()
+            self._priority_counts.clear()
+        else:
+            pop = heapq.heappop
+            processed = [pop(queue)[2] for _ in range(min(max_events, len(queue)))]
+            for event in processed:
+                self._uncount_priority(event.priority)
         
+        # Add processing times one at a time, exactly as processing the events
+        # one by one would; float sum() compensates rounding on 3.12+
+        current_time = self._current_time
+        for event in processed:
+            current_time += event.processing_time
+        self._current_time = current_time
+        self._processed_events.extend(processed)
+        self._proc_types.extend([event.event_type for event in processed])
+        self._proc_times.extend([event.processing_time for event in processed])
         return processed
     
+    def _uncount_priority(self, priority: int) -> None:
+        """Drop one queued event of the given priority from the counts."""
+        counts = self._priority_counts
+        counts[priority] -= 1
+        if not counts[priority]:
+            del counts[priority]
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get simulation statistics."""
         if not self._processed_events:
             return {}
         
-        event_types = {}
-        total_processing_time = 0.0
-        
-        for event in self._processed_events:
-            event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
-            total_processing_time += event.processing_time
+        total_events = len(self._proc_types)
         
         return {
-            "total_events": len(self._processed_events),
+            "total_events": total_events,
             "total_time": self._current_time,
-            "avg_processing_time": total_processing_time / len(self._processed_events),
-            "event_type_distribution": event_types,
-            "priority_distribution": self._event_queue.get_priority_distribution()
-        } 
-
-
-
-def main():
-    """Main function to demonstrate the module functionality."""
-    print(f"Running applications demonstration...")
-    print("=" * 50)
-
-    # Create instance of Task
-    try:
-        instance = Task()
-        print(f"✓ Created Task instance successfully")
-        print(f"  Instance: {instance}")
-
-        # Demonstrate basic functionality
-        print("Testing basic functionality...")
-        print(f"  Instance type: {type(instance)}")
-    except Exception as e:
-        print(f"✗ Error creating Task instance: {e}")
-        return False
-
-    # Module status
-    print("✓ Module loaded successfully!")
-    print("✓ Ready for interactive use in Pyodide.")
-
-    return True
-
-if __name__ == "__main__":
-    main()
+            "avg_processing_time": math.fsum(self._proc_times) / total_events,
+            "event_type_distribution": dict(Counter(self._proc_types)),
+            "priority_distribution": dict(self._priority_counts)
+        }
@@ -56,6 +56,16 @@ class BinaryHeap(Generic[T]):
         
         if self._heap_type not in ("min", "max"):
             raise ValueError("Heap type must be 'min' or 'max'")
+        
+        # Bind the sift routines for this heap type once, so each level of a
+        # sift is a direct priority comparison rather than a helper call
+        # that re-checks the heap type
+        if self._heap_type == "min":
+            self._sift_up = self._sift_up_min
+            self._sift_down = self._sift_down_min
+        else:
+            self._sift_up = self._sift_up_max
+            self._sift_down = self._sift_down_max
     
     def __len__(self) -> int:
         return len(self._heap)
@@ -71,21 +81,55 @@ class BinaryHeap(Generic[T]):
             item: The item to add
             priority: Priority value (if None, uses key_func or item itself)
         """
-        if priority is None:
-            if self._key_func:
-                priority = self._key_func(item)
-            elif hasattr(item, 'priority'):
-                # Handle PriorityQueueItem and similar objects
-                priority = item.priority
-            elif isinstance(item, (int, float)):
-                priority = item
-            else:
-                raise ValueError("Must provide priority or key_func for non-numeric items")
-        
-        node = HeapNode(priority, item)
+        node = HeapNode(self._resolve_priority(item, priority), item)
         self._heap.append(node)
         self._sift_up(len(self._heap) - 1)
     
+    def pushpop(self, item: T, priority: Optional[int] = None) -> T:
+        """
+        Push an item, then pop and return the highest priority item.
+        
+        This is faster than push followed by pop: if the new item would be
+        popped straight back it is returned without touching the heap,
+        otherwise it replaces the root and a single sift-down restores the
+        heap property.
+        
+        Args:
+            item: The item to add
+            priority: Priority value (if None, uses key_func or item itself)
+            
+        Returns:
+            The highest priority item, which may be the item just pushed
+        """
+        node = HeapNode(self._resolve_priority(item, priority), item)
+        if self.is_empty():
+            return item
+        
+        root = self._heap[0]
+        if self._heap_type == "min":
+            replace = root.priority < node.priority
+        else:
+            replace = root.priority > node.priority
+        if not replace:
+            return item
+        
+        self._heap[0] = node
+        self._sift_down(0)
+        return root.data
+    
+    def _resolve_priority(self, item: T, priority: Optional[int]) -> int:
+        """Work out an item's priority the same way push does."""
+        if priority is not None:
+            return priority
+        if self._key_func:
+            return self._key_func(item)
+        if hasattr(item, 'priority'):
+            # Handle PriorityQueueItem and similar objects
+            return item.priority
+        if isinstance(item, (int, float)):
+            return item
+        raise ValueError("Must provide priority or key_func for non-numeric items")
+    
     def pop(self) -> T:
         """
         Remove and return the highest priority item.
@@ -151,10 +195,6 @@ class BinaryHeap(Generic[T]):
         """Get the right child index of a given index."""
         return 2 * index + 2
     
-    def _has_parent(self, index: int) -> bool:
-        """Check if an index has a parent."""
-        return index > 0
-    
     def _has_left_child(self, index: int) -> bool:
         """Check if an index has a left child."""
         return self._left_child(index) < len(self._heap)
@@ -163,17 +203,6 @@ class BinaryHeap(Generic[T]):
         """Check if an index has a right child."""
         return self._right_child(index) < len(self._heap)
     
-    def _swap(self, index1: int, index2: int) -> None:
-        """Swap two elements in the heap."""
-        self._heap[index1], self._heap[index2] = self._heap[index2], self._heap[index1]
-    
-    def _should_swap_up(self, child_index: int, parent_index: int) -> bool:
-        """Determine if child should swap with parent based on heap type."""
-        if self._heap_type == "min":
-            return self._heap[child_index] < self._heap[parent_index]
-        else:  # max heap
-            return self._heap[child_index] > self._heap[parent_index]
-    
     def _should_swap_down(self, parent_index: int, child_index: int) -> bool:
         """Determine if parent should swap with child based on heap type."""
         if self._heap_type == "min":
@@ -181,27 +210,79 @@ class BinaryHeap(Generic[T]):
         else:  # max heap
             return self._heap[parent_index] < self._heap[child_index]
     
-    def _sift_up(self, index: int) -> None:
-        """Move an element up the heap to restore heap property."""
-        while self._has_parent(index) and self._should_swap_up(index, self._parent(index)):
-            self._swap(index, self._parent(index))
-            index = self._parent(index)
-    
-    def _sift_down(self, index: int) -> None:
-        """Move an element down the heap to restore heap property."""
-        while self._has_left_child(index):
-            # Find the smaller/larger child
-            child_index = self._left_child(index)
-            if (self._has_right_child(index) and 
-                self._should_swap_down(child_index, self._right_child(index))):
-                child_index = self._right_child(index)
+    def _sift_up_min(self, index: int) -> None:
+        """Move an element up a min-heap to restore heap property."""
+        heap = self._heap
+        node = heap[index]
+        priority = node.priority
+        # Shift larger parents down into the hole and place the node once
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not priority < parent.priority:
+                break
+            heap[index] = parent
+            index = parent_index
+        heap[index] = node
+    
+    def _sift_up_max(self, index: int) -> None:
+        """Move an element up a max-heap to restore heap property."""
+        heap = self._heap
+        node = heap[index]
+        priority = node.priority
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not priority > parent.priority:
+                break
+            heap[index] = parent
+            index = parent_index
+        heap[index] = node
+    
+    def _sift_down_min(self, index: int) -> None:
+        """Move an element down a min-heap to restore heap property."""
+        heap = self._heap
+        size = len(heap)
+        node = heap[index]
+        priority = node.priority
+        child_index = 2 * index + 1
+        while child_index < size:
+            # Find the smaller child
+            right_index = child_index + 1
+            if right_index < size and heap[right_index].priority < heap[child_index].priority:
+                child_index = right_index
+            
+            # If the element is already in correct position, stop
+            child = heap[child_index]
+            if not child.priority < priority:
+                break
+            
+            heap[index] = child
+            index = child_index
+            child_index = 2 * index + 1
+        heap[index] = node
+    
+    def _sift_down_max(self, index: int) -> None:
+        """Move an element down a max-heap to restore heap property."""
+        heap = self._heap
+        size = len(heap)
+        node = heap[index]
+        priority = node.priority
+        child_index = 2 * index + 1
+        while child_index < size:
+            # Find the larger child
+            right_index = child_index + 1
+            if right_index < size and heap[right_index].priority > heap[child_index].priority:
+                child_index = right_index
             
-            # If parent is already in correct position, stop
-            if not self._should_swap_down(index, child_index):
+            child = heap[child_index]
+            if not child.priority > priority:
                 break
             
-            self._swap(index, child_index)
+            heap[index] = child
             index = child_index
+            child_index = 2 * index + 1
+        heap[index] = node
     
     def heapify(self, items: List[T], priorities: Optional[List[int]] = None) -> None:
         """
@@ -280,6 +361,15 @@ class BinaryHeap(Generic[T]):
         """Convert heap to a list in priority order."""
         return list(self)
     
+    def snapshot(self) -> List[T]:
+        """
+        Return the heap items in internal array order.
+        
+        Unlike to_list, this does not pop anything: it is a single O(n) copy
+        of the underlying array, so the items are not in priority order.
+        """
+        return [node.data for node in self._heap]
+    
     def clear(self) -> None:
         """Clear all elements from the heap."""
         self._heap.clear()
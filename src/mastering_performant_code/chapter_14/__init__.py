@@ -5,6 +5,7 @@ This module provides implementations of various Bloom filter variants:
 - Basic Bloom Filter
 - Counting Bloom Filter  
 - Scalable Bloom Filter
+- Partitioned Bloom Filter
 - Performance analysis tools
 - Real-world applications
 """
@@ -12,6 +13,7 @@ This module provides implementations of various Bloom filter variants:
 from .bloom_filter import BloomFilter
 from .counting_bloom_filter import CountingBloomFilter
 from .scalable_bloom_filter import ScalableBloomFilter
+from .partitioned_bloom_filter import PartitionedBloomFilter
 from .analyzer import BloomFilterAnalyzer, BloomFilterStats
 from .applications import SpellChecker, WebCache
 from .demo import (
@@ -26,6 +28,7 @@ __all__ = [
     'BloomFilter',
     'CountingBloomFilter', 
     'ScalableBloomFilter',
+    'PartitionedBloomFilter',
     'BloomFilterAnalyzer',
     'BloomFilterStats',
     'SpellChecker',
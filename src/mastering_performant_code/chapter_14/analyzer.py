@@ -289,7 +289,6 @@ class BloomFilterAnalyzer:
             
             # Override hash count for testing
             bf.hash_count = hash_count
-            bf.hash_seeds = bf._generate_hash_seeds(hash_count)
             
             # Generate non-member items
             non_member_items = [f"non_member_{i}" for i in range(len(test_items))]
@@ -6,7 +6,11 @@ can be used in real-world scenarios.
 """
 
 import timeit
-from typing import Any, List, Optional, Tuple, Dict, Set
+import heapq
+from collections import Counter, defaultdict
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Iterator, List, Optional, Tuple, Dict, Set
 from .bloom_filter import BloomFilter
 from .analyzer import BloomFilterAnalyzer
 
@@ -27,14 +31,17 @@ class SpellChecker:
             false_positive_rate: Desired false positive rate
         """
         self.dictionary_words = dictionary_words
-        self.bloom_filter = BloomFilter(
-            expected_elements=len(dictionary_words),
+        
+        # Lowercase the dictionary up front and bulk load it into the filter
+        self.bloom_filter = BloomFilter.from_iterable(
+            [word.lower() for word in dictionary_words],
             false_positive_rate=false_positive_rate
         )
         
-        # Add all dictionary words to Bloom filter
-        for word in dictionary_words:
-            self.bloom_filter.add(word.lower())
+        # Dictionary words bucketed by length, each bucket in dictionary order
+        self._by_length: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        for index, word in enumerate(dictionary_words):
+            self._by_length[len(word)].append((index, word))
     
     def is_correctly_spelled(self, word: str) -> bool:
         """
@@ -60,12 +67,16 @@ class SpellChecker:
         """
         words = text.split()
         results = []
+        # Repeated words are only hashed once per text
+        checked: Dict[str, bool] = {}
         
         for i, word in enumerate(words):
             # Remove punctuation for checking
-            clean_word = ''.join(c for c in word if c.isalpha())
+            clean_word = ''.join(c for c in word if c.isalpha()).lower()
             if clean_word:
-                is_correct = self.is_correctly_spelled(clean_word)
+                is_correct = checked.get(clean_word)
+                if is_correct is None:
+                    is_correct = checked[clean_word] = self.bloom_filter.contains(clean_word)
                 results.append((word, i, is_correct))
         
         return results
@@ -85,16 +96,25 @@ class SpellChecker:
         Returns:
             List of suggested words
         """
-        word_len = len(misspelled_word)
-        suggestions = []
+        similar = self._similar_length_words(len(misspelled_word))
+        return list(islice(similar, max(0, max_suggestions)))
+    
+    def _similar_length_words(self, word_len: int) -> Iterator[str]:
+        """
+        Iterate over dictionary words within two characters of a length.
         
-        for word in self.dictionary_words:
-            if abs(len(word) - word_len) <= 2:  # Similar length
-                suggestions.append(word)
-                if len(suggestions) >= max_suggestions:
-                    break
+        Args:
+            word_len: Length to match
+            
+        Returns:
+            Iterator over the matching words in dictionary order
+        """
+        buckets = [bucket for length in range(word_len - 2, word_len + 3)
+                   if (bucket := self._by_length.get(length))]
         
-        return suggestions
+        # A single bucket is already in order; otherwise merge by index
+        entries = buckets[0] if len(buckets) == 1 else heapq.merge(*buckets)
+        return map(itemgetter(1), entries)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -256,12 +276,11 @@ class DuplicateDetector:
         """
         self.total_items += 1
         
-        if self.bloom_filter.contains(item):
+        # Test and record the item in a single pass over its bits
+        if self.bloom_filter.check_and_add(item):
             self.duplicates_found += 1
             return True
-        else:
-            self.bloom_filter.add(item)
-            return False
+        return False
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -300,14 +319,13 @@ class EmailFilter:
             false_positive_rate: Desired false positive rate
         """
         self.spam_patterns = spam_patterns
-        self.bloom_filter = BloomFilter(
-            expected_elements=len(spam_patterns),
-            false_positive_rate=false_positive_rate
-        )
         
-        # Add spam patterns to Bloom filter
-        for pattern in spam_patterns:
-            self.bloom_filter.add(pattern.lower())
+        # Build the Bloom filter and load the spam patterns in one pass
+        self.bloom_filter = BloomFilter.from_iterable(
+            (pattern.lower() for pattern in spam_patterns),
+            false_positive_rate=false_positive_rate,
+            expected_elements=len(spam_patterns)
+        )
         
         self.emails_processed = 0
         self.spam_detected = 0
@@ -325,11 +343,15 @@ class EmailFilter:
         """
         self.emails_processed += 1
         
-        # Extract words from email content
-        words = email_content.lower().split()
+        # Extract words from email content, hashing each distinct word once
+        word_counts = Counter(email_content.lower().split())
         
-        # Check if any spam patterns are present
-        spam_patterns_found = sum(1 for word in words if self.bloom_filter.contains(word))
+        # Check if any spam patterns are present (repeats count every time)
+        spam_patterns_found = sum(
+            count for count, found in zip(word_counts.values(),
+                                          self.bloom_filter.contains_many(word_counts))
+            if found
+        )
         
         # Consider email spam if multiple patterns are found
         is_spam = spam_patterns_found >= 2
@@ -423,17 +445,17 @@ class URLShortener:
         """
         self.urls_processed += 1
         
-        # Check if URL already exists
-        if self.bloom_filter.contains(original_url):
+        # Check if URL already exists, adding it in the same pass if not; the
+        # filter's hash of the URL doubles as a stable short ID
+        url_hash, h2 = BloomFilter.hash_pair(original_url)
+        was_present = self.bloom_filter.check_and_add_hashes(url_hash, h2)
+        if was_present:
             self.duplicates_found += 1
             # In a real implementation, you would return the existing short URL
-            return f"duplicate_{hash(original_url) % 10000}"
-        
-        # Add URL to Bloom filter
-        self.bloom_filter.add(original_url)
+            return f"duplicate_{url_hash % 10000}"
         
         # Generate short URL
-        short_url = f"short_{hash(original_url) % 10000}"
+        short_url = f"short_{url_hash % 10000}"
         self.url_mappings[short_url] = original_url
         
         return short_url
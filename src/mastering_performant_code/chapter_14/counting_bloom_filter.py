@@ -7,6 +7,8 @@ by using counters instead of boolean flags.
 
 import math
 import hashlib
+from array import array
+from collections import Counter
 from typing import Any, List, Optional, Tuple, Dict
 
 class CountingBloomFilter:
@@ -22,7 +24,8 @@ class CountingBloomFilter:
         max_count (int): Maximum count per bit
         size (int): Size of the counter array
         hash_count (int): Number of hash functions
-        counter_array (List[int]): Internal counter array
+        counter_array (array): Internal counter array, using the smallest
+            unsigned type code that holds max_count
         element_count (int): Number of elements currently in the filter
         hash_seeds (List[int]): Seeds for hash functions
     """
@@ -55,12 +58,38 @@ class CountingBloomFilter:
         self.size = self._calculate_optimal_size(expected_elements, false_positive_rate)
         self.hash_count = self._calculate_optimal_hash_count(expected_elements, self.size)
         
-        # Initialize counter array
-        self.counter_array = [0] * self.size
+        # Initialize counter array with the narrowest counters max_count fits in
+        self._typecode = self._counter_typecode(max_count)
+        self.counter_array = self._new_counter_array()
         self.element_count = 0
         
         # Pre-compute hash function seeds
         self.hash_seeds = self._generate_hash_seeds(self.hash_count)
+        self._seed_hashers = self._new_seed_hashers()
+    
+    @staticmethod
+    def _counter_typecode(max_count: int) -> str:
+        """
+        Pick the smallest unsigned array type code that can hold max_count.
+        
+        Args:
+            max_count: Maximum count per counter
+            
+        Returns:
+            array type code
+        """
+        for typecode in 'BHIQ':
+            if max_count < 1 << (8 * array(typecode).itemsize):
+                return typecode
+        raise ValueError("Max count must fit in an unsigned 64-bit counter")
+    
+    def _new_counter_array(self) -> array:
+        """Create a zeroed counter array of the filter's size."""
+        return array(self._typecode, bytes(self.size * array(self._typecode).itemsize))
+    
+    def _new_seed_hashers(self) -> List[Any]:
+        """Return one MD5 state per seed with the "seed:" prefix already absorbed."""
+        return [hashlib.md5(f"{seed}:".encode()) for seed in self.hash_seeds]
     
     def _calculate_optimal_size(self, n: int, p: float) -> int:
         """
@@ -110,13 +139,14 @@ class CountingBloomFilter:
         Returns:
             List of bit positions
         """
-        item_str = str(item)
+        # Encode the item once; each seed's hasher only has to absorb it
+        item_bytes = str(item).encode()
         positions = []
         
-        for seed in self.hash_seeds:
-            hash_obj = hashlib.md5()
-            hash_obj.update(f"{seed}:{item_str}".encode())
-            hash_value = int(hash_obj.hexdigest(), 16)
+        for seeded in self._seed_hashers:
+            hash_obj = seeded.copy()
+            hash_obj.update(item_bytes)
+            hash_value = int.from_bytes(hash_obj.digest(), 'big')
             positions.append(hash_value % self.size)
         
         return positions
@@ -133,9 +163,16 @@ class CountingBloomFilter:
         """
         positions = self._hash_functions(item)
         
-        # Check if adding would cause overflow
-        for pos in positions:
-            if self.counter_array[pos] >= self.max_count:
+        # Check if adding would cause overflow. Two hash functions can pick
+        # the same counter, which then takes several increments; a counter
+        # below max_count may pass it that way, but never the largest value
+        # its array type can store, so check every counter before touching any
+        counter_array = self.counter_array
+        type_max = (1 << (8 * counter_array.itemsize)) - 1
+        increments = Counter(positions)
+        for pos, times in increments.items():
+            count = counter_array[pos]
+            if count >= self.max_count or count + times > type_max:
                 return False
         
         # Check if item is already in the filter
@@ -163,8 +200,10 @@ class CountingBloomFilter:
         """
         positions = self._hash_functions(item)
         
-        # Check if item is in the filter
-        if not all(self.counter_array[pos] > 0 for pos in positions):
+        # Check if item is in the filter, and that a counter picked by several
+        # hash functions can take every decrement without going below zero
+        decrements = Counter(positions)
+        if not all(self.counter_array[pos] >= times for pos, times in decrements.items()):
             return False
         
         # Decrement counters
@@ -195,8 +234,18 @@ class CountingBloomFilter:
         Returns:
             True if item is probably in the set, False if definitely not
         """
-        positions = self._hash_functions(item)
-        return all(self.counter_array[pos] > 0 for pos in positions)
+        # Hash one position at a time and stop at the first zero counter, so
+        # a miss usually costs one or two MD5s instead of hash_count of them
+        item_bytes = str(item).encode()
+        counter_array = self.counter_array
+        size = self.size
+        
+        for seeded in self._seed_hashers:
+            hash_obj = seeded.copy()
+            hash_obj.update(item_bytes)
+            if not counter_array[int.from_bytes(hash_obj.digest(), 'big') % size]:
+                return False
+        return True
     
     def get_false_positive_rate(self) -> float:
         """
@@ -219,9 +268,10 @@ class CountingBloomFilter:
         Get memory usage in bytes.
         
         Returns:
-            Memory usage in bytes (each counter is 1 byte)
+            Memory usage in bytes of the counter storage
         """
-        return len(self.counter_array)  # Each counter is 1 byte
+        counter_array = self.counter_array
+        return len(counter_array) * counter_array.itemsize
     
     def get_load_factor(self) -> float:
         """
@@ -282,9 +332,22 @@ class CountingBloomFilter:
     
     def clear(self) -> None:
         """Clear all elements from the counting Bloom filter."""
-        self.counter_array = [0] * self.size
+        self.counter_array = self._new_counter_array()
         self.element_count = 0
     
+    def __getstate__(self) -> dict:
+        """Return the filter's state for pickling, without the MD5 states."""
+        # hashlib objects cannot be pickled; they are rebuilt from hash_seeds
+        # in __setstate__
+        state = self.__dict__.copy()
+        del state['_seed_hashers']
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled filter and rebuild its MD5 states."""
+        self.__dict__.update(state)
+        self._seed_hashers = self._new_seed_hashers()
+    
     def __len__(self) -> int:
         """Return the number of elements in the counting Bloom filter."""
         return self.element_count
@@ -0,0 +1,242 @@
+"""
+Partitioned Bloom Filter Implementation
+
+This module provides a Bloom filter variant whose bit array is split into one
+equal slice per hash function, so every hash function owns its own bits.
+"""
+
+import math
+from typing import Any, Iterable, List, Tuple
+from .bloom_filter import BloomFilter
+
+class PartitionedBloomFilter(BloomFilter):
+    """
+    A Bloom filter with one bit-array partition per hash function.
+
+    The m bits are divided into k partitions of m // k bits, and the i-th
+    hash function only ever sets or tests a bit in partition i. Each item
+    therefore sets exactly k distinct bits, the hash functions never
+    interfere with one another, and the k tests of a lookup are independent
+    of each other, which is the layout vectorized Bloom filters use to test
+    all k bits with a single wide compare.
+
+    Parameters, statistics and the packed bit array are shared with
+    BloomFilter; only the placement of the bits differs. Any bits left over
+    when m is not a multiple of k are never used.
+    """
+
+    def _partition_bits(self) -> int:
+        """Get the number of bits in each partition."""
+        return max(1, self.size // self.hash_count)
+
+    def _calculate_optimal_size(self, n: int, p: float) -> int:
+        """
+        Calculate the bit array size for given parameters.
+
+        Partitions are not confined to cache-line blocks, so the classic
+        m = -n * ln(p) / (ln(2)^2) needs no blocking compensation; it is
+        only rounded like BloomFilter's size.
+
+        Args:
+            n: Expected number of elements
+            p: Desired false positive rate
+
+        Returns:
+            Size of the bit array
+        """
+        return self._round_size(int(-n * math.log(p) / (math.log(2) ** 2)))
+
+    def _estimate_false_positive_rate(self, n: float, m: int, k: int) -> float:
+        """
+        Estimate the false positive rate of the partitioned layout.
+
+        Each item sets one bit in each of k partitions of m // k bits, so
+        the rate is (1 - (1 - k/m)^n)^k, with no per-block load variance.
+
+        Args:
+            n: Number of items
+            m: Size of the bit array
+            k: Number of hash functions
+
+        Returns:
+            Estimated false positive rate
+        """
+        part = max(1, m // k)
+        return (1 - (1 - 1 / part) ** n) ** k
+
+    def _locate_partitioned(self, item: Any) -> Tuple[int, int, int]:
+        """
+        Hash an item once and derive its probe sequence.
+
+        Args:
+            item: Item to hash
+
+        Returns:
+            Tuple of (partition size in bits, start, step)
+        """
+        return self._place_partitioned(*self.hash_pair(item))
+
+    def _place_partitioned(self, h1: int, h2: int) -> Tuple[int, int, int]:
+        """
+        Map an item's hash pair to its probe sequence.
+
+        Args:
+            h1: First 64-bit hash
+            h2: Second 64-bit hash
+
+        Returns:
+            Tuple of (partition size in bits, start, step)
+        """
+        part = self._partition_bits()
+        return part, h1 % part, h2 % part
+
+    def _positions(self, h1: int, h2: int) -> List[int]:
+        """
+        Bit positions of an already hashed item.
+
+        The i-th position is i * part + (x + i * y + (i^3 - i) / 6) mod part,
+        enhanced double hashing offset into the i-th partition. Partitions
+        are large enough that x and y alone keep probe sequences apart.
+
+        Args:
+            h1: First hash from hash_pair
+            h2: Second hash from hash_pair
+
+        Returns:
+            List of bit positions, one per partition
+        """
+        part, x, y = self._place_partitioned(h1, h2)
+
+        positions = []
+        base = 0
+        for i in range(self.hash_count):
+            positions.append(base + x)
+            base += part
+            x = (x + y) % part
+            y = (y + i + 1) % part
+
+        return positions
+
+    def add(self, item: Any) -> None:
+        """
+        Add an item to the Bloom filter.
+
+        Args:
+            item: Item to add (will be converted to string for hashing)
+        """
+        part, x, y = self._locate_partitioned(item)
+        bit_array = self.bit_array
+        base = 0
+        for i in range(self.hash_count):
+            pos = base + x
+            bit_array[pos >> 3] |= 1 << (pos & 7)
+            base += part
+            x = (x + y) % part
+            y = (y + i + 1) % part
+        self.element_count += 1
+
+    def contains(self, item: Any) -> bool:
+        """
+        Check if an item is in the Bloom filter.
+
+        Args:
+            item: Item to check
+
+        Returns:
+            True if item is probably in the set, False if definitely not
+        """
+        return self.contains_hashes(*self.hash_pair(item))
+
+    def contains_hashes(self, h1: int, h2: int) -> bool:
+        """
+        Check an already hashed item against the Bloom filter.
+
+        Args:
+            h1: First hash from hash_pair
+            h2: Second hash from hash_pair
+
+        Returns:
+            True if the item is probably in the set, False if definitely not
+        """
+        part, x, y = self._place_partitioned(h1, h2)
+        bit_array = self.bit_array
+        base = 0
+        for i in range(self.hash_count):
+            pos = base + x
+            if not bit_array[pos >> 3] >> (pos & 7) & 1:
+                return False
+            base += part
+            x = (x + y) % part
+            y = (y + i + 1) % part
+        return True
+
+    def check_and_add(self, item: Any) -> bool:
+        """
+        Add an item unless it is probably present already.
+
+        Args:
+            item: Item to check and add
+
+        Returns:
+            True if the item was probably present before, False if it was new
+        """
+        return self.check_and_add_hashes(*self.hash_pair(item))
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """
+        Add several items to the Bloom filter.
+
+        Args:
+            items: Items to add
+        """
+        add = self.add
+        for item in items:
+            add(item)
+
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """
+        Check several items against the Bloom filter.
+
+        Args:
+            items: Items to check
+
+        Returns:
+            List with one membership result per item, in order
+        """
+        contains = self.contains
+        return [contains(item) for item in items]
+
+    def __repr__(self) -> str:
+        """String representation of the partitioned Bloom filter."""
+        return (f"PartitionedBloomFilter(expected_elements={self.expected_elements}, "
+                f"size={self.size}, hash_count={self.hash_count}, "
+                f"elements={self.element_count})")
+
+
+
+def main():
+    """Main function to demonstrate the module functionality."""
+    print(f"Running partitioned_bloom_filter demonstration...")
+    print("=" * 50)
+
+    # Create instance of PartitionedBloomFilter
+    try:
+        instance = PartitionedBloomFilter(expected_elements=1000)
+        print(f"✓ Created PartitionedBloomFilter instance successfully")
+        print(f"  Instance: {instance}")
+
+        # Demonstrate basic functionality
+        print("Testing basic functionality...")
+        print(f"  Instance type: {type(instance)}")
+    except Exception as e:
+        print(f"✗ Error creating PartitionedBloomFilter instance: {e}")
+        return False
+
+    # Module status
+    print("✓ Module loaded successfully!")
+    print("✓ Ready for interactive use in Pyodide.")
+
+    return True
+
+if __name__ == "__main__":
+    main()
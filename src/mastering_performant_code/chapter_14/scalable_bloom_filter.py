@@ -7,8 +7,50 @@ more elements while maintaining good space efficiency.
 
 import math
 import hashlib
-from typing import Any, List, Optional, Tuple, Dict
-from .bloom_filter import BloomFilter
+from array import array
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Dict
+from .bloom_filter import BloomFilter, _BLOCK_BYTES
+
+
+def _make_probe(layout: Tuple[Tuple[int, int, int, range], ...]
+                ) -> Callable[[bytearray, int, int], bool]:
+    """
+    Build a contains function over every sub-filter of a scalable filter.
+    
+    The geometry of each sub-filter is captured as closure constants, so a
+    lookup reads no instance attributes or metadata arrays. Positions come
+    from one hash pair by the same extended double hashing the BloomFilter
+    kernels use, so only two hashes are computed per item
+    whatever the number of filters and hash functions.
+    
+    Args:
+        layout: One (byte offset, block count, block mask, hash steps) entry
+            per sub-filter, in probe order
+        
+    Returns:
+        Function taking (bits, h1, h2) and returning True if any sub-filter
+        has all of the item's bits set
+    """
+    def probe(bits: bytearray, h1: int, h2: int) -> bool:
+        for offset, block_count, mask, steps in layout:
+            start = offset + ((h1 * block_count) >> 64) * _BLOCK_BYTES
+            x = h1 & mask
+            y = h2 & mask
+            z = (h2 >> 21) & mask
+            w = (h2 >> 42) & mask
+            for step in steps:
+                bit_pos = x & mask
+                if not bits[start + (bit_pos >> 3)] >> (bit_pos & 7) & 1:
+                    break
+                x += y
+                y += z
+                z += w
+                w += step
+            else:
+                return True
+        return False
+    
+    return probe
 
 class ScalableBloomFilter:
     """
@@ -16,13 +58,17 @@ class ScalableBloomFilter:
     
     This implementation maintains multiple Bloom filters with increasing
     false positive rates, providing better space efficiency for growing datasets.
+    Every sub-filter is a blocked BloomFilter, so an item's bits in one
+    sub-filter all fall in a single 512-bit block and a lookup reads at
+    most one cache line per sub-filter.
     
     Attributes:
         initial_capacity (int): Initial expected number of elements
         initial_false_positive_rate (float): Initial false positive rate
         growth_factor (float): Factor by which capacity grows
         scale_factor (float): Factor by which false positive rate decreases
-        filters (List[BloomFilter]): List of Bloom filters
+        filters (List[BloomFilter]): List of Bloom filters, whose bit arrays
+            are views into one shared buffer
         current_capacity (int): Current capacity for new filters
         current_false_positive_rate (float): Current false positive rate for new filters
     """
@@ -55,21 +101,113 @@ class ScalableBloomFilter:
         self.growth_factor = growth_factor
         self.scale_factor = scale_factor
         
-        # Initialize filter list
+        # Initialize filter list and the shared bit storage
         self.filters = []
+        self._reset_storage()
         self.current_capacity = initial_capacity
         self.current_false_positive_rate = false_positive_rate
         
         # Create first filter
         self._add_filter()
     
+    def _reset_storage(self) -> None:
+        """
+        Empty the shared bit buffer and the per-filter geometry arrays.
+        
+        All sub-filters live back to back in the single bytearray _bits.
+        Filter i starts at byte _offsets[i] and is split into
+        _block_counts[i] blocks; _masks[i] reduces positions within a block
+        and _hash_counts[i] is its number of hash functions. contains runs
+        a kernel built from these arrays instead of calling into each
+        BloomFilter.
+        
+        Only the newest filter receives adds, so the others are sealed:
+        _sealed_no_false_positive and _sealed_elements fold in their
+        (1 - p) factors and element counts once, when they stop growing.
+        """
+        self._bits = bytearray()
+        self._offsets = array('q')
+        self._block_counts = array('q')
+        self._masks = array('q')
+        self._hash_counts = array('i')
+        self._probe = _make_probe(())
+        self._sealed_no_false_positive = 1.0
+        self._sealed_elements = 0
+    
     def _add_filter(self) -> None:
         """Add a new Bloom filter to the scalable filter."""
         filter_bf = BloomFilter(
             expected_elements=self.current_capacity,
             false_positive_rate=self.current_false_positive_rate
         )
+        
+        # The current newest filter is sealed from here on
+        if self.filters:
+            sealed = self.filters[-1]
+            self._sealed_no_false_positive *= 1 - sealed.get_false_positive_rate()
+            self._sealed_elements += sealed.element_count
+        
+        # Append the new filter's bits to the shared buffer. The buffer cannot
+        # be resized while views into it exist, so build a new one and point
+        # every filter at its slice; filters grow geometrically, so the copy
+        # is amortized over the elements that filled the previous ones.
+        self._offsets.append(len(self._bits))
+        self._block_counts.append(filter_bf._block_count)
+        self._masks.append(filter_bf._block_bits - 1)
+        self._hash_counts.append(filter_bf.hash_count)
         self.filters.append(filter_bf)
+        
+        self._attach(self._bits + filter_bf.bit_array)
+    
+    def _attach(self, bits: bytearray) -> None:
+        """
+        Make bits the shared buffer and point every sub-filter into it.
+        
+        Each filter's bit_array becomes a view of its slice of bits, and the
+        probe kernel is rebuilt for the current layout.
+        
+        Args:
+            bits: Buffer holding every sub-filter's bits at _offsets
+        """
+        view = memoryview(bits)
+        for bf, offset in zip(self.filters, self._offsets):
+            bf.bit_array = view[offset:offset + (bf.size + 7) // 8]
+        self._bits = bits
+        # Probe the newest filter first: it holds the most recently added
+        # items, so lookups with temporal locality stop after one filter
+        self._probe = _make_probe(tuple(
+            (offset, block_count, mask, range(1, hash_count + 1))
+            for offset, block_count, mask, hash_count in zip(
+                reversed(self._offsets), reversed(self._block_counts),
+                reversed(self._masks), reversed(self._hash_counts))))
+    
+    def __getstate__(self) -> dict:
+        """
+        Return the filter's state for pickling.
+        
+        Memoryviews and the probe closure cannot be pickled, so the shared
+        buffer is saved once and each sub-filter is saved without its view.
+        """
+        state = self.__dict__.copy()
+        del state['_probe']
+        filter_states = []
+        for bf in self.filters:
+            filter_state = bf.__getstate__()
+            del filter_state['bit_array']
+            filter_states.append((type(bf), filter_state))
+        state['filters'] = filter_states
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled filter and re-slice its sub-filters' views."""
+        filters = []
+        for cls, filter_state in state.pop('filters'):
+            bf = cls.__new__(cls)
+            bf.__setstate__(filter_state)
+            filters.append(bf)
+        self.__dict__.update(state)
+        self.filters = filters
+        self._attach(self._bits)
     
     def _should_add_filter(self) -> bool:
         """
@@ -111,7 +249,24 @@ class ScalableBloomFilter:
         Returns:
             True if item is probably in any of the filters
         """
-        return any(bf.contains(item) for bf in self.filters)
+        # Every sub-filter derives its positions from the same hash pair, so
+        # hash the item once and probe each filter's region of _bits
+        return self._probe(self._bits, *BloomFilter.hash_pair(item))
+    
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """
+        Check several items against the scalable Bloom filter.
+        
+        Args:
+            items: Items to check
+            
+        Returns:
+            List with one membership result per item, in order
+        """
+        probe = self._probe
+        bits = self._bits
+        hash_pair = BloomFilter.hash_pair
+        return [probe(bits, *hash_pair(item)) for item in items]
     
     def get_false_positive_rate(self) -> float:
         """
@@ -126,10 +281,9 @@ class ScalableBloomFilter:
         if not self.filters:
             return 0.0
         
-        # Calculate probability of false positive across all filters
-        prob_no_false_positive = 1.0
-        for bf in self.filters:
-            prob_no_false_positive *= (1 - bf.get_false_positive_rate())
+        # Sealed filters no longer change, so only the newest one is live
+        prob_no_false_positive = self._sealed_no_false_positive
+        prob_no_false_positive *= (1 - self.filters[-1].get_false_positive_rate())
         
         return 1 - prob_no_false_positive
     
@@ -140,7 +294,7 @@ class ScalableBloomFilter:
         Returns:
             Total memory usage across all filters
         """
-        return sum(bf.get_memory_usage() for bf in self.filters)
+        return len(self._bits)
     
     def get_total_elements(self) -> int:
         """
@@ -149,7 +303,7 @@ class ScalableBloomFilter:
         Returns:
             Total number of elements
         """
-        return sum(len(bf) for bf in self.filters)
+        return self._sealed_elements + self.filters[-1].element_count
     
     def get_filter_stats(self) -> List[Dict[str, Any]]:
         """
@@ -229,6 +383,7 @@ class ScalableBloomFilter:
     def clear(self) -> None:
         """Clear all elements from the scalable Bloom filter."""
         self.filters = []
+        self._reset_storage()
         self.current_capacity = self.initial_capacity
         self.current_false_positive_rate = self.initial_false_positive_rate
         self._add_filter()
@@ -0,0 +1,552 @@
+"""
+Unit tests for the B-Tree backed database indexes.
+
+This module tests DatabaseIndex, MultiValueIndex and TimestampedIndex,
+covering point lookups, deletions, range queries and bookkeeping.
+"""
+
+import pytest
+
+from mastering_performant_code.chapter_09.database_index import (
+    DatabaseIndex, FrozenDatabaseIndex, IndexEntry, MultiValueIndex, TimestampedIndex
+)
+
+
+class TestDatabaseIndex:
+    """Test cases for DatabaseIndex."""
+
+    def test_empty_index(self):
+        """Test empty index properties."""
+        index = DatabaseIndex[int, str]()
+        assert len(index) == 0
+        assert index.is_empty()
+        assert index.get(1) is None
+        assert 1 not in index
+        assert repr(index) == "DatabaseIndex()"
+
+    def test_insert_and_get(self):
+        """Test inserting and looking up keys."""
+        index = DatabaseIndex[int, str](min_degree=2)
+        for i in range(100):
+            index.insert(i, f"value{i}")
+
+        assert len(index) == 100
+        for i in range(100):
+            assert index.get(i) == f"value{i}"
+        assert index.get(100) is None
+
+    def test_get_uses_tree_search(self):
+        """Test that lookups descend the tree instead of traversing it."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(50):
+            index.insert(i, i)
+
+        def fail():
+            raise AssertionError("inorder traversal used for a point lookup")
+
+        index.btree.inorder_traversal = fail
+        assert index.get(25) == 25
+        assert 30 in index
+        assert index.delete(10)
+        assert index.get(10) is None
+
+    def test_node_search_compares_raw_keys(self, monkeypatch):
+        """Test that in-node searches bisect on raw keys, not IndexEntry.__lt__."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(50):
+            index.insert(i, i)
+
+        def fail(self, other):
+            raise AssertionError("IndexEntry.__lt__ used for a tree search")
+
+        monkeypatch.setattr(IndexEntry, "__lt__", fail)
+        assert index.get(17) == 17
+        assert index.range_query(5, 7) == [(5, 5), (6, 6), (7, 7)]
+        assert index.delete(17)
+        index.insert(17, 170)
+        assert index.get(17) == 170
+
+    def test_key_type_rejects_mixed_keys(self):
+        """Test that a declared key type is enforced before touching the tree."""
+        index = DatabaseIndex[int, str](key_type=int)
+        index.insert(1, "a")
+        with pytest.raises(TypeError):
+            index.insert("2", "b")
+        with pytest.raises(TypeError):
+            DatabaseIndex[int, str](key_type=int).bulk_insert([(1, "a"), ("2", "b")])
+        assert len(index) == 1
+        assert index.get_all() == [(1, "a")]
+
+    def test_contains_with_none_value(self):
+        """Test that a key stored with a None value is still found."""
+        index = DatabaseIndex[str, object]()
+        index.insert("a", None)
+        assert "a" in index
+        assert "b" not in index
+
+    def test_delete(self):
+        """Test deleting keys."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(20):
+            index.insert(i, i * 10)
+
+        assert index.delete(5)
+        assert not index.delete(5)
+        assert not index.delete(100)
+        assert len(index) == 19
+        assert 5 not in index
+        assert index.get(6) == 60
+
+    def test_delete_all_in_random_order(self):
+        """Test deletions that force node merges and borrows."""
+        import random
+        keys = list(range(200))
+        index = DatabaseIndex[int, int](min_degree=2)
+        for key in keys:
+            index.insert(key, key)
+
+        random.Random(42).shuffle(keys)
+        for count, key in enumerate(keys, 1):
+            assert index.delete(key)
+            assert key not in index
+            assert len(index) == len(keys) - count
+        assert index.is_empty()
+        assert index.btree.root is None
+
+    def test_bulk_insert_builds_valid_tree(self):
+        """Test bulk loading into an empty index."""
+        import random
+        items = [(i, f"value{i}") for i in range(500)]
+        random.Random(7).shuffle(items)
+        index = DatabaseIndex.from_items(items, min_degree=3)
+
+        assert len(index) == 500
+        assert index.get_all() == sorted(items)
+        assert index.btree.get_height() <= 4
+        assert index.get(123) == "value123"
+        assert index.delete(123)
+        index.insert(1000, "late")
+        assert index.get(1000) == "late"
+        assert len(index) == 500
+
+    def test_bulk_insert_into_populated_index(self):
+        """Test that bulk inserts into a non-empty index keep existing keys."""
+        index = DatabaseIndex[int, int]()
+        index.insert(0, 0)
+        index.bulk_insert((i, i) for i in range(1, 50))
+        assert len(index) == 50
+        assert [key for key, _ in index.get_all()] == list(range(50))
+
+    @pytest.mark.parametrize("numeric_keys", [False, True])
+    def test_range_query_iter_matches_range_query(self, numeric_keys):
+        """Test that the lazy range query yields the same pairs as the eager one."""
+        import random
+        rng = random.Random(5)
+        index = DatabaseIndex[int, int](min_degree=2, numeric_keys=numeric_keys)
+        for key in rng.sample(range(1000), 300):
+            index.insert(key, -key)
+
+        for _ in range(50):
+            start = rng.randint(-10, 1010)
+            end = rng.randint(start - 5, 1010)
+            assert list(index.range_query_iter(start, end)) == index.range_query(start, end)
+        assert list(DatabaseIndex[int, int]().range_query_iter(0, 10)) == []
+
+    @pytest.mark.parametrize("numeric_keys", [False, True])
+    def test_parallel_bulk_insert(self, numeric_keys):
+        """Test that sharded bulk loading matches a sequential bulk load."""
+        import random
+        items = [(i, i * 2) for i in range(1000)]
+        random.Random(11).shuffle(items)
+        index = DatabaseIndex[int, int](numeric_keys=numeric_keys)
+        index.parallel_bulk_insert(items, n_shards=4)
+
+        assert len(index) == 1000
+        assert index.get_all() == sorted(items)
+        assert index.range_query(10, 12) == [(10, 20), (11, 22), (12, 24)]
+
+        index.parallel_bulk_insert([(1000, 0), (1001, 0)], n_shards=4)
+        assert len(index) == 1002
+
+    @pytest.mark.parametrize("numeric_keys", [False, True])
+    def test_tree_backends_agree(self, numeric_keys):
+        """Test the object-backed and array-backed trees through the index API."""
+        import random
+        rng = random.Random(3)
+        index = DatabaseIndex[int, str](min_degree=2, numeric_keys=numeric_keys)
+        expected = {}
+        for _ in range(500):
+            key = rng.randint(0, 300)
+            if key in expected:
+                assert index.delete(key)
+                del expected[key]
+            else:
+                index.insert(key, str(key))
+                expected[key] = str(key)
+
+        assert len(index) == len(expected)
+        assert index.get_all() == sorted(expected.items())
+        assert index.range_query(50, 60) == [(k, v) for k, v in sorted(expected.items()) if 50 <= k <= 60]
+        for key in range(0, 301, 7):
+            assert index.get(key) == expected.get(key)
+            assert (key in index) == (key in expected)
+        assert index.get_stats()['size'] == len(expected)
+
+    def test_numeric_keys_bulk_insert(self):
+        """Test bulk loading an array-backed index."""
+        index = DatabaseIndex.from_items([(i, i * i) for i in range(200, 0, -1)],
+                                         numeric_keys=True)
+        assert len(index) == 200
+        assert list(index.keys())[:3] == [1, 2, 3]
+        assert index.get(12) == 144
+        assert repr(index) == "DatabaseIndex({1: 1, 2: 4, 3: 9}...{199: 39601, 200: 40000})"
+
+    def test_range_query(self):
+        """Test inclusive range queries across many leaves."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(100):
+            index.insert(i, i * i)
+
+        assert index.range_query(10, 13) == [(10, 100), (11, 121), (12, 144), (13, 169)]
+        assert index.range_query(-5, 2) == [(0, 0), (1, 1), (2, 4)]
+        assert len(index.range_query(0, 99)) == 100
+        assert index.range_query(100, 200) == []
+
+    @pytest.mark.parametrize("numeric_keys", [False, True])
+    def test_range_query_arrays(self, numeric_keys):
+        """Test columnar range results match the tuple results."""
+        index = DatabaseIndex[int, str](min_degree=2, numeric_keys=numeric_keys)
+        for i in range(0, 200, 2):
+            index.insert(i, str(i))
+
+        keys, values = index.range_query_arrays(15, 61)
+        pairs = index.range_query(15, 61)
+        assert list(keys) == [key for key, _ in pairs]
+        assert values == [value for _, value in pairs]
+        if numeric_keys:
+            assert keys.typecode == 'q'
+        empty_keys, empty_values = index.range_query_arrays(500, 600)
+        assert len(empty_keys) == 0 and empty_values == []
+
+    def test_range_query_keys_on_plain_btree(self):
+        """Test raw-key range queries against a brute-force filter."""
+        import random
+        from mastering_performant_code.chapter_09.btree import BTree
+        rng = random.Random(11)
+        keys = [rng.randint(0, 500) for _ in range(400)]
+        btree = BTree[int](min_degree=3)
+        for key in keys:
+            btree.insert(key)
+
+        for _ in range(50):
+            low, high = sorted((rng.randint(-10, 510), rng.randint(-10, 510)))
+            expected = sorted(k for k in keys if low <= k <= high)
+            assert btree.range_query_keys(low, high) == expected
+            assert btree.range_query(low, high) == expected
+
+    @pytest.mark.parametrize("numeric_keys", [False, True])
+    def test_upsert(self, numeric_keys):
+        """Test inserting and updating through upsert."""
+        index = DatabaseIndex[int, int](min_degree=2, numeric_keys=numeric_keys)
+        for i in range(100):
+            assert index.upsert(i % 10, lambda current: (current or 0) + 1) == i // 10 + 1
+
+        assert len(index) == 10
+        assert index.get_all() == [(i, 10) for i in range(10)]
+        assert index.get_stats()['size'] == 10
+
+    def test_upsert_updates_promoted_key(self):
+        """Test that upsert finds a key moved up by a split on the way down."""
+        index = DatabaseIndex[int, str](min_degree=2)
+        for i in range(64):
+            index.insert(i, "old")
+        for i in range(64):
+            index.upsert(i, lambda current: current + "!")
+        assert len(index) == 64
+        assert all(value == "old!" for _, value in index)
+
+    def test_index_entry_compares_by_key(self):
+        """Test that IndexEntry ordering and equality only use the key."""
+        a = IndexEntry(key=1, value="a", timestamp=1.0)
+        b = IndexEntry(key=1, value="b", timestamp=2.0)
+        c = IndexEntry(key=2, value="a", timestamp=1.0)
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a < c
+        assert not c < a
+
+    def test_index_entry_uses_slots(self):
+        """Test that IndexEntry instances carry no per-instance dict."""
+        entry = IndexEntry(key=1, value="a", timestamp=0.0)
+        assert not hasattr(entry, "__dict__")
+        assert repr(entry) == "IndexEntry(key=1, value='a', timestamp=0.0)"
+
+    def test_repr_truncates_large_index(self):
+        """Test that repr shows at most the first three and last two items."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(5):
+            index.insert(i, i)
+        assert repr(index) == "DatabaseIndex({0: 0, 1: 1, 2: 2, 3: 3, 4: 4})"
+
+        for i in range(5, 100):
+            index.insert(i, i)
+        assert repr(index) == "DatabaseIndex({0: 0, 1: 1, 2: 2}...{98: 98, 99: 99})"
+
+    def test_reverse_traversal(self):
+        """Test that the reverse traversal mirrors the inorder traversal."""
+        index = DatabaseIndex[int, int](min_degree=2)
+        for i in range(60):
+            index.insert(i, i)
+        forward = [entry.key for entry in index.btree.inorder_traversal()]
+        backward = [entry.key for entry in index.btree.inorder_traversal_reverse()]
+        assert backward == forward[::-1]
+
+    def test_iteration_is_lazy(self):
+        """Test iteration helpers and that iteration does not build a list."""
+        index = DatabaseIndex[int, str](min_degree=2)
+        for i in range(20):
+            index.insert(i, str(i))
+
+        assert list(index) == index.get_all()
+        assert list(index.keys()) == list(range(20))
+        assert list(index.values()) == [str(i) for i in range(20)]
+        assert list(index.items()) == index.get_all()
+
+        index.get_all = None
+        assert next(iter(index)) == (0, "0")
+
+    def test_timestamps_are_opt_in(self):
+        """Test that entries are only stamped when requested."""
+        index = DatabaseIndex[str, int]()
+        index.insert("a", 1)
+        index.insert("b", 2, timestamp=5.0)
+        assert index.btree.search(index._probe("a")).timestamp == 0.0
+        assert index.btree.search(index._probe("b")).timestamp == 5.0
+
+        stamped = DatabaseIndex[str, int](record_timestamps=True)
+        stamped.insert("a", 1)
+        assert stamped.btree.search(stamped._probe("a")).timestamp > 0.0
+
+    def test_clock_is_overridable(self, monkeypatch):
+        """Test that stamping goes through the class-level clock."""
+        monkeypatch.setattr(DatabaseIndex, "_now", staticmethod(lambda: 42.0))
+        index = DatabaseIndex[str, int](record_timestamps=True)
+        index.insert("a", 1)
+        index.upsert("b", lambda current: 2)
+        assert index.btree.search(index._probe("a")).timestamp == 42.0
+        assert index.btree.search(index._probe("b")).timestamp == 42.0
+
+    def test_stats_are_cached_until_mutation(self, monkeypatch):
+        """Test that get_stats only re-analyzes the tree after a change."""
+        from mastering_performant_code.chapter_09.analyzer import BTreeAnalyzer
+        index = DatabaseIndex[int, int]()
+        for i in range(10):
+            index.insert(i, i)
+
+        calls = []
+        original = BTreeAnalyzer.analyze_btree
+        monkeypatch.setattr(BTreeAnalyzer, "analyze_btree",
+                            lambda btree: calls.append(1) or original(btree))
+
+        stats = index.get_stats()
+        assert stats['size'] == 10
+        stats['size'] = -1
+        assert index.get_stats()['size'] == 10
+        assert len(calls) == 1
+
+        index.insert(10, 10)
+        assert index.get_stats()['size'] == 11
+        index.delete(10)
+        index.delete(10)
+        assert index.get_stats()['size'] == 10
+        index.clear()
+        assert index.get_stats()['size'] == 0
+        assert len(calls) == 4
+
+    def test_clear(self):
+        """Test clearing the index."""
+        index = DatabaseIndex[int, int]()
+        for i in range(10):
+            index.insert(i, i)
+        index.clear()
+        assert len(index) == 0
+        assert index.get(1) is None
+
+
+class TestFrozenDatabaseIndex:
+    """Test cases for FrozenDatabaseIndex."""
+
+    def test_empty_snapshot(self):
+        """Test freezing an empty index."""
+        frozen = DatabaseIndex[int, int]().freeze()
+        assert len(frozen) == 0
+        assert frozen.get(1) is None
+        assert 1 not in frozen
+        assert frozen.range_query(0, 10) == []
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 50, 127, 128, 300])
+    def test_lookups_match_source_index(self, size):
+        """Test point and range lookups against the source index."""
+        index = DatabaseIndex[int, str]()
+        for i in range(size):
+            index.insert(i * 2, f"value{i}")
+        frozen = index.freeze()
+
+        assert len(frozen) == size
+        assert frozen.get_all() == index.get_all()
+        for key in range(-1, size * 2 + 1):
+            assert frozen.get(key) == index.get(key)
+            assert (key in frozen) == (key in index)
+        assert frozen.range_query(3, 11) == index.get_all()[2:6]
+        assert frozen.range_query(size * 2, size * 3) == []
+
+    def test_layout_is_van_emde_boas(self):
+        """Test the slot order of a 15-node tree."""
+        frozen = FrozenDatabaseIndex([(i, i) for i in range(15)])
+        # Top tree (root + children), then four 3-node bottom trees
+        assert frozen.keys[:3] == [7, 3, 11]
+        assert frozen.keys[3:6] == [1, 0, 2]
+        assert frozen.keys[12:] == [13, 12, 14]
+
+
+class TestMultiValueIndex:
+    """Test cases for MultiValueIndex."""
+
+    def test_insert_and_get(self):
+        """Test storing several values under one key."""
+        index = MultiValueIndex[str, str]()
+        index.insert("tag", "a")
+        index.insert("tag", "b")
+        index.insert("other", "c")
+
+        assert index.get("tag") == ["a", "b"]
+        assert index.get("other") == ["c"]
+        assert index.get("missing") == []
+        assert "tag" in index
+
+    def test_repr(self):
+        """Test the truncated representation."""
+        index = MultiValueIndex[str, int]()
+        assert repr(index) == "MultiValueIndex()"
+        for key in "abcd":
+            index.insert(key, 1)
+        assert repr(index) == "MultiValueIndex({'a': [1], 'b': [1]}...{'d': [1]})"
+
+    def test_delete_value(self):
+        """Test deleting a single value and a whole key."""
+        index = MultiValueIndex[str, str]()
+        index.insert("tag", "a")
+        index.insert("tag", "b")
+
+        assert index.delete("tag", "a")
+        assert not index.delete("tag", "missing")
+        assert index.get("tag") == ["b"]
+
+    def test_len_tracks_values(self):
+        """Test that the cached value count matches the stored lists."""
+        index = MultiValueIndex[str, int]()
+        for i in range(30):
+            index.insert(f"key{i % 4}", i)
+        assert len(index) == 30
+
+        assert index.delete("key0", 0)
+        assert not index.delete("key0", 0)
+        assert len(index) == 29
+        assert index.delete("key1")
+        assert not index.delete("missing")
+        assert len(index) == 29 - 8
+        assert "key1" not in index
+        assert len(index) == index._count_values() == sum(len(values) for _, values in index.get_all())
+
+    def test_repeated_key_does_not_grow_tree(self):
+        """Test that extra values for a key extend its list in place."""
+        index = MultiValueIndex[str, int](min_degree=2)
+        index.insert("key", 0)
+        height = index.index.btree.get_height()
+        for i in range(1, 1000):
+            index.insert("key", i)
+
+        assert len(index.index) == 1
+        assert index.index.btree.get_height() == height
+        assert index.get("key") == list(range(1000))
+        assert len(index) == 1000
+
+    def test_deleting_last_value_removes_key(self):
+        """Test that a key disappears once its last value is deleted."""
+        index = MultiValueIndex[str, str]()
+        index.insert("tag", "a")
+        index.insert("tag", "b")
+        assert index.delete("tag", "a")
+        assert index.delete("tag", "b")
+        assert "tag" not in index
+        assert len(index.index) == 0
+        assert len(index) == 0
+
+
+    def test_ordered_set_container(self):
+        """Test the dict-backed value container."""
+        index = MultiValueIndex[str, int](value_container=dict)
+        for value in [3, 1, 2, 1]:
+            index.insert("key", value)
+        index.insert("other", 9)
+
+        assert index.get("key") == [3, 1, 2]
+        assert len(index) == 4
+        assert index.delete("key", 1)
+        assert not index.delete("key", 1)
+        assert index.get("key") == [3, 2]
+        assert len(index) == 3
+        assert index.get_all() == [("key", [3, 2]), ("other", [9])]
+        assert index.range_query("a", "l") == [("key", [3, 2])]
+        assert repr(index) == "MultiValueIndex({'key': [3, 2], 'other': [9]})"
+
+        assert index.delete("key", 3)
+        assert index.delete("key", 2)
+        assert "key" not in index
+        assert len(index) == 1
+
+    def test_invalid_value_container(self):
+        """Test that unsupported containers are rejected."""
+        with pytest.raises(ValueError):
+            MultiValueIndex(value_container=set)
+
+
+class TestTimestampedIndex:
+    """Test cases for TimestampedIndex."""
+
+    def test_insert_and_get(self):
+        """Test storing values with explicit timestamps."""
+        index = TimestampedIndex[str, str]()
+        index.insert("a", "x", 10.0)
+
+        assert index.get("a") == ("x", 10.0)
+        assert index.get_value("a") == "x"
+        assert index.get_timestamp("a") == 10.0
+        assert index.get_value("b") is None
+
+    def test_entries_before_and_after(self):
+        """Test temporal filtering."""
+        index = TimestampedIndex[str, str]()
+        index.insert("a", "x", 10.0)
+        index.insert("b", "y", 20.0)
+        index.insert("c", "z", 30.0)
+
+        assert index.get_entries_after(15.0) == [("b", ("y", 20.0)), ("c", ("z", 30.0))]
+        assert index.get_entries_before(15.0) == [("a", ("x", 10.0))]
+
+    def test_temporal_queries_keep_key_order(self):
+        """Test boundaries, ordering and deletes for temporal queries."""
+        index = TimestampedIndex[str, int](min_degree=2)
+        for i in range(50):
+            index.insert(f"k{i:02d}", i, float(50 - i))
+
+        # Timestamps fall as keys rise, so key order is the reverse of time order
+        after = index.get_entries_after(40.0)
+        assert [key for key, _ in after] == [f"k{i:02d}" for i in range(10)]
+        assert after == [(key, (value, ts)) for key, (value, ts) in index.get_all() if ts > 40.0]
+        before = index.get_entries_before(3.0)
+        assert before == [("k48", (48, 2.0)), ("k49", (49, 1.0))]
+
+        assert index.delete("k49")
+        assert not index.delete("k49")
+        assert index.get_entries_before(3.0) == [("k48", (48, 2.0))]
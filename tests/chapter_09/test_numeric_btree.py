@@ -0,0 +1,150 @@
+"""
+Unit tests for the struct-of-arrays NumericBTree.
+
+This module checks B-Tree invariants under random inserts and deletes,
+range queries, traversal order and bulk loading.
+"""
+
+import random
+from array import array
+
+import pytest
+
+from mastering_performant_code.chapter_09.numeric_btree import NumericBTree, NumericBTreeNode
+
+
+def assert_valid(tree):
+    """Assert the structural B-Tree invariants of ``tree``."""
+    if tree.root is None:
+        assert len(tree) == 0
+        return
+
+    leaf_depths = set()
+
+    def visit(node, depth, is_root):
+        assert len(node.keys) == len(node.values) == len(node.timestamps)
+        assert list(node.keys) == sorted(node.keys)
+        assert node.num_keys <= tree.max_keys
+        if not is_root:
+            assert node.num_keys >= tree.min_keys
+        if node.is_leaf:
+            leaf_depths.add(depth)
+            return
+        assert len(node.children) == node.num_keys + 1
+        for child in node.children:
+            visit(child, depth + 1, False)
+
+    visit(tree.root, 1, True)
+    assert leaf_depths == {tree.height}
+
+
+class TestNumericBTreeNode:
+    """Test cases for NumericBTreeNode."""
+
+    def test_leaf_node(self):
+        """Test leaf node storage."""
+        node = NumericBTreeNode(is_leaf=True)
+        assert node.is_leaf
+        assert node.num_keys == 0
+        assert isinstance(node.keys, array)
+        assert node.keys.typecode == 'q'
+        assert node.timestamps.typecode == 'd'
+
+    def test_internal_node(self):
+        """Test internal node storage."""
+        node = NumericBTreeNode(is_leaf=False)
+        assert not node.is_leaf
+        assert node.children == []
+
+
+class TestNumericBTree:
+    """Test cases for NumericBTree."""
+
+    def test_invalid_min_degree(self):
+        """Test that a minimum degree below 2 is rejected."""
+        with pytest.raises(ValueError):
+            NumericBTree(min_degree=1)
+
+    def test_insert_and_get(self):
+        """Test basic inserts and lookups."""
+        tree = NumericBTree(min_degree=2)
+        for key in [10, 20, 5, 6, 12, 30, 7, 17]:
+            tree.insert(key, key * 2, timestamp=float(key))
+
+        assert_valid(tree)
+        assert len(tree) == 8
+        assert tree.get(12) == 24
+        assert tree.get_timestamp(12) == 12.0
+        assert tree.get(13) is None
+        assert tree.get(13, "missing") == "missing"
+        assert 6 in tree
+        assert 8 not in tree
+        assert list(tree) == [5, 6, 7, 10, 12, 17, 20, 30]
+
+    def test_rejects_non_integer_keys(self):
+        """Test that keys must fit the packed integer array."""
+        tree = NumericBTree()
+        with pytest.raises(TypeError):
+            tree.insert("a", 1)
+        with pytest.raises(OverflowError):
+            tree.insert(2 ** 70, 1)
+
+    @pytest.mark.parametrize("min_degree", [2, 3, 5])
+    def test_random_operations(self, min_degree):
+        """Test random inserts and deletes against a sorted list."""
+        rng = random.Random(min_degree)
+        tree = NumericBTree(min_degree=min_degree)
+        expected = []
+        for _ in range(2000):
+            key = rng.randint(0, 200)
+            if rng.random() < 0.6:
+                tree.insert(key, -key)
+                expected.append(key)
+            else:
+                assert tree.delete(key) == (key in expected)
+                if key in expected:
+                    expected.remove(key)
+        assert_valid(tree)
+        assert [key for key, _ in tree.items()] == sorted(expected)
+        assert [key for key, _ in tree.items_reverse()] == sorted(expected, reverse=True)
+        assert all(value == -key for key, value in tree.items())
+
+        for key in sorted(set(expected)):
+            while tree.delete(key):
+                pass
+        assert_valid(tree)
+        assert tree.is_empty()
+        assert tree.get_height() == 0
+
+    def test_range_query(self):
+        """Test inclusive range queries."""
+        tree = NumericBTree(min_degree=2)
+        for key in range(0, 100, 3):
+            tree.insert(key, str(key))
+
+        assert tree.range_query(10, 20) == [(12, "12"), (15, "15"), (18, "18")]
+        assert tree.range_query(-10, 0) == [(0, "0")]
+        assert tree.range_query(100, 200) == []
+        assert len(tree.range_query(0, 99)) == len(tree)
+
+    def test_bulk_load(self):
+        """Test bottom-up construction from sorted entries."""
+        keys = list(range(1000))
+        tree = NumericBTree(min_degree=3)
+        tree.bulk_load(keys, [k * 2 for k in keys], [0.0] * len(keys))
+
+        assert_valid(tree)
+        assert len(tree) == 1000
+        assert tree.get(999) == 1998
+        with pytest.raises(ValueError):
+            tree.bulk_load([1], [1], [0.0])
+
+    def test_clear(self):
+        """Test clearing the tree."""
+        tree = NumericBTree()
+        for key in range(50):
+            tree.insert(key, key)
+        tree.clear()
+        assert len(tree) == 0
+        assert tree.get(1) is None
+        assert repr(tree) == "NumericBTree()"
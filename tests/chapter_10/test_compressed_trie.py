@@ -9,7 +9,9 @@ import unittest
 import timeit
 from typing import List
 
-from mastering_performant_code.chapter_10.compressed_trie import CompressedTrie, CompressedTrieNode
+from mastering_performant_code.chapter_10.compressed_trie import (
+    CompressedTrie, CompressedTrieNode, FrozenCompressedTrie, _common_prefix_len
+)
 
 class TestCompressedTrieNode(unittest.TestCase):
     """Test cases for CompressedTrieNode implementation."""
@@ -28,6 +30,30 @@ class TestCompressedTrieNode(unittest.TestCase):
         self.assertTrue(node.is_end)
         self.assertEqual(node.value, 42)
     
+    def test_first_char(self):
+        """Test that first_char tracks the edge label."""
+        self.assertIsNone(CompressedTrieNode().first_char)
+        node = CompressedTrieNode(edge_label="test")
+        self.assertEqual(node.first_char, "t")
+        node.set_edge_label("best")
+        self.assertEqual((node.edge_label, node.first_char), ("best", "b"))
+        self.assertEqual(CompressedTrieNode(edge_label=b"raw").first_char, ord("r"))
+    
+    def test_edge_len(self):
+        """Test that edge_len tracks the edge label."""
+        self.assertEqual(CompressedTrieNode().edge_len, 0)
+        node = CompressedTrieNode(edge_label="test")
+        self.assertEqual(node.edge_len, 4)
+        node.set_edge_label("abc")
+        self.assertEqual(node.edge_len, 3)
+    
+    def test_slots(self):
+        """Test that nodes carry no per-instance __dict__."""
+        node = CompressedTrieNode(edge_label="a")
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+    
     def test_post_init(self):
         """Test post-initialization behavior."""
         node = CompressedTrieNode(children=None)
@@ -51,9 +77,10 @@ class TestCompressedTrie(unittest.TestCase):
         self.assertEqual(len(self.trie), 1)
         self.assertEqual(self.trie.search("hello"), "world")
         
-        # Check that it was inserted as a direct child of root
-        self.assertIn("hello", self.trie._root.children)
-        child = self.trie._root.children["hello"]
+        # Check that it was inserted as a direct child of root, keyed by
+        # the first character of its edge label
+        self.assertIn("h", self.trie._root.children)
+        child = self.trie._root.children["h"]
         self.assertEqual(child.edge_label, "hello")
         self.assertTrue(child.is_end)
     
@@ -99,6 +126,16 @@ class TestCompressedTrie(unittest.TestCase):
         self.assertFalse(self.trie.starts_with("xyz"))
         self.assertTrue(self.trie.starts_with(""))  # Empty prefix should match all
     
+    def test_starts_with_many(self):
+        """Test batched prefix checks against single starts_with calls."""
+        for word in ["hello", "help", "helium", "world", "word", "a"]:
+            self.trie.insert(word)
+        queries = ["hel", "help", "helpful", "", "wor", "world", "x", "hel", "helix", "a", "ab", "he"]
+        self.assertEqual(self.trie.starts_with_many(queries),
+                         [self.trie.starts_with(q) for q in queries])
+        self.assertEqual(self.trie.starts_with_many([]), [])
+        self.assertEqual(CompressedTrie().starts_with_many(["", "a"]), [False, False])
+
     def test_get_all_with_prefix(self):
         """Test getting all strings with prefix."""
         self.trie.insert("hello", "world")
@@ -223,10 +260,10 @@ class TestCompressedTrieCompression(unittest.TestCase):
         self.trie.insert("world", "hello")
         
         # Should have two direct children from root
-        root_children = list(self.trie._root.children.keys())
+        root_children = self.trie._root.children
         self.assertEqual(len(root_children), 2)
-        self.assertIn("hello", root_children)
-        self.assertIn("world", root_children)
+        self.assertEqual(root_children["h"].edge_label, "hello")
+        self.assertEqual(root_children["w"].edge_label, "world")
     
     def test_prefix_of_existing(self):
         """Test inserting a prefix of an existing string."""
@@ -249,6 +286,128 @@ class TestCompressedTrieCompression(unittest.TestCase):
         self.assertEqual(self.trie.search("hel"), "short")
         self.assertEqual(self.trie.search("hello"), "world")
 
+    def test_common_prefix_len(self):
+        """Test the common prefix length search at assorted mismatch positions."""
+        for length in (0, 1, 15, 16, 17, 40):
+            base = "x" * length
+            self.assertEqual(_common_prefix_len(base + "a", base + "b"), length)
+            self.assertEqual(_common_prefix_len(base, base + "tail"), length)
+        self.assertEqual(_common_prefix_len("", "abc"), 0)
+        self.assertEqual(_common_prefix_len("héllo wörld", "héllo world"), 7)
+        self.assertEqual(_common_prefix_len(b"abcx", b"abcy"), 3)
+        text = "abcdefghij" * 10
+        for cut in range(len(text)):
+            self.assertEqual(_common_prefix_len(text, text[:cut] + "#"), cut)
+
+    def test_edge_split_reports_common_length(self):
+        """Test that the split lookup hands back the common prefix length."""
+        self.trie.insert("hello", 1)
+        node, remaining, (edge_label, child, common_length) = self.trie._find_insertion_point("help")
+        self.assertIs(node, self.trie._root)
+        self.assertEqual((remaining, edge_label, common_length), ("help", "hello", 3))
+        self.assertEqual(self.trie._find_insertion_point("world"), (self.trie._root, "world", None))
+        node, remaining, edge_to_split = self.trie._find_insertion_point("hello!")
+        self.assertEqual((node.edge_label, remaining, edge_to_split), ("hello", "!", None))
+
+        self.trie.insert("help", 2)
+        self.trie.insert("he", 3)
+        self.assertEqual(sorted(self.trie.get_all_strings()), [("he", 3), ("hello", 1), ("help", 2)])
+
+    def test_lookups_ending_inside_an_edge(self):
+        """Test exact and prefix lookups that stop partway along an edge."""
+        self.trie.insert("abcdef", 1)
+        self.trie.insert("abcxyz", 2)
+
+        self.assertNotIn("abcd", self.trie)
+        self.assertNotIn("abcdefg", self.trie)
+        self.assertIsNone(self.trie.search("ab"))
+        self.assertTrue(self.trie.starts_with("abcd"))
+        self.assertTrue(self.trie.starts_with("abcxyz"))
+        self.assertFalse(self.trie.starts_with("abcdx"))
+        self.assertFalse(self.trie.starts_with("abcxyz!"))
+        self.assertEqual(self.trie.get_all_with_prefix("abcd"), [("abcdef", 1)])
+        self.assertEqual(self.trie.get_all_with_prefix("abcx"), [("abcxyz", 2)])
+        self.assertEqual(self.trie.get_all_with_prefix("abcdx"), [])
+
+    def test_split_suffixes_are_shared(self):
+        """Test that equal edge labels created by splits are one interned object."""
+        for word in ["walking", "talking", "walked", "talked"]:
+            self.trie.insert(word)
+        walk = self.trie._root.children["w"]
+        talk = self.trie._root.children["t"]
+        self.assertIs(walk.children["i"].edge_label, talk.children["i"].edge_label)
+        self.assertIs(walk.children["e"].edge_label, talk.children["e"].edge_label)
+
+    def test_prefix_results_are_capped(self):
+        """Test that prefix collection honours max_results."""
+        for i in range(100):
+            self.trie.insert(f"key{i:03d}", i)
+        self.assertEqual(len(self.trie.get_all_with_prefix("key", max_results=7)), 7)
+        self.assertEqual(len(self.trie.get_all_with_prefix("key0", max_results=500)), 100)
+        self.assertEqual(self.trie.get_all_with_prefix("key", max_results=0), [])
+        self.assertEqual(self.trie.get_all_with_prefix("key", max_results=-1), [])
+        self.assertEqual(len(self.trie.get_all_with_prefix("key", max_results=None)), 100)
+        self.assertEqual(self.trie.autocomplete("key", 3), ["key000", "key001", "key002"])
+        self.assertEqual(self.trie.autocomplete("key", 0), [])
+
+    def test_collect_deep_trie(self):
+        """Test collecting words from a chain deeper than the recursion limit."""
+        import sys
+        depth = sys.getrecursionlimit() + 100
+        for i in range(1, depth + 1):
+            self.trie.insert("a" * i, i)
+        results = self.trie.get_all_with_prefix("")
+        self.assertEqual(len(results), depth)
+        self.assertEqual(results[-1], ("a" * depth, depth))
+
+    def test_iter_all_with_prefix(self):
+        """Test that prefix iteration is lazy and matches the list version."""
+        for word in ["car", "cart", "carton", "cat", "dog"]:
+            self.trie.insert(word, word)
+        words = self.trie.iter_all_with_prefix("ca")
+        self.assertEqual(next(words), ("car", "car"))
+        self.assertEqual(next(words), ("cart", "cart"))
+        self.assertEqual(list(self.trie.iter_all_with_prefix("car")),
+                         self.trie.get_all_with_prefix("car"))
+        self.assertEqual(list(self.trie.iter_all_with_prefix("x")), [])
+
+    def test_repr_is_capped(self):
+        """Test that repr lists at most 20 strings."""
+        for i in range(50):
+            self.trie.insert(f"w{i:02d}")
+        text = repr(self.trie)
+        self.assertTrue(text.startswith("CompressedTrie('w00', 'w01'"))
+        self.assertTrue(text.endswith("'w19', ...)"))
+
+    def test_delete_recompresses_path(self):
+        """Test that deletes prune dead leaves and merge pass-through nodes."""
+        for word in ["hello", "help", "helium"]:
+            self.trie.insert(word)
+        self.trie.delete("help")
+        self.trie.delete("helium")
+
+        child = self.trie._root.children["h"]
+        self.assertEqual(child.edge_label, "hello")
+        self.assertTrue(child.is_end)
+        self.assertEqual(child.children, {})
+
+        self.trie.insert("he")
+        self.trie.insert("hex")
+        self.trie.delete("he")
+        self.assertEqual(self.trie._root.children["h"].edge_label, "he")
+        self.trie.delete("hex")
+        self.assertEqual(self.trie._root.children["h"].edge_label, "hello")
+        self.assertEqual(self.trie.get_all_strings(), [("hello", None)])
+
+    def test_results_are_sorted(self):
+        """Test that prefix results come back in lexicographic order."""
+        words = ["pear", "apple", "peach", "apricot", "banana", "pea", "app", "zoo", "b"]
+        for word in words:
+            self.trie.insert(word)
+        self.assertEqual([w for w, _ in self.trie.get_all_strings()], sorted(words))
+        self.assertEqual(self.trie.autocomplete("pe", 2), ["pea", "peach"])
+        self.assertEqual([w for w, _ in self.trie.freeze()], sorted(words))
+
     def test_very_long_strings(self):
         """Test with very long strings."""
         long_string = "a" * 100
@@ -262,6 +421,107 @@ class TestCompressedTrieCompression(unittest.TestCase):
         prefix = long_string[:50]
         self.assertTrue(self.trie.starts_with(prefix))
 
+class TestBytesCompressedTrie(unittest.TestCase):
+    """Test cases for byte-string keys."""
+    
+    def setUp(self):
+        self.trie = CompressedTrie[int](key_type=bytes)
+        for i, word in enumerate([b"https://a.io/x", b"https://a.io/y", b"https://b.io", b"ftp://c"]):
+            self.trie.insert(word, i)
+    
+    def test_lookups(self):
+        """Test exact and prefix lookups on byte keys."""
+        self.assertEqual(len(self.trie), 4)
+        self.assertEqual(self.trie[b"https://a.io/y"], 1)
+        self.assertNotIn(b"https://a.io", self.trie)
+        self.assertTrue(self.trie.starts_with(b"https://a."))
+        self.assertFalse(self.trie.starts_with(b"http://"))
+        self.assertEqual(self.trie.autocomplete(b"https://a"), [b"https://a.io/x", b"https://a.io/y"])
+        self.assertTrue(all(isinstance(edge, int) for edge in self.trie._root.children))
+    
+    def test_delete_and_freeze(self):
+        """Test deletion and snapshots of a bytes trie."""
+        self.assertTrue(self.trie.delete(b"https://a.io/x"))
+        frozen = self.trie.freeze()
+        self.assertEqual(sorted(frozen), [(b"ftp://c", 3), (b"https://a.io/y", 1), (b"https://b.io", 2)])
+        self.assertEqual(frozen.search(b"https://b.io"), 2)
+    
+    def test_key_type_is_enforced(self):
+        """Test that keys of the other string type are rejected."""
+        with self.assertRaises(TypeError):
+            self.trie.insert("https://a.io/z", 9)
+        with self.assertRaises(TypeError):
+            CompressedTrie().insert(b"raw", 1)
+        with self.assertRaises(ValueError):
+            CompressedTrie(key_type=list)
+
+class TestFrozenCompressedTrie(unittest.TestCase):
+    """Test cases for the struct-of-arrays trie snapshot."""
+    
+    def setUp(self):
+        self.trie = CompressedTrie[int]()
+        for i, word in enumerate(["hello", "help", "he", "world", "word", "a"]):
+            self.trie.insert(word, i)
+        self.frozen = self.trie.freeze()
+    
+    def test_lookups_match_source(self):
+        """Test that the snapshot answers lookups like the original trie."""
+        self.assertIsInstance(self.frozen, FrozenCompressedTrie)
+        self.assertEqual(len(self.frozen), 6)
+        for word, value in self.trie.get_all_strings():
+            self.assertIn(word, self.frozen)
+            self.assertEqual(self.frozen[word], value)
+        for missing in ["h", "hel", "helper", "wor", "b", ""]:
+            self.assertNotIn(missing, self.frozen)
+            self.assertIsNone(self.frozen.search(missing))
+        with self.assertRaises(KeyError):
+            self.frozen["hel"]
+    
+    def test_starts_with(self):
+        """Test prefix checks on the snapshot."""
+        for prefix in ["", "h", "hel", "wor", "world", "a"]:
+            self.assertTrue(self.frozen.starts_with(prefix))
+        for prefix in ["x", "helx", "worlds"]:
+            self.assertFalse(self.frozen.starts_with(prefix))
+        self.assertFalse(CompressedTrie().freeze().starts_with(""))
+    
+    def test_snapshot_is_independent(self):
+        """Test that later changes to the trie do not affect the snapshot."""
+        self.trie.insert("new", 99)
+        self.trie.delete("hello")
+        self.assertNotIn("new", self.frozen)
+        self.assertIn("hello", self.frozen)
+        self.assertEqual(len(list(self.frozen)), 6)
+    
+    def test_alphabet_tables(self):
+        """Test that a table-dispatch snapshot answers like the map version."""
+        dna = CompressedTrie[int]()
+        for i, seq in enumerate(["ACGT", "ACGA", "AC", "TTAG", "GATTACA"]):
+            dna.insert(seq, i)
+        frozen = dna.freeze(alphabet="ACGT")
+        self.assertEqual(sorted(frozen), sorted(dna.get_all_strings()))
+        self.assertEqual(frozen["GATTACA"], 4)
+        self.assertIn("AC", frozen)
+        self.assertNotIn("ACG", frozen)
+        self.assertTrue(frozen.starts_with("GAT"))
+        self.assertTrue(frozen.starts_with("ACG"))
+        self.assertFalse(frozen.starts_with("ACN"))
+        self.assertFalse(frozen.starts_with("N"))
+    
+    def test_alphabet_validation(self):
+        """Test that unusable alphabets are rejected."""
+        with self.assertRaises(ValueError):
+            self.trie.freeze(alphabet="abc")
+        with self.assertRaises(ValueError):
+            self.trie.freeze(alphabet="a\u0400")
+        with self.assertRaises(ValueError):
+            CompressedTrie(key_type=bytes).freeze(alphabet="ab")
+    
+    def test_leaves_share_child_map(self):
+        """Test that leaf nodes do not each allocate a child map."""
+        leaf_maps = {id(children) for children in self.frozen._children if not children}
+        self.assertEqual(len(leaf_maps), 1)
+
 class TestCompressedTriePerformance(unittest.TestCase):
     """Performance tests for CompressedTrie implementation."""
     
@@ -9,11 +9,16 @@ import pytest
 import random
 from typing import List
 from mastering_performant_code.chapter_11.applications import (
-    TaskScheduler, Task, TopKElements, MedianFinder, 
+    TaskScheduler, Task, Event, TopKElements, MedianFinder, 
     SlidingWindowMax, EventSimulator
 )
 
 
+def _is_min_heap(values: List[int]) -> bool:
+    """Check the heapq invariant on a plain list."""
+    return all(values[(i - 1) // 2] <= values[i] for i in range(1, len(values)))
+
+
 class TestTaskScheduler:
     """Test cases for TaskScheduler class."""
     
@@ -24,6 +29,17 @@ class TestTaskScheduler:
         assert scheduler.is_empty()
         assert scheduler._task_id_counter == 0
     
+    def test_task_and_event_use_slots(self):
+        """Test that tasks and events carry no per-instance __dict__."""
+        task = Task(id=0, name="demo", priority=5, duration=1.0, created_at=0.0)
+        event = Event(id=0, event_type="login", priority=5,
+                      processing_time=0.1, timestamp=0.0)
+        
+        for instance in (task, event):
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.extra = 1
+    
     def test_task_scheduler_add_task(self):
         """Test adding tasks to scheduler."""
         scheduler = TaskScheduler()
@@ -93,6 +109,8 @@ class TestTaskScheduler:
         assert final_time == initial_time + 2.0
         assert len(scheduler.get_completed_tasks()) == 1
         assert scheduler.get_completed_tasks()[0].name == "Test task"
+        assert isinstance(scheduler.get_completed_tasks(), tuple)
+        assert list(scheduler.iter_completed()) == [task]
     
     def test_task_scheduler_run_scheduler(self):
         """Test running the scheduler."""
@@ -126,6 +144,51 @@ class TestTaskScheduler:
         assert completed[1].name == "Task 1"
         assert len(scheduler) == 1  # Task 2 still in queue
     
+    def test_task_scheduler_run_matches_stepwise(self):
+        """Test that draining matches executing tasks one at a time."""
+        specs = [(f"t{i}", random.randint(1, 5), random.random()) for i in range(200)]
+        drained, stepped = TaskScheduler(), TaskScheduler()
+        for name, priority, duration in specs:
+            drained.add_task(name, priority, duration)
+            stepped.add_task(name, priority, duration)
+        
+        completed = drained.run_scheduler(max_tasks=50) + drained.run_scheduler()
+        expected = []
+        while not stepped.is_empty():
+            task = stepped.get_next_task()
+            stepped.execute_task(task)
+            expected.append(task)
+        
+        assert completed == expected
+        assert drained.get_current_time() == stepped.get_current_time()
+        assert drained.get_completed_tasks() == stepped.get_completed_tasks()
+        assert drained.is_empty()
+    
+    def test_task_scheduler_history_size(self):
+        """Test that a bounded history keeps only the latest tasks."""
+        scheduler = TaskScheduler(history_size=3)
+        for i in range(10):
+            scheduler.add_task(f"t{i}", 10 - i, 1.0)
+        
+        scheduler.run_scheduler(max_tasks=4)
+        assert [task.name for task in scheduler.get_completed_tasks()] == ["t1", "t2", "t3"]
+        scheduler.execute_task(scheduler.get_next_task())
+        scheduler.run_scheduler()
+        assert [task.name for task in scheduler.get_completed_tasks()] == ["t7", "t8", "t9"]
+        assert scheduler.get_current_time() == 10.0
+    
+    def test_task_scheduler_equal_priorities_fifo(self):
+        """Test that tasks with equal priority run in insertion order."""
+        scheduler = TaskScheduler()
+        
+        for name in ["a", "b", "c"]:
+            scheduler.add_task(name, 5)
+        scheduler.add_task("urgent", 9)
+        scheduler.add_task("d", 5)
+        
+        completed = scheduler.run_scheduler()
+        assert [task.name for task in completed] == ["urgent", "a", "b", "c", "d"]
+    
     def test_task_scheduler_empty_queue(self):
         """Test scheduler behavior with empty queue."""
         scheduler = TaskScheduler()
@@ -203,6 +266,66 @@ class TestTopKElements:
         assert 5 not in result
         assert 3 not in result
     
+    def test_top_k_elements_get_top_k_keeps_heap(self):
+        """Test that reading the top K does not disturb the heap."""
+        top_k = TopKElements(3, find_largest=True)
+        for element in [10, 5, 15, 3, 7, 20, 1]:
+            top_k.add(element)
+        
+        assert top_k.get_top_k() == [20, 15, 10]
+        assert top_k._heap.is_valid()
+        top_k.add(12)
+        assert top_k.get_top_k() == [20, 15, 12]
+    
+    def test_top_k_elements_add_batch(self):
+        """Test adding values in batches."""
+        elements = [random.randint(1, 1000) for _ in range(500)]
+        
+        largest = TopKElements(10, find_largest=True)
+        largest.add_batch(elements[:5])
+        largest.add_batch(elements[5:])
+        assert largest.get_top_k() == sorted(elements, reverse=True)[:10]
+        assert largest._heap.is_valid()
+        
+        smallest = TopKElements(10, find_largest=False)
+        smallest.add_batch(iter(elements))
+        assert smallest.get_top_k() == sorted(elements)[:10]
+        assert smallest._heap.is_valid()
+    
+    def test_top_k_elements_threshold(self):
+        """Test that the cached threshold tracks the heap root."""
+        top_k = TopKElements(3, find_largest=True)
+        top_k.add(10)
+        top_k.add(5)
+        assert not top_k._full
+        assert top_k._threshold is None
+        
+        top_k.add(15)
+        assert top_k._full
+        assert top_k._threshold == 5
+        top_k.add(5)
+        top_k.add(1)
+        assert top_k._threshold == 5
+        top_k.add(12)
+        assert top_k._threshold == 10
+        assert top_k.get_top_k() == [15, 12, 10]
+    
+    def test_top_k_elements_mixed_batches(self):
+        """Test small and large batches interleaved with single adds."""
+        for find_largest in (True, False):
+            top_k = TopKElements(20, find_largest=find_largest)
+            seen = []
+            for batch_size in [5, 3, 100, 1, 19, 20, 0, 500]:
+                batch = [random.randint(1, 10000) for _ in range(batch_size)]
+                top_k.add_batch(batch)
+                top_k.add(batch_size)
+                seen.extend(batch + [batch_size])
+                
+                expected = sorted(seen, reverse=find_largest)[:20]
+                assert top_k.get_top_k() == expected
+                assert top_k._heap.is_valid()
+                assert top_k._full == (len(seen) >= 20)
+    
     def test_top_k_elements_clear(self):
         """Test clearing the top K elements finder."""
         top_k = TopKElements(3, find_largest=True)
@@ -214,6 +337,12 @@ class TestTopKElements:
         top_k.clear()
         result = top_k.get_top_k()
         assert len(result) == 0
+        assert not top_k._full
+        
+        # The cached threshold must not outlive the cleared values
+        for element in [1, 2, 3, 4]:
+            top_k.add(element)
+        assert top_k.get_top_k() == [4, 3, 2]
     
     def test_top_k_elements_large_dataset(self):
         """Test TopKElements with large dataset."""
@@ -296,6 +425,68 @@ class TestMedianFinder:
         
         result = finder.get_all_numbers()
         assert result == [1, 3, 5, 7, 10]
+        assert finder.find_median() == 5.0
+        assert _is_min_heap(finder._lower_heap)
+        assert _is_min_heap(finder._upper_heap)
+    
+    def test_median_finder_running_median(self):
+        """Test the median after every insertion against a sorted copy."""
+        finder = MedianFinder()
+        numbers = []
+        
+        for _ in range(200):
+            num = random.randint(-50, 50)
+            numbers.append(num)
+            finder.add_num(num)
+            
+            ordered = sorted(numbers)
+            mid = len(ordered) // 2
+            if len(ordered) % 2:
+                expected = float(ordered[mid])
+            else:
+                expected = (ordered[mid - 1] + ordered[mid]) / 2
+            assert finder.find_median() == expected
+    
+    def test_median_finder_add_batch(self):
+        """Test adding batches, large and small, between single insertions."""
+        finder = MedianFinder()
+        numbers = []
+        
+        for batch_size in [0, 1, 500, 3, 1, 200, 2]:
+            batch = [random.randint(-100, 100) for _ in range(batch_size)]
+            finder.add_batch(batch)
+            numbers.extend(batch)
+            num = random.randint(-100, 100)
+            finder.add_num(num)
+            numbers.append(num)
+            
+            ordered = sorted(numbers)
+            mid = len(ordered) // 2
+            if len(ordered) % 2:
+                expected = float(ordered[mid])
+            else:
+                expected = (ordered[mid - 1] + ordered[mid]) / 2
+            assert finder.find_median() == expected
+            assert finder.get_all_numbers() == ordered
+            assert _is_min_heap(finder._lower_heap)
+            assert _is_min_heap(finder._upper_heap)
+    
+    def test_median_finder_from_iterable(self):
+        """Test building a median finder from an initial batch."""
+        numbers = [random.randint(-100, 100) for _ in range(301)]
+        finder = MedianFinder.from_iterable(iter(numbers))
+        
+        assert finder.find_median() == float(sorted(numbers)[150])
+        assert finder.get_all_numbers() == sorted(numbers)
+        assert len(finder._lower_heap) == 151
+        assert _is_min_heap(finder._lower_heap)
+        assert _is_min_heap(finder._upper_heap)
+        
+        finder.add_num(1000)
+        assert finder.find_median() == (sorted(numbers)[150] + sorted(numbers)[151]) / 2
+        
+        with pytest.raises(ValueError):
+            MedianFinder.from_iterable([]).find_median()
     
     def test_median_finder_large_dataset(self):
         """Test median finder with large dataset."""
@@ -322,6 +513,23 @@ class TestSlidingWindowMax:
         assert window.window_size == 3
         assert window._current_index == 0
     
+    def test_sliding_window_max_long_stream(self):
+        """Test sliding window maximum against a brute-force scan."""
+        window = SlidingWindowMax(50)
+        values = [random.randint(-1000, 1000) for _ in range(2000)]
+        
+        expected = [max(values[i - 49:i + 1]) for i in range(49, len(values))]
+        assert window.get_max_in_window(values) == expected
+    
+    def test_sliding_window_max_batch_then_stream(self):
+        """Test that add_element continues a stream started in a batch."""
+        window = SlidingWindowMax(3)
+        
+        assert window.get_max_in_window([1, 3, -1, -3]) == [3, 3]
+        assert window.add_element(5) == 5
+        assert window.add_element(3) == 5
+        assert window.get_max_in_window([6, 7]) == [6, 7]
+    
     def test_sliding_window_max_basic_operations(self):
         """Test basic sliding window maximum operations."""
         window = SlidingWindowMax(3)
@@ -476,6 +684,60 @@ class TestEventSimulator:
         assert stats["event_type_distribution"]["login"] == 2
         assert stats["event_type_distribution"]["query"] == 1
         assert stats["event_type_distribution"]["error"] == 1
+        assert list(simulator._proc_types) == [event.event_type for event in simulator._processed_events]
+        assert list(simulator._proc_times) == [event.processing_time for event in simulator._processed_events]
+    
+    def test_event_simulator_run_matches_stepwise(self):
+        """Test that draining matches processing events one at a time."""
+        specs = [(f"e{i % 7}", random.randint(1, 5), random.random()) for i in range(200)]
+        drained, stepped = EventSimulator(), EventSimulator()
+        for event_type, priority, processing_time in specs:
+            drained.add_event(event_type, priority, processing_time)
+            stepped.add_event(event_type, priority, processing_time)
+        
+        processed = drained.run_simulation(max_events=50) + drained.run_simulation()
+        expected = []
+        while (event := stepped.process_next_event()) is not None:
+            expected.append(event)
+        
+        assert processed == expected
+        assert drained._current_time == stepped._current_time
+        assert drained.get_statistics() == stepped.get_statistics()
+    
+    def test_event_simulator_history_size(self):
+        """Test that a bounded history limits processed events and statistics."""
+        simulator = EventSimulator(history_size=2)
+        simulator.add_event("a", 3, 1.0)
+        simulator.add_event("b", 2, 2.0)
+        simulator.add_event("c", 1, 4.0)
+        
+        simulator.process_next_event()
+        simulator.run_simulation()
+        
+        assert [event.event_type for event in simulator._processed_events] == ["b", "c"]
+        stats = simulator.get_statistics()
+        assert stats["total_events"] == 2
+        assert stats["total_time"] == 7.0
+        assert stats["avg_processing_time"] == 3.0
+        assert stats["event_type_distribution"] == {"b": 1, "c": 1}
+    
+    def test_event_simulator_priority_distribution(self):
+        """Test the priority distribution of events still queued."""
+        simulator = EventSimulator()
+        
+        simulator.add_event("a", 5, 0.1)
+        simulator.add_event("b", 3, 0.1)
+        simulator.add_event("c", 3, 0.1)
+        simulator.add_event("d", 10, 0.1)
+        
+        simulator.run_simulation(max_events=1)
+        stats = simulator.get_statistics()
+        assert stats["priority_distribution"] == {5: 1, 3: 2}
+        
+        simulator.process_next_event()
+        assert simulator.get_statistics()["priority_distribution"] == {3: 2}
+        simulator.run_simulation()
+        assert simulator.get_statistics()["priority_distribution"] == {}
     
     def test_event_simulator_empty_queue(self):
         """Test simulator behavior with empty queue."""
@@ -304,6 +304,64 @@ class TestBinaryHeap:
         items = heap.to_list()
         assert items == [5, 10, 15]
     
+    def test_heap_pushpop(self):
+        """Test pushpop against push followed by pop."""
+        for heap_type in ("min", "max"):
+            heap = BinaryHeap[int](heap_type=heap_type)
+            reference = BinaryHeap[int](heap_type=heap_type)
+            assert heap.pushpop(7) == 7
+            assert heap.is_empty()
+            
+            for value in [random.randint(1, 100) for _ in range(50)]:
+                heap.push(value)
+                reference.push(value)
+            for value in [random.randint(1, 100) for _ in range(100)]:
+                reference.push(value)
+                assert heap.pushpop(value) == reference.pop()
+                assert heap.is_valid()
+            assert heap.to_list() == reference.to_list()
+    
+    def test_heap_pushpop_with_priority(self):
+        """Test pushpop with explicit priorities."""
+        heap = BinaryHeap[str](heap_type="min")
+        heap.push("b", 2)
+        heap.push("c", 3)
+        
+        assert heap.pushpop("a", 1) == "a"
+        assert heap.pushpop("d", 4) == "b"
+        assert heap.to_list() == ["c", "d"]
+        with pytest.raises(ValueError):
+            heap.pushpop("e")
+    
+    def test_heap_sift_routines_match_heap_type(self):
+        """Test that each heap type binds its own sift routines."""
+        min_heap = BinaryHeap[int](heap_type="min")
+        max_heap = BinaryHeap[int](heap_type="MAX")
+        assert min_heap._sift_down.__func__ is BinaryHeap._sift_down_min
+        assert max_heap._sift_up.__func__ is BinaryHeap._sift_up_max
+        
+        values = [random.randint(1, 50) for _ in range(200)]
+        for value in values:
+            min_heap.push(value)
+            max_heap.push(value)
+        assert min_heap.to_list() == sorted(values)
+        assert max_heap.to_list() == sorted(values, reverse=True)
+    
+    def test_heap_snapshot(self):
+        """Test that snapshot copies the items without popping them."""
+        heap = BinaryHeap[int](heap_type="min")
+        for value in [10, 5, 15, 1]:
+            heap.push(value)
+        
+        items = heap.snapshot()
+        assert sorted(items) == [1, 5, 10, 15]
+        assert items[0] == 1
+        assert len(heap) == 4
+        
+        items.append(100)
+        assert len(heap) == 4
+        assert heap.is_valid()
+    
     def test_heap_clear(self):
         """Test clearing the heap."""
         heap = BinaryHeap[int](heap_type="min")
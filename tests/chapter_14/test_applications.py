@@ -0,0 +1,122 @@
+"""
+Unit tests for the Bloom filter applications.
+
+This module tests the real-world application classes built on BloomFilter.
+"""
+
+import hashlib
+import pytest
+from mastering_performant_code.chapter_14.applications import (
+    SpellChecker, EmailFilter, DuplicateDetector, URLShortener
+)
+
+
+class TestSpellChecker:
+    """Test cases for SpellChecker class."""
+
+    def test_dictionary_is_loaded_lowercased(self):
+        """Test that the dictionary is bulk loaded in lowercase."""
+        words = ["Apple", "banana", "CHERRY"]
+        checker = SpellChecker(words)
+
+        assert checker.bloom_filter.expected_elements == len(words)
+        assert len(checker.bloom_filter) == len(words)
+        assert checker.bloom_filter.contains_many(["apple", "banana", "cherry"]) == [True] * 3
+
+        with pytest.raises(ValueError):
+            SpellChecker([])
+
+    def test_check_text(self):
+        """Test checking a text with punctuation, case and repeated words."""
+        checker = SpellChecker(["the", "quick", "brown", "fox"])
+        results = checker.check_text("The quick, quick brwn fox! 123 the")
+
+        assert results == [
+            ("The", 0, True),
+            ("quick,", 1, True),
+            ("quick", 2, True),
+            ("brwn", 3, False),
+            ("fox!", 4, True),
+            ("the", 6, True),
+        ]
+
+    def test_is_correctly_spelled(self):
+        """Test single word lookups are case insensitive."""
+        checker = SpellChecker(["Hello", "world"])
+
+        assert checker.is_correctly_spelled("hello")
+        assert checker.is_correctly_spelled("WORLD")
+        assert not checker.is_correctly_spelled("helo")
+
+    def test_get_suggestions_keeps_dictionary_order(self):
+        """Test suggestions are similar-length words in dictionary order."""
+        words = ["a", "elephant", "cat", "hippopotamus", "dog", "bird", "ox", "horse"]
+        checker = SpellChecker(words)
+
+        expected = [w for w in words if abs(len(w) - 3) <= 2]
+        assert checker.get_suggestions("cta", max_suggestions=10) == expected
+        assert checker.get_suggestions("cta", max_suggestions=3) == expected[:3]
+        assert checker.get_suggestions("zzzzzzzzzzzzzzzzzz") == []
+
+
+class TestEmailFilter:
+    """Test cases for EmailFilter class."""
+
+    def test_is_spam(self):
+        """Test that two or more pattern hits mark an email as spam."""
+        email_filter = EmailFilter(["free", "money", "winner"])
+
+        assert email_filter.is_spam("You are a WINNER of free money")
+        assert not email_filter.is_spam("Lunch is free today")
+        assert email_filter.emails_processed == 2
+        assert email_filter.spam_detected == 1
+
+    def test_repeated_pattern_counts_each_time(self):
+        """Test that a repeated spam word counts once per occurrence."""
+        email_filter = EmailFilter(["free", "money"])
+
+        assert email_filter.is_spam("free free offer")
+        assert not email_filter.is_spam("limited offer")
+
+
+class TestDuplicateDetector:
+    """Test cases for DuplicateDetector class."""
+
+    def test_process_item(self):
+        """Test that repeated items are reported as duplicates."""
+        detector = DuplicateDetector(expected_items=100)
+
+        assert detector.process_item("a") is False
+        assert detector.process_item("b") is False
+        assert detector.process_item("a") is True
+
+        stats = detector.get_stats()
+        assert stats['total_items'] == 3
+        assert stats['unique_items'] == 2
+        assert stats['duplicates_found'] == 1
+
+
+class TestURLShortener:
+    """Test cases for URLShortener class."""
+
+    def test_shorten_url(self):
+        """Test that a repeated URL is reported as a duplicate."""
+        shortener = URLShortener(expected_urls=100)
+
+        short_url = shortener.shorten_url("https://example.com/page")
+        assert short_url.startswith("short_")
+        assert shortener.url_mappings[short_url] == "https://example.com/page"
+
+        assert shortener.shorten_url("https://example.com/page").startswith("duplicate_")
+        assert shortener.urls_processed == 2
+        assert shortener.duplicates_found == 1
+
+    def test_short_id_is_stable(self):
+        """Test that short IDs come from the URL's digest, not hash()."""
+        url = "https://example.com/page"
+        digest = hashlib.blake2b(url.encode(), digest_size=16).digest()
+        expected_id = int.from_bytes(digest[:8], 'little') % 10000
+
+        shortener = URLShortener(expected_urls=100)
+        assert shortener.shorten_url(url) == f"short_{expected_id}"
+        assert shortener.shorten_url(url) == f"duplicate_{expected_id}"
@@ -6,6 +6,9 @@ ensuring 100% code coverage and testing all edge cases.
 """
 
 import pytest
+import copy
+import hashlib
+import pickle
 import math
 from typing import List, Any
 from mastering_performant_code.chapter_14.bloom_filter import BloomFilter
@@ -22,8 +25,7 @@ class TestBloomFilter:
         assert bf.expected_elements == 1000
         assert bf.false_positive_rate == 0.01
         assert bf.element_count == 0
-        assert len(bf.bit_array) > 0
-        assert len(bf.hash_seeds) > 0
+        assert len(bf.bit_array) == (bf.size + 7) // 8
     
     def test_init_invalid_expected_elements(self):
         """Test initialization with invalid expected elements."""
@@ -48,27 +50,74 @@ class TestBloomFilter:
         """Test optimal size calculation."""
         bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
         
-        # Test the formula: m = -n * ln(p) / (ln(2)^2)
+        # Start from m = -n * ln(p) / (ln(2)^2), rounded up to whole blocks,
+        # and grow just enough for the blocked layout to meet p
         expected_size = int(-1000 * math.log(0.01) / (math.log(2) ** 2))
-        assert bf.size == expected_size
+        assert bf.size % 512 == 0
+        assert expected_size <= bf.size < 1.25 * expected_size
+        assert bf.get_false_positive_rate() == 0.0
+        k = bf._calculate_optimal_hash_count(1000, bf.size)
+        assert bf._estimate_false_positive_rate(1000, bf.size, k) <= 0.01
+        k = bf._calculate_optimal_hash_count(1000, bf.size - 512)
+        assert bf._estimate_false_positive_rate(1000, bf.size - 512, k) > 0.01
+        
+        # Filters smaller than a block round up to a power of two
+        small = BloomFilter(expected_elements=10, false_positive_rate=0.01)
+        expected_small = int(-10 * math.log(0.01) / (math.log(2) ** 2))
+        assert small.size == 128
+        assert expected_small <= small.size < 2 * expected_small
     
     def test_calculate_optimal_hash_count(self):
         """Test optimal hash count calculation."""
         bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
         
-        # Test the formula: k = (m/n) * ln(2)
-        expected_hash_count = max(1, int((bf.size / 1000) * math.log(2)))
-        assert bf.hash_count == expected_hash_count
+        # Start from k = (m/n) * ln(2) and only go lower if that helps the
+        # blocked layout
+        classic = max(1, int((bf.size / 1000) * math.log(2)))
+        k = bf.hash_count
+        assert 1 <= k <= classic
+        rate = bf._estimate_false_positive_rate(1000, bf.size, k)
+        assert rate <= bf._estimate_false_positive_rate(1000, bf.size, k + 1)
+        if k > 1:
+            assert rate < bf._estimate_false_positive_rate(1000, bf.size, k - 1)
+        
+        # At many bits per key, fewer hash functions beat the classic count
+        strict = BloomFilter(expected_elements=1000, false_positive_rate=1e-9)
+        assert strict.hash_count < int((strict.size / 1000) * math.log(2))
     
-    def test_generate_hash_seeds(self):
-        """Test hash seed generation."""
+    def test_double_hashing(self):
+        """Test that positions come from one digest by extended double hashing."""
         bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
         
-        assert len(bf.hash_seeds) == bf.hash_count
-        assert all(isinstance(seed, int) for seed in bf.hash_seeds)
+        digest = hashlib.blake2b(b"test_item", digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little')
+        block = h1 * (bf.size // 512) // 2 ** 64
+        x, y, z, w = h1, h2, h2 >> 21, h2 >> 42
+        expected = []
+        for i in range(bf.hash_count):
+            expected.append(block * 512 + x % 512)
+            x, y, z, w = x + y, y + z, z + w, w + i + 1
+        assert bf._hash_functions("test_item") == expected
+        
+        # Positions depend only on the item, not on the process
+        other = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        assert other._hash_functions("test_item") == expected
+    
+    def test_blocked_layout(self):
+        """Test that each item's bits stay inside one 512-bit block."""
+        bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        blocks_used = set()
         
-        # Test that seeds are different
-        assert len(set(bf.hash_seeds)) == len(bf.hash_seeds)
+        for i in range(200):
+            positions = bf._hash_functions(f"item_{i}")
+            blocks = {pos // 512 for pos in positions}
+            assert len(blocks) == 1
+            assert all(0 <= pos < bf.size for pos in positions)
+            blocks_used |= blocks
+        
+        # Items spread over all the blocks
+        assert blocks_used == set(range(bf.size // 512))
     
     def test_hash_functions(self):
         """Test hash function application."""
@@ -89,6 +138,31 @@ class TestBloomFilter:
         assert len(positions_list) == bf.hash_count
         assert all(0 <= pos < bf.size for pos in positions_list)
     
+    def test_bits_are_packed(self):
+        """Test that adding an item sets exactly its bits in the packed array."""
+        bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
+        
+        positions = set(bf._hash_functions("apple"))
+        bf.add("apple")
+        
+        for pos in range(bf.size):
+            is_set = bool(bf.bit_array[pos // 8] & (1 << (pos % 8)))
+            assert is_set == (pos in positions)
+        assert bf.get_utilization_stats()['set_bits'] == len(positions)
+    
+    def test_contains_tests_hash_positions(self):
+        """Test that contains checks exactly the positions _hash_functions yields."""
+        bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
+        positions = bf._hash_functions("pear")
+        
+        for pos in positions[:-1]:
+            bf.bit_array[pos >> 3] |= 1 << (pos & 7)
+        assert not bf.contains("pear")
+        
+        last = positions[-1]
+        bf.bit_array[last >> 3] |= 1 << (last & 7)
+        assert bf.contains("pear")
+    
     def test_add_and_contains(self):
         """Test adding items and checking membership."""
         bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
@@ -101,7 +175,87 @@ class TestBloomFilter:
             assert bf.contains(item)
         
         assert len(bf) == len(items)
-    
+
+    def test_hash_count_change_rebuilds_kernels(self):
+        """Test that add and contains follow a changed hash_count."""
+        for expected in (10, 1000):
+            bf = BloomFilter(expected_elements=expected, false_positive_rate=0.01)
+            bf.hash_count = 2
+            bf.add("apple")
+
+            set_bits = sum(bin(byte).count("1") for byte in bf.bit_array)
+            assert len(bf._hash_functions("apple")) == 2
+            assert set_bits <= 2
+            for pos in bf._hash_functions("apple"):
+                assert bf.bit_array[pos >> 3] >> (pos & 7) & 1
+            assert bf.contains("apple")
+
+    def test_add_many_and_contains_many(self):
+        """Test that the batch methods match add and contains item by item."""
+        single = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        batch = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        items = [f"item_{i}" for i in range(500)] + [42, (1, 2)]
+
+        for item in items:
+            single.add(item)
+        batch.add_many(iter(items))
+
+        assert batch.bit_array == single.bit_array
+        assert len(batch) == len(single) == len(items)
+
+        queries = items + [f"other_{i}" for i in range(500)]
+        assert batch.contains_many(queries) == [single.contains(q) for q in queries]
+        assert batch.contains_many([]) == []
+
+    def test_check_and_add(self):
+        """Test that check_and_add reports prior membership and adds new items."""
+        for expected in (10, 1000):
+            checked = BloomFilter(expected_elements=expected, false_positive_rate=0.01)
+            plain = BloomFilter(expected_elements=expected, false_positive_rate=0.01)
+
+            for item in ["apple", "banana", "apple", 42, "banana", 42]:
+                was_present = plain.contains(item)
+                if not was_present:
+                    plain.add(item)
+                assert checked.check_and_add(item) == was_present
+
+            assert checked.bit_array == plain.bit_array
+            assert len(checked) == len(plain) == 3
+
+    def test_check_and_add_hashes(self):
+        """Test that check_and_add_hashes matches check_and_add on hash_pair."""
+        bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        plain = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        h1, h2 = BloomFilter.hash_pair("apple")
+        assert h1 == int.from_bytes(hashlib.blake2b(b"apple", digest_size=16).digest()[:8], 'little')
+
+        assert bf.check_and_add_hashes(h1, h2) is False
+        assert bf.check_and_add_hashes(h1, h2) is True
+        assert plain.check_and_add("apple") is False
+        assert bf.bit_array == plain.bit_array
+        assert len(bf) == 1
+
+    def test_from_iterable(self):
+        """Test building a preloaded filter from an iterable."""
+        items = [f"item_{i}" for i in range(300)]
+        bf = BloomFilter.from_iterable(items, false_positive_rate=0.01)
+
+        assert bf.expected_elements == 300
+        assert len(bf) == 300
+        assert all(bf.contains_many(items))
+
+        # Generators are sized after materializing; an explicit capacity wins
+        gen_bf = BloomFilter.from_iterable(item for item in items)
+        assert gen_bf.expected_elements == 300
+        assert gen_bf.bit_array == bf.bit_array
+
+        sized = BloomFilter.from_iterable(iter(items), expected_elements=1000)
+        assert sized.expected_elements == 1000
+        assert len(sized) == 300
+
+        with pytest.raises(ValueError, match="Expected elements must be positive"):
+            BloomFilter.from_iterable([])
+
     def test_contains_nonexistent_items(self):
         """Test checking membership of items not in the filter."""
         bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
@@ -139,30 +293,48 @@ class TestBloomFilter:
     
     def test_get_false_positive_rate_with_items(self):
         """Test false positive rate calculation with items."""
-        bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
+        bf = BloomFilter(expected_elements=50, false_positive_rate=0.01)
         
         # Add items
-        for i in range(50):
+        for i in range(30):
             bf.add(f"item_{i}")
         
         fpr = bf.get_false_positive_rate()
         assert 0.0 <= fpr <= 1.0
         
-        # Formula: (1 - e^(-k*n/m))^k
+        # A single block holds every item: (1 - (1 - 1/m)^(k*n))^k, plus the
+        # chance that one of them drew the same probe sequence
         k = bf.hash_count
         n = bf.element_count
         m = bf.size
-        expected_fpr = (1 - math.exp(-k * n / m)) ** k
+        assert m <= 512
+        expected_fpr = (1 - (1 - 1 / m) ** (k * n)) ** k + n / m ** 4
         
         assert abs(fpr - expected_fpr) < 1e-10
     
+    def test_measured_false_positive_rate_meets_target(self):
+        """Test that a full blocked filter stays within its target rate."""
+        for target in (0.01, 0.001):
+            bf = BloomFilter(expected_elements=20000, false_positive_rate=target)
+            bf.add_many(range(20000))
+            
+            queries = range(10 ** 7, 10 ** 7 + 100000)
+            measured = sum(bf.contains_many(queries)) / len(queries)
+            estimate = bf.get_false_positive_rate()
+            
+            assert measured <= 1.1 * target
+            assert estimate <= target
+            # The blocked estimate tracks the measured rate instead of
+            # understating it like the classic formula does
+            assert abs(measured - estimate) < 0.25 * target
+    
     def test_get_memory_usage(self):
         """Test memory usage calculation."""
         bf = BloomFilter(expected_elements=1000, false_positive_rate=0.01)
         
         memory = bf.get_memory_usage()
         assert memory > 0
-        assert memory <= len(bf.bit_array) // 8 + 1
+        assert memory == len(bf.bit_array) == (bf.size + 7) // 8
     
     def test_get_load_factor(self):
         """Test load factor calculation."""
@@ -179,7 +351,7 @@ class TestBloomFilter:
         assert 0.0 < load_factor <= 1.0
         
         # Calculate manually
-        set_bits = sum(1 for bit in bf.bit_array if bit)
+        set_bits = sum(bin(byte).count("1") for byte in bf.bit_array)
         expected_load_factor = set_bits / bf.size
         assert abs(load_factor - expected_load_factor) < 1e-10
     
@@ -215,14 +387,53 @@ class TestBloomFilter:
         bf.add("apple")
         bf.add("banana")
         assert len(bf) == 2
+        bit_array = bf.bit_array
+        size_bytes = len(bit_array)
         
         # Clear
         bf.clear()
+        assert bf.bit_array is bit_array
+        assert bf.bit_array == bytearray(size_bytes)
         assert len(bf) == 0
         assert not bf.contains("apple")
         assert not bf.contains("banana")
         assert bf.get_load_factor() == 0.0
-    
+
+    def test_pickle_round_trip(self):
+        """Test that a filter survives pickling and copying with working kernels."""
+        bf = BloomFilter(expected_elements=2000, false_positive_rate=0.01)
+        bf.add_many(range(0, 2000, 2))
+
+        for restored in (pickle.loads(pickle.dumps(bf)), copy.deepcopy(bf)):
+            assert restored.bit_array == bf.bit_array
+            assert len(restored) == len(bf)
+            assert restored.hash_count == bf.hash_count
+            assert restored.contains_many(range(2000)) == bf.contains_many(range(2000))
+            restored.add("new item")
+            assert restored.contains("new item")
+            assert restored.bit_array != bf.bit_array
+
+    def test_set_bit_count_tracks_adds_and_clear(self):
+        """Test that the cached set-bit count follows adds and clears."""
+        bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
+
+        def popcount():
+            return sum(bin(byte).count("1") for byte in bf.bit_array)
+
+        bf.add_many(["apple", "banana"])
+        assert bf.get_utilization_stats()['set_bits'] == popcount()
+
+        bf.add("cherry")
+        assert bf.get_utilization_stats()['set_bits'] == popcount()
+
+        # Same element count as before the clear, different bits
+        bf.clear()
+        bf.add_many([f"item_{i}" for i in range(20)])
+        bf.clear()
+        bf.add_many(["x", "y", "z"])
+        assert bf.get_utilization_stats()['set_bits'] == popcount()
+        assert bf.get_load_factor() == popcount() / bf.size
+
     def test_len(self):
         """Test length operator."""
         bf = BloomFilter(expected_elements=100, false_positive_rate=0.01)
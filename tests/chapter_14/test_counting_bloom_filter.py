@@ -6,7 +6,10 @@ ensuring 100% code coverage and testing all edge cases.
 """
 
 import pytest
+import copy
 import math
+import pickle
+import hashlib
 from typing import List, Any
 from mastering_performant_code.chapter_14.counting_bloom_filter import CountingBloomFilter
 
@@ -48,7 +51,16 @@ class TestCountingBloomFilter:
         
         with pytest.raises(ValueError, match="Max count must be positive"):
             CountingBloomFilter(expected_elements=1000, false_positive_rate=0.01, max_count=-1)
-    
+
+    def test_hash_functions(self):
+        """Test that each position is the MD5 of "seed:item" modulo the size."""
+        cbf = CountingBloomFilter(expected_elements=100, false_positive_rate=0.01)
+
+        for item in ["apple", 42, "héllo"]:
+            expected = [int(hashlib.md5(f"{seed}:{item}".encode()).hexdigest(), 16) % cbf.size
+                        for seed in cbf.hash_seeds]
+            assert cbf._hash_functions(item) == expected
+
     def test_add_and_contains(self):
         """Test adding items and checking membership."""
         cbf = CountingBloomFilter(expected_elements=100, false_positive_rate=0.01)
@@ -282,7 +294,76 @@ class TestCountingBloomFilter:
         
         memory = cbf.get_memory_usage()
         assert memory == len(cbf.counter_array)  # Each counter is 1 byte
-    
+
+    def test_counter_width_follows_max_count(self):
+        """Test that counters use the narrowest type that holds max_count."""
+        for max_count, width in [(255, 1), (256, 2), (65535, 2), (65536, 4), (2 ** 32, 8)]:
+            cbf = CountingBloomFilter(expected_elements=100, max_count=max_count)
+            assert cbf.counter_array.itemsize == width
+            assert cbf.get_memory_usage() == cbf.size * width
+
+        cbf = CountingBloomFilter(expected_elements=10, false_positive_rate=0.5, max_count=300)
+        for _ in range(300):
+            assert cbf.add("item") is True
+        assert cbf.add("item") is False
+        assert cbf.get_overflow_risk() == 1.0
+
+        with pytest.raises(ValueError):
+            CountingBloomFilter(expected_elements=100, max_count=2 ** 64)
+
+    def test_pickle_round_trip(self):
+        """Test that a filter survives pickling and copying with working hashers."""
+        cbf = CountingBloomFilter(expected_elements=200, false_positive_rate=0.01)
+        for i in range(0, 200, 2):
+            cbf.add(i)
+
+        for restored in (pickle.loads(pickle.dumps(cbf)), copy.deepcopy(cbf)):
+            assert restored.counter_array == cbf.counter_array
+            assert restored.hash_seeds == cbf.hash_seeds
+            assert len(restored) == len(cbf)
+            assert [restored.contains(i) for i in range(200)] == [cbf.contains(i) for i in range(200)]
+            restored.add("new item")
+            assert restored.contains("new item")
+            assert restored.remove(0) is True
+            assert restored.counter_array != cbf.counter_array
+            assert cbf.contains(0)
+
+    def test_repeated_position_with_max_count_one(self):
+        """Test that an item picking one counter twice can still be added once."""
+        cbf = CountingBloomFilter(expected_elements=2, max_count=1)
+        item = next(i for i in range(10000)
+                    if len(set(cbf._hash_functions(i))) < cbf.hash_count)
+
+        assert cbf.add(item) is True
+        assert cbf.contains(item)
+        assert cbf.add(item) is False
+        assert cbf.remove(item) is True
+        assert not any(cbf.counter_array)
+
+    def test_repeated_position_does_not_overflow(self):
+        """Test that a counter picked twice by one item never overflows its type."""
+        cbf = CountingBloomFilter(expected_elements=2, max_count=255)
+        item = next(i for i in range(10000)
+                    if len(set(cbf._hash_functions(i))) < cbf.hash_count)
+        positions = cbf._hash_functions(item)
+
+        results = [cbf.add(item) for _ in range(300)]
+        assert False in results
+        assert max(cbf.counter_array) <= 255
+        # The doubled counter stops at the array limit, the others at max_count
+        assert max(cbf.counter_array[pos] for pos in set(positions)) >= 254
+        # A rejected add leaves every counter untouched
+        before = list(cbf.counter_array)
+        assert cbf.add(item) is False
+        assert list(cbf.counter_array) == before
+
+        added = results.count(True)
+        for pos in set(positions):
+            assert cbf.counter_array[pos] == added * positions.count(pos)
+        for _ in range(added):
+            assert cbf.remove(item) is True
+        assert not any(cbf.counter_array)
+
     def test_load_factor(self):
         """Test load factor calculation."""
         cbf = CountingBloomFilter(expected_elements=100, false_positive_rate=0.01)
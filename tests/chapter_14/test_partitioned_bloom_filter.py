@@ -0,0 +1,102 @@
+"""
+Unit tests for Partitioned Bloom Filter implementation.
+
+This module tests the PartitionedBloomFilter class, covering the
+one-partition-per-hash layout as well as the inherited Bloom filter behavior.
+"""
+
+import pytest
+from mastering_performant_code.chapter_14.partitioned_bloom_filter import PartitionedBloomFilter
+
+
+class TestPartitionedBloomFilter:
+    """Test cases for PartitionedBloomFilter class."""
+
+    def test_each_hash_owns_a_partition(self):
+        """Test that the i-th hash function lands in the i-th partition."""
+        pbf = PartitionedBloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        part = pbf.size // pbf.hash_count
+
+        for item in ["apple", 42, ("a", 1), "x" * 100]:
+            positions = pbf._hash_functions(item)
+            assert len(positions) == pbf.hash_count
+            for i, pos in enumerate(positions):
+                assert i * part <= pos < (i + 1) * part
+
+    def test_add_sets_one_bit_per_partition(self):
+        """Test that adding an item sets exactly hash_count bits."""
+        pbf = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+        pbf.add("item")
+
+        set_bits = sum(bin(byte).count("1") for byte in pbf.bit_array)
+        assert set_bits == pbf.hash_count
+        for pos in pbf._hash_functions("item"):
+            assert pbf.bit_array[pos >> 3] >> (pos & 7) & 1
+
+    def test_add_and_contains(self):
+        """Test adding items and checking membership."""
+        pbf = PartitionedBloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        items = [f"item_{i}" for i in range(500)]
+
+        for item in items:
+            pbf.add(item)
+
+        assert len(pbf) == 500
+        assert all(item in pbf for item in items)
+
+    def test_false_positive_rate(self):
+        """Test that the false positive rate stays near the target."""
+        pbf = PartitionedBloomFilter(expected_elements=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            pbf.add(f"member_{i}")
+
+        false_positives = sum(1 for i in range(5000) if f"other_{i}" in pbf)
+        assert false_positives / 5000 < 0.05
+
+    def test_single_element_filter(self):
+        """Test a filter sized for a single element."""
+        pbf = PartitionedBloomFilter(expected_elements=1, false_positive_rate=0.01)
+        pbf.add("only")
+
+        assert "only" in pbf
+        assert max(pbf._hash_functions("only")) < pbf.size
+
+    def test_clear(self):
+        """Test clearing the filter."""
+        pbf = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+        pbf.add("item")
+        pbf.clear()
+
+        assert len(pbf) == 0
+        assert "item" not in pbf
+
+    def test_repr(self):
+        """Test string representation."""
+        pbf = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+        assert repr(pbf).startswith("PartitionedBloomFilter(expected_elements=100")
+
+    def test_batch_methods(self):
+        """Test that the batch methods match add and contains."""
+        single = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+        batch = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+        items = [f"item_{i}" for i in range(50)]
+
+        for item in items:
+            single.add(item)
+        batch.add_many(items)
+
+        assert batch.bit_array == single.bit_array
+        queries = items + ["missing"]
+        assert batch.contains_many(queries) == [single.contains(q) for q in queries]
+
+    def test_check_and_add(self):
+        """Test that check_and_add reports prior membership."""
+        pbf = PartitionedBloomFilter(expected_elements=100, false_positive_rate=0.01)
+
+        assert pbf.check_and_add("apple") is False
+        assert pbf.check_and_add("apple") is True
+        assert "apple" in pbf
+        assert len(pbf) == 1
+        assert pbf.check_and_add_hashes(*pbf.hash_pair("pear")) is False
+        assert pbf.check_and_add("pear") is True
+        assert pbf._hash_functions("pear") == pbf._positions(*pbf.hash_pair("pear"))
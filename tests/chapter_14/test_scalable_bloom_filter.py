@@ -0,0 +1,157 @@
+"""
+Unit tests for Scalable Bloom Filter implementation.
+
+This module tests the ScalableBloomFilter class, covering growth across
+sub-filters as well as membership queries spanning all of them.
+"""
+
+import pytest
+import copy
+import pickle
+from mastering_performant_code.chapter_14.bloom_filter import BloomFilter
+from mastering_performant_code.chapter_14.scalable_bloom_filter import ScalableBloomFilter
+
+
+class TestScalableBloomFilter:
+    """Test cases for ScalableBloomFilter class."""
+
+    def test_initialization(self):
+        """Test that a new filter starts with one empty sub-filter."""
+        sbf = ScalableBloomFilter(initial_capacity=100, false_positive_rate=0.01)
+
+        assert len(sbf.filters) == 1
+        assert len(sbf) == 0
+        assert not sbf.contains("anything")
+
+        with pytest.raises(ValueError):
+            ScalableBloomFilter(initial_capacity=0)
+        with pytest.raises(ValueError):
+            ScalableBloomFilter(growth_factor=1.0)
+        with pytest.raises(ValueError):
+            ScalableBloomFilter(scale_factor=1.0)
+
+    def test_grows_and_finds_every_item(self):
+        """Test that items stay visible after new sub-filters are added."""
+        sbf = ScalableBloomFilter(initial_capacity=50, false_positive_rate=0.01)
+        items = [f"item_{i}" for i in range(1000)]
+        for item in items:
+            sbf.add(item)
+
+        assert len(sbf.filters) > 1
+        for item in items:
+            assert item in sbf
+
+    def test_contains_hashes_matches_contains(self):
+        """Test that probing with a precomputed hash pair agrees with contains."""
+        bf = BloomFilter(expected_elements=2000, false_positive_rate=0.01)
+        small = BloomFilter(expected_elements=10, false_positive_rate=0.01)
+        for i in range(0, 2000, 2):
+            bf.add(i)
+        for i in range(5):
+            small.add(i)
+
+        for i in range(2000):
+            pair = BloomFilter.hash_pair(i)
+            assert bf.contains_hashes(*pair) == bf.contains(i)
+            assert small.contains_hashes(*pair) == small.contains(i)
+
+    def test_clear(self):
+        """Test that clearing drops every sub-filter but a fresh one."""
+        sbf = ScalableBloomFilter(initial_capacity=10)
+        for i in range(100):
+            sbf.add(i)
+        sbf.clear()
+
+        assert len(sbf.filters) == 1
+        assert len(sbf) == 0
+        assert sbf.current_capacity == 10
+
+    def test_sub_filters_share_one_buffer(self):
+        """Test that sub-filter bits are views into the shared buffer."""
+        sbf = ScalableBloomFilter(initial_capacity=20, false_positive_rate=0.01)
+        for i in range(500):
+            sbf.add(i)
+
+        assert len(sbf.filters) > 1
+        assert sbf.get_memory_usage() == len(sbf._bits)
+        assert sbf.get_memory_usage() == sum(bf.size // 8 for bf in sbf.filters)
+        for bf, offset in zip(sbf.filters, sbf._offsets):
+            assert bytes(bf.bit_array) == bytes(sbf._bits[offset:offset + len(bf.bit_array)])
+            assert bf.bit_array.obj is sbf._bits
+
+    def test_contains_matches_sub_filters(self):
+        """Test that the combined probe agrees with asking each sub-filter."""
+        sbf = ScalableBloomFilter(initial_capacity=30, false_positive_rate=0.05)
+        for i in range(0, 1000, 3):
+            sbf.add(i)
+
+        assert len(sbf.filters) > 2
+        for i in range(2000):
+            assert sbf.contains(i) == any(bf.contains(i) for bf in sbf.filters)
+
+    def test_each_probe_stays_in_one_block(self):
+        """Test that an item's bits in each sub-filter share one 512-bit block."""
+        sbf = ScalableBloomFilter(initial_capacity=20, false_positive_rate=0.01)
+        for i in range(2000):
+            sbf.add(i)
+
+        assert any(bf.size <= 512 for bf in sbf.filters)
+        assert any(bf.size > 512 for bf in sbf.filters)
+        for bf in sbf.filters:
+            for item in ["apple", 42, ("a", 1), "x" * 100]:
+                positions = bf._hash_functions(item)
+                assert len(positions) == bf.hash_count
+                assert len({pos // 512 for pos in positions}) == 1
+
+    def test_contains_many(self):
+        """Test that batch lookups match single lookups, in order."""
+        sbf = ScalableBloomFilter(initial_capacity=50, false_positive_rate=0.01)
+        for i in range(300):
+            sbf.add(f"item_{i}")
+
+        queries = [f"item_{i}" for i in range(0, 600, 7)]
+        assert sbf.contains_many(queries) == [sbf.contains(q) for q in queries]
+        assert sbf.contains_many(iter(queries[:3])) == [True, True, True]
+        assert sbf.contains_many([]) == []
+
+    def test_totals_match_sub_filters(self):
+        """Test that the running totals agree with a walk over the sub-filters."""
+        sbf = ScalableBloomFilter(initial_capacity=20, false_positive_rate=0.01)
+        for i in range(700):
+            sbf.add(i)
+            if i % 97 == 0:
+                no_false_positive = 1.0
+                for bf in sbf.filters:
+                    no_false_positive *= (1 - bf.get_false_positive_rate())
+                assert sbf.get_false_positive_rate() == 1 - no_false_positive
+                assert sbf.get_total_elements() == sum(len(bf) for bf in sbf.filters)
+
+        assert len(sbf.filters) > 2
+        sbf.clear()
+        assert sbf.get_false_positive_rate() == 0.0
+        assert sbf.get_total_elements() == 0
+
+    def test_pickle_and_deepcopy(self):
+        """Test that copies get their own shared buffer and working probe."""
+        sbf = ScalableBloomFilter(initial_capacity=20, false_positive_rate=0.01)
+        for i in range(500):
+            sbf.add(i)
+
+        for restored in (pickle.loads(pickle.dumps(sbf)), copy.deepcopy(sbf)):
+            assert restored._bits == sbf._bits
+            assert restored._bits is not sbf._bits
+            assert len(restored) == len(sbf)
+            assert restored.get_false_positive_rate() == sbf.get_false_positive_rate()
+            assert restored.contains_many(range(1000)) == sbf.contains_many(range(1000))
+            for bf, offset in zip(restored.filters, restored._offsets):
+                assert bf.bit_array.obj is restored._bits
+
+            for i in range(500, 1500):
+                restored.add(i)
+            assert all(restored.contains_many(range(1500)))
+            assert len(restored.filters) > len(sbf.filters)
+            assert len(sbf) == 500
+
+        sub_filter = pickle.loads(pickle.dumps(sbf.filters[0]))
+        assert sub_filter.bit_array == sbf.filters[0].bit_array
+        assert isinstance(sub_filter.bit_array, bytearray)